@@ -30,11 +30,14 @@ from .setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    async_enable_setup_timeline,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    async_setup_timeline_trace,
 )
 from .util import dt as dt_util
 from .util.async_ import gather_with_concurrency
+from .util.json import save_json
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
 
@@ -44,6 +47,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_TRACE_FILENAME = "startup_trace.json"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -110,6 +114,9 @@ async def async_setup_hass(
 
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
+    if runtime_config.startup_trace:
+        async_enable_setup_timeline(hass)
+
     config_dict = None
     basic_setup_success = False
 
@@ -169,6 +176,13 @@ async def async_setup_hass(
             hass,
         )
 
+    if runtime_config.startup_trace:
+        trace_path = hass.config.path(STARTUP_TRACE_FILENAME)
+        await hass.async_add_executor_job(
+            save_json, trace_path, async_setup_timeline_trace(hass)
+        )
+        _LOGGER.info("Startup trace written to %s", trace_path)
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
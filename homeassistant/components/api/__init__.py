@@ -4,7 +4,7 @@ from http import HTTPStatus
 import json
 import logging
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.web_exceptions import HTTPBadRequest
 import async_timeout
 import voluptuous as vol
@@ -173,15 +173,59 @@ class APIStatesView(HomeAssistantView):
 
     @ha.callback
     def get(self, request):
-        """Get current states."""
+        """Get current states.
+
+        With since, only the states changed and the entities removed since
+        that version are returned. If the changes since that version are not
+        known, all states are returned with full set.
+        """
+        hass = request.app["hass"]
         user = request["hass_user"]
         entity_perm = user.permissions.check_entity
-        states = [
-            state
-            for state in request.app["hass"].states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
-        return self.json(states)
+
+        since = None
+        if "since" in request.query:
+            try:
+                since = int(request.query["since"])
+            except ValueError:
+                return self.json_message("Invalid since", HTTPStatus.BAD_REQUEST)
+
+        version = hass.states.version
+        etag = f'"{version}"'
+        headers = {hdrs.ETAG: etag}
+        if (if_none_match := request.headers.get(hdrs.IF_NONE_MATCH)) is not None:
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        if since is None:
+            states = [
+                state
+                for state in hass.states.async_all()
+                if entity_perm(state.entity_id, POLICY_READ)
+            ]
+            return self.json(states, headers=headers)
+
+        if (changes := hass.states.async_changed_since(since)) is None:
+            changed, removed, full = hass.states.async_all(), [], True
+        else:
+            (changed, removed), full = changes, False
+        return self.json(
+            {
+                "version": version,
+                "full": full,
+                "changed": [
+                    state
+                    for state in changed
+                    if entity_perm(state.entity_id, POLICY_READ)
+                ],
+                "removed": [
+                    entity_id
+                    for entity_id in removed
+                    if entity_perm(entity_id, POLICY_READ)
+                ],
+            },
+            headers=headers,
+        )
 
 
 class APIEntityStateView(HomeAssistantView):
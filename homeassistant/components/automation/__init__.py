@@ -1,6 +1,7 @@
 """Allow to set up simple automation rules via the config file."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
 import logging
 from typing import Any, TypedDict, cast
@@ -257,8 +258,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        if (conf := await component.async_prepare_reload()) is None:
+        """Reload the automations which changed in the config."""
+        if (conf := await component.async_prepare_reload(skip_reset=True)) is None:
             return
         async_get_blueprints(hass).async_reset_cache()
         await _async_process_config(hass, conf, component)
@@ -315,6 +316,15 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._trace_config = trace_config
         self._attr_unique_id = automation_id
 
+    @callback
+    def async_config_unchanged(self, name, raw_config, blueprint_inputs) -> bool:
+        """Return if the automation was created from the same config."""
+        return (
+            self._attr_name == name
+            and self._raw_config == raw_config
+            and self._blueprint_inputs == blueprint_inputs
+        )
+
     @property
     def extra_state_attributes(self):
         """Return the entity state attributes."""
@@ -614,10 +624,16 @@ async def _async_process_config(
 ) -> bool:
     """Process config and add automations.
 
+    Automations which are already set up with the same config are kept,
+    other automations which are set up are removed.
+
     Returns if blueprints were used.
     """
     entities = []
     blueprints_used = False
+    existing: dict[str, list[AutomationEntity]] = {}
+    for entity in component.entities:
+        existing.setdefault(entity.name, []).append(entity)
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: list[dict[str, Any] | blueprint.BlueprintInputs] = config[config_key]
@@ -650,6 +666,20 @@ async def _async_process_config(
             automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
 
+            unchanged = next(
+                (
+                    entity
+                    for entity in existing.get(name, [])
+                    if entity.async_config_unchanged(
+                        name, raw_config, raw_blueprint_inputs
+                    )
+                ),
+                None,
+            )
+            if unchanged is not None:
+                existing[name].remove(unchanged)
+                continue
+
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
             action_script = Script(
@@ -703,6 +733,11 @@ async def _async_process_config(
 
             entities.append(entity)
 
+    # Removed and changed automations are removed before the new ones are added
+    # to not conflict with their unique IDs
+    if removed := [entity for stale in existing.values() for entity in stale]:
+        await asyncio.gather(*(entity.async_remove() for entity in removed))
+
     if entities:
         await component.async_add_entities(entities)
 
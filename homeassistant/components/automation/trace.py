@@ -4,8 +4,11 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
-from homeassistant.components.trace.const import CONF_STORED_TRACES
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_finish_trace,
+    async_start_trace,
+)
 from homeassistant.core import Context
 
 from .const import DOMAIN
@@ -50,7 +53,7 @@ def trace_automation(
 ):
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    async_start_trace(hass, trace, trace_config)
 
     try:
         yield trace
@@ -60,4 +63,4 @@ def trace_automation(
         raise ex
     finally:
         if automation_id:
-            trace.finished()
+            async_finish_trace(hass, trace, trace_config)
@@ -202,6 +202,12 @@ class CloudGoogleConfig(AbstractConfig):
         ) and self._config["filter"].empty_filter:
             self.async_schedule_google_sync_all()
 
+        if (
+            self._cur_entity_prefs is not prefs.google_entity_configs
+            or self._cur_default_expose is not prefs.google_default_expose
+        ):
+            self.async_exposure_changed()
+
         if self.enabled and not self.is_local_sdk_active:
             self.async_enable_local_sdk()
         elif not self.enabled and self.is_local_sdk_active:
@@ -179,6 +179,8 @@ CHALLENGE_PIN_NEEDED = "pinNeeded"
 STORE_AGENT_USER_IDS = "agent_user_ids"
 STORE_GOOGLE_LOCAL_WEBHOOK_ID = "local_webhook_id"
 
+SIGNAL_EXPOSURE_CHANGED = "google_assistant_exposure_changed"
+
 SOURCE_CLOUD = "cloud"
 SOURCE_LOCAL = "local"
 
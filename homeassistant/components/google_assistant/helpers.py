@@ -22,6 +22,7 @@ from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.helpers import start
 from homeassistant.helpers.area_registry import AreaEntry
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_registry import RegistryEntry
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
@@ -36,6 +37,7 @@ from .const import (
     DOMAIN_TO_GOOGLE_TYPES,
     ERR_FUNCTION_NOT_SUPPORTED,
     NOT_EXPOSE_LOCAL,
+    SIGNAL_EXPOSURE_CHANGED,
     SOURCE_LOCAL,
     STORE_AGENT_USER_IDS,
     STORE_GOOGLE_LOCAL_WEBHOOK_ID,
@@ -201,6 +203,11 @@ class AbstractConfig(ABC):
         if self._unsub_report_state is None:
             self._unsub_report_state = async_enable_report_state(self.hass, self)
 
+    @callback
+    def async_exposure_changed(self):
+        """Signal that the configuration of exposed entities changed."""
+        async_dispatcher_send(self.hass, SIGNAL_EXPOSURE_CHANGED, self)
+
     @callback
     def async_disable_report_state(self):
         """Disable report state."""
@@ -644,9 +651,9 @@ class GoogleEntity:
             )
 
     @callback
-    def async_update(self):
+    def async_update(self, state: State | None = None):
         """Update the entity with latest info from Home Assistant."""
-        self.state = self.hass.states.get(self.entity_id)
+        self.state = state or self.hass.states.get(self.entity_id)
 
         if self._traits is None:
             return
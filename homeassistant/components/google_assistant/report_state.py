@@ -3,13 +3,23 @@ from __future__ import annotations
 
 from collections import deque
 import logging
-
-from homeassistant.const import MATCH_ALL
-from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.significant_change import create_checker
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_EXPOSURE_CHANGED
 from .error import SmartHomeError
 from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 
@@ -23,12 +33,113 @@ REPORT_STATE_WINDOW = 1
 _LOGGER = logging.getLogger(__name__)
 
 
+class _EntityCache:
+    """Cache exposure decisions and serializations of entities."""
+
+    def __init__(self, hass: HomeAssistant, google_config: AbstractConfig) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._google_config = google_config
+        # Exposure decision by entity_id
+        self._exposed: dict[str, bool] = {}
+        # Last seen Google entity and its serialization by entity_id
+        self._serialized: dict[str, tuple[GoogleEntity, dict[str, Any] | None]] = {}
+
+    @callback
+    def async_listen_invalidations(self) -> CALLBACK_TYPE:
+        """Listen for registry and configuration changes invalidating the cache."""
+
+        @callback
+        def async_registry_updated(event: Event) -> None:
+            """Forget cached decisions for an updated registry entry."""
+            self.async_forget(event.data["entity_id"])
+            if old_entity_id := event.data.get("old_entity_id"):
+                self.async_forget(old_entity_id)
+
+        @callback
+        def async_exposure_changed(config: AbstractConfig) -> None:
+            """Forget all exposure decisions when the configuration changed."""
+            if config is self._google_config:
+                self._exposed.clear()
+
+        unsub_registry = self._hass.bus.async_listen(
+            EVENT_ENTITY_REGISTRY_UPDATED, async_registry_updated
+        )
+        unsub_exposure = async_dispatcher_connect(
+            self._hass, SIGNAL_EXPOSURE_CHANGED, async_exposure_changed
+        )
+
+        @callback
+        def unsub_all() -> None:
+            unsub_registry()
+            unsub_exposure()
+
+        return unsub_all
+
+    @callback
+    def async_state_filter(self, event: Event) -> bool:
+        """Only pass state changes of exposed or removed cached entities."""
+        if (new_state := event.data["new_state"]) is None:
+            entity_id = event.data["entity_id"]
+            return entity_id in self._exposed or entity_id in self._serialized
+        return self.async_should_expose(new_state)
+
+    @callback
+    def async_should_expose(self, state: State) -> bool:
+        """Return if a state should be exposed, caching the decision."""
+        if (should_expose := self._exposed.get(state.entity_id)) is None:
+            should_expose = self._exposed[
+                state.entity_id
+            ] = self._google_config.should_expose(state)
+        return should_expose
+
+    @callback
+    def async_serialize(self, state: State) -> dict[str, Any] | None:
+        """Serialize a state, or return None if it is not supported.
+
+        The traits are reused while the attributes are unchanged and the
+        serialization while the state is unchanged as well.
+        """
+        cached = self._serialized.get(state.entity_id)
+        if cached is None or cached[0].state.attributes != state.attributes:
+            entity = GoogleEntity(self._hass, self._google_config, state)
+            entity_data = None
+        else:
+            entity, entity_data = cached
+            if entity.state.state != state.state:
+                entity_data = None
+            entity.async_update(state)
+
+        self.async_set(entity, entity_data)
+
+        if not entity.is_supported():
+            return None
+
+        if entity_data is None:
+            entity_data = entity.query_serialize()
+            self.async_set(entity, entity_data)
+
+        return entity_data
+
+    @callback
+    def async_set(self, entity: GoogleEntity, entity_data: dict[str, Any] | None):
+        """Store the serialization of an entity."""
+        self._serialized[entity.entity_id] = (entity, entity_data)
+
+    @callback
+    def async_forget(self, entity_id: str) -> None:
+        """Forget everything cached for an entity."""
+        self._exposed.pop(entity_id, None)
+        self._serialized.pop(entity_id, None)
+
+
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
     checker = None
     unsub_pending: CALLBACK_TYPE | None = None
     pending = deque([{}])
+    cache = _EntityCache(hass, google_config)
 
     async def report_states(now=None):
         """Report the states."""
@@ -53,29 +164,28 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
     report_states_job = HassJob(report_states)
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
+    @callback
+    def async_entity_state_listener(event: Event) -> None:
         nonlocal unsub_pending
 
-        if not hass.is_running:
-            return
+        changed_entity = event.data["entity_id"]
 
-        if not new_state:
+        if not (new_state := event.data["new_state"]):
+            cache.async_forget(changed_entity)
             return
 
-        if not google_config.should_expose(new_state):
-            return
-
-        entity = GoogleEntity(hass, google_config, new_state)
-
-        if not entity.is_supported():
+        if not hass.is_running:
             return
 
         try:
-            entity_data = entity.query_serialize()
+            entity_data = cache.async_serialize(new_state)
         except SmartHomeError as err:
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
+        if entity_data is None:
+            return
+
         if not checker.async_is_significant_change(new_state, extra_arg=entity_data):
             return
 
@@ -114,7 +224,7 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         checker = await create_checker(hass, DOMAIN, extra_significant_check)
 
         for entity in async_get_entities(hass, google_config):
-            if not entity.should_expose():
+            if not cache.async_should_expose(entity.state):
                 continue
 
             try:
@@ -122,6 +232,8 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             except SmartHomeError:
                 continue
 
+            cache.async_set(entity, entity_data)
+
             # Tell our significant change checker that we're reporting
             # So it knows with subsequent changes what was already reported.
             if not checker.async_is_significant_change(
@@ -136,15 +248,19 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
         await google_config.async_report_state_all({"devices": {"states": entities}})
 
-        unsub = hass.helpers.event.async_track_state_change(
-            MATCH_ALL, async_entity_state_listener
+        unsub = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            async_entity_state_listener,
+            event_filter=cache.async_state_filter,
         )
 
     unsub = async_call_later(hass, INITIAL_REPORT_DELAY, initial_report)
+    unsub_cache = cache.async_listen_invalidations()
 
     @callback
     def unsub_all():
         unsub()
+        unsub_cache()
         if unsub_pending:
             unsub_pending()  # pylint: disable=not-callable
 
@@ -452,6 +452,8 @@ class Group(Entity):
         self._on_off = None
         self._assumed = None
         self._on_states = None
+        self._on_count = 0
+        self._assumed_count = 0
         self.user_defined = user_defined
         self.mode = any
         if mode:
@@ -675,6 +677,9 @@ class Group(Entity):
         self._on_off = {}
         self._assumed = {}
         self._on_states = set()
+        # Number of members which are on and have an assumed state
+        self._on_count = 0
+        self._assumed_count = 0
 
         for entity_id in self.trackable:
             if (state := self.hass.states.get(entity_id)) is not None:
@@ -686,7 +691,9 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        assumed = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        self._assumed_count += bool(assumed) - bool(self._assumed.get(entity_id))
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -694,12 +701,24 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in self.hass.data[REG_KEY].on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            is_on = state in entity_on_state
+        self._on_count += is_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = is_on
+
+    def _mode_of_count(self, count, total):
+        """Return the mode of total members of which count are truthy.
+
+        The counts are kept up to date as members change, so the members
+        don't need to be iterated.
+        """
+        if self.mode is all:
+            return count == total
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state=None):
@@ -722,7 +741,9 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_of_count(
+                self._assumed_count, len(self._assumed)
+            )
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -742,7 +763,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_of_count(self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         else:
@@ -1,6 +1,7 @@
 """This platform allows several binary sensor to be grouped into one binary sensor."""
 from __future__ import annotations
 
+from collections import Counter
 from typing import Any
 
 import voluptuous as vol
@@ -20,7 +21,7 @@ from homeassistant.const import (
     STATE_ON,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -83,6 +84,9 @@ class BinarySensorGroup(GroupEntity, BinarySensorEntity):
         self._attr_unique_id = unique_id
         self._device_class = device_class
         self._state: str | None = None
+        # Member states and how many members have each state
+        self._states: dict[str, str] = {}
+        self._state_counts: Counter[str] = Counter()
         self.mode = any
         if mode:
             self.mode = all
@@ -94,8 +98,12 @@ class BinarySensorGroup(GroupEntity, BinarySensorEntity):
         def async_state_changed_listener(event: Event) -> None:
             """Handle child updates."""
             self.async_set_context(event.context)
+            self._async_see_state(event.data["entity_id"], event.data["new_state"])
             self.async_defer_or_update_ha_state()
 
+        for entity_id in self._entity_ids:
+            self._async_see_state(entity_id, self.hass.states.get(entity_id))
+
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass, self._entity_ids, async_state_changed_listener
@@ -104,20 +112,27 @@ class BinarySensorGroup(GroupEntity, BinarySensorEntity):
 
         await super().async_added_to_hass()
 
+    @callback
+    def _async_see_state(self, entity_id: str, state: State | None) -> None:
+        """Keep the count of the member states up to date."""
+        if (old_state := self._states.pop(entity_id, None)) is not None:
+            self._state_counts[old_state] -= 1
+        if state is not None:
+            self._states[entity_id] = state.state
+            self._state_counts[state.state] += 1
+
     @callback
     def async_update_group_state(self) -> None:
-        """Query all members and determine the binary sensor group state."""
-        all_states = [self.hass.states.get(x) for x in self._entity_ids]
-        filtered_states: list[str] = [x.state for x in all_states if x is not None]
-        self._attr_available = any(
-            state != STATE_UNAVAILABLE for state in filtered_states
-        )
-        if STATE_UNAVAILABLE in filtered_states:
+        """Determine the binary sensor group state from the member state counts."""
+        total = len(self._states)
+        unavailable = self._state_counts[STATE_UNAVAILABLE]
+        self._attr_available = total > unavailable
+        if unavailable:
             self._attr_is_on = None
+        elif self.mode is all:
+            self._attr_is_on = self._state_counts[STATE_ON] == total
         else:
-            states = list(map(lambda x: x == STATE_ON, filtered_states))
-            state = self.mode(states)
-            self._attr_is_on = state
+            self._attr_is_on = self._state_counts[STATE_ON] > 0
 
     @property
     def device_class(self) -> str | None:
@@ -1,9 +1,11 @@
 """Component to make instant statistics about your history."""
 from __future__ import annotations
 
+from bisect import bisect_right
 import datetime
 import logging
 import math
+from typing import cast
 
 import voluptuous as vol
 
@@ -18,7 +20,7 @@ from homeassistant.const import (
     PERCENTAGE,
     TIME_HOURS,
 )
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CoreState, Event, HomeAssistant, State, callback
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -125,6 +127,9 @@ class HistoryStatsSensor(SensorEntity):
         self._unit_of_measurement = UNITS[sensor_type]
 
         self._period = (datetime.datetime.now(), datetime.datetime.now())
+        self._window: HistoryStatsWindow | None = None
+        # State changes seen while the history is loaded
+        self._pending: list[tuple[float, bool]] | None = None
         self.value = None
         self.count = None
 
@@ -140,10 +145,16 @@ class HistoryStatsSensor(SensorEntity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event: Event) -> None:
+                """Record the state change and refresh."""
+                self._async_record_state(event.data["new_state"])
+                force_refresh()
+
             force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
 
@@ -225,43 +236,19 @@ class HistoryStatsSensor(SensorEntity):
             # Don't compute anything as the value cannot have changed
             return
 
-        await self.hass.async_add_executor_job(
-            self._update, start, end, now_timestamp, start_timestamp, end_timestamp
-        )
-
-    def _update(self, start, end, now_timestamp, start_timestamp, end_timestamp):
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
+        if self._window is None or start_timestamp < self._window.start:
+            await self._async_load_history(start, start_timestamp)
 
-        if self._entity_id not in history_list:
+        window = cast(HistoryStatsWindow, self._window)
+        window.prune(start_timestamp)
+        if (
+            measured := window.measure(
+                start_timestamp, min(end_timestamp, now_timestamp)
+            )
+        ) is None:
             return
 
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
-        last_time = start_timestamp
-        elapsed = 0
-        count = 0
-
-        # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
-
-            if last_state:
-                elapsed += current_time - last_time
-            if current_state and not last_state:
-                count += 1
-
-            last_state = current_state
-            last_time = current_time
-
-        # Count time elapsed between last history state and end of measure
-        if last_state:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_time
+        elapsed, count = measured
 
         # Save value in hours
         self.value = elapsed / 3600
@@ -269,6 +256,67 @@ class HistoryStatsSensor(SensorEntity):
         # Save counter
         self.count = count
 
+    @callback
+    def _async_record_state(self, state: State | None) -> None:
+        """Add a state change to the loaded history."""
+        if state is None:
+            return
+
+        timestamp = state.last_changed.timestamp()
+        matches = state.state in self._entity_states
+        if self._pending is not None:
+            self._pending.append((timestamp, matches))
+        elif self._window is not None:
+            if timestamp < self._window.last_changed:
+                # Reload the history on the next update
+                self._window = None
+            else:
+                self._window.add(timestamp, matches)
+
+    async def _async_load_history(
+        self, start: datetime.datetime, start_timestamp: int
+    ) -> None:
+        """Load the history from the start of the period until now."""
+        pending: list[tuple[float, bool]] = []
+        self._pending = pending
+        try:
+            window = await self.hass.async_add_executor_job(
+                self._load_history, start, start_timestamp
+            )
+        finally:
+            self._pending = None
+
+        for timestamp, matches in pending:
+            window.add(timestamp, matches)
+
+        # The recorder commits with a delay, the latest change may be missing
+        if (state := self.hass.states.get(self._entity_id)) is not None:
+            window.add(
+                state.last_changed.timestamp(), state.state in self._entity_states
+            )
+
+        self._window = window
+
+    def _load_history(
+        self, start: datetime.datetime, start_timestamp: int
+    ) -> HistoryStatsWindow:
+        """Load the history in one database query."""
+        history_list = history.state_changes_during_period(
+            self.hass, start, None, str(self._entity_id)
+        )
+
+        # Get the first state
+        first_state = history.get_state(self.hass, start, self._entity_id)
+        window = HistoryStatsWindow(
+            start_timestamp,
+            None if first_state is None else first_state.state in self._entity_states,
+        )
+
+        for item in history_list.get(self._entity_id, ()):
+            window.add(item.last_changed.timestamp(), item.state in self._entity_states)
+
+        return window
+
     def update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
         start = None
@@ -330,6 +378,75 @@ class HistoryStatsSensor(SensorEntity):
         self._period = start, end
 
 
+class HistoryStatsWindow:
+    """State changes of an entity with running totals.
+
+    The total time in the measured states and the number of times the entity
+    changed into them are kept for every state change, so measuring any
+    period is a lookup of its start and end.
+    """
+
+    def __init__(self, start: float, matches: bool | None) -> None:
+        """Initialize with the state at the start of the history.
+
+        matches is None if the entity had no state at the start.
+        """
+        self._times = [start]
+        self._matches = [bool(matches)]
+        self._elapsed = [0.0]
+        self._counts = [0]
+        self.last_changed = start
+        # If the entity had any state since the start of the history
+        self.known = matches is not None
+
+    @property
+    def start(self) -> float:
+        """Return the time the history starts."""
+        return self._times[0]
+
+    def add(self, timestamp: float, matches: bool) -> None:
+        """Add a state change, ignoring changes which are not newer."""
+        if timestamp <= self.last_changed:
+            return
+        self.last_changed = timestamp
+        self.known = True
+
+        last_matches = self._matches[-1]
+        elapsed = self._elapsed[-1]
+        if last_matches:
+            elapsed += timestamp - self._times[-1]
+        self._times.append(timestamp)
+        self._matches.append(matches)
+        self._elapsed.append(elapsed)
+        self._counts.append(self._counts[-1] + (matches and not last_matches))
+
+    def prune(self, start: float) -> None:
+        """Forget the state changes which slid out of a period starting at start."""
+        if (idx := bisect_right(self._times, start) - 1) > 0:
+            del self._times[:idx]
+            del self._matches[:idx]
+            del self._elapsed[:idx]
+            del self._counts[:idx]
+
+    def _total(self, idx: int, timestamp: float) -> float:
+        """Return the time in the measured states until timestamp."""
+        if self._matches[idx]:
+            return self._elapsed[idx] + timestamp - self._times[idx]
+        return self._elapsed[idx]
+
+    def measure(self, start: float, end: float) -> tuple[float, int] | None:
+        """Return the elapsed seconds and count, None if the state is not known."""
+        start_idx = bisect_right(self._times, start) - 1
+        if start_idx < 0 or not self.known:
+            return None
+        end_idx = bisect_right(self._times, end) - 1
+
+        return (
+            self._total(end_idx, end) - self._total(start_idx, start),
+            self._counts[end_idx] - self._counts[start_idx],
+        )
+
+
 class HistoryStatsHelper:
     """Static methods to make the HistoryStatsSensor code lighter."""
 
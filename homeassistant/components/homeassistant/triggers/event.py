@@ -10,7 +10,14 @@ from homeassistant.components.automation import (
     AutomationTriggerInfo,
 )
 from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM
-from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventDataFilter,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.typing import ConfigType
 
@@ -53,6 +60,7 @@ async def async_attach_trigger(
     removes = []
 
     event_data_schema = None
+    event_data_filter = None
     if CONF_EVENT_DATA in config:
         # Render the schema input
         template.attach(hass, config[CONF_EVENT_DATA])
@@ -65,6 +73,12 @@ async def async_attach_trigger(
             {vol.Required(key): value for key, value in event_data.items()},
             extra=vol.ALLOW_EXTRA,
         )
+        # Let the event bus match on one of the keys, the schema still
+        # verifies all of them
+        for key, value in event_data.items():
+            if isinstance(value, (str, int, float)):
+                event_data_filter = EventDataFilter(key, (value,))
+                break
 
     event_context_schema = None
     if CONF_EVENT_CONTEXT in config:
@@ -113,7 +127,8 @@ async def async_attach_trigger(
         )
 
     removes = [
-        hass.bus.async_listen(event_type, handle_event) for event_type in event_types
+        hass.bus.async_listen(event_type, handle_event, event_filter=event_data_filter)
+        for event_type in event_types
     ]
 
     @callback
@@ -313,6 +313,7 @@ class HomeAssistantHTTP:
                 resource: CachingStaticResource | web.StaticResource = (
                     CachingStaticResource(url_path, path)
                 )
+                self.hass.async_create_task(resource.async_build_index())
             else:
                 resource = web.StaticResource(url_path, path)
             self.app.router.register_resource(resource)
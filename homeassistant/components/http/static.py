@@ -1,51 +1,338 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+from collections.abc import Callable, Mapping
+from functools import partial
+import logging
+import mimetypes
+import os
 from pathlib import Path
-from typing import Final
+import stat
+from typing import IO, Any, Final, NamedTuple
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
-from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
+from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound, HTTPNotModified
+from aiohttp.web_request import BaseRequest
 from aiohttp.web_urldispatcher import StaticResource
 
+_LOGGER = logging.getLogger(__name__)
+
 CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADERS: Final[Mapping[str, str]] = {
     hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"
 }
 
+# Precompressed variants of a file in order of preference
+PRECOMPRESSED_SUFFIXES: Final = (("br", ".br"), ("gzip", ".gz"))
+MAX_INDEXED_FILES: Final = 10000
+
+
+class StaticFile(NamedTuple):
+    """A file which can be served."""
+
+    path: Path
+    size: int
+    mtime: float
+    etag: str
+
+
+class IndexEntry(NamedTuple):
+    """A file and its precompressed variants, keyed by encoding."""
+
+    content_type: str
+    encoding: str | None
+    files: dict[str | None, StaticFile]
+
+
+def _static_file(path: Path, stat_result: os.stat_result) -> StaticFile:
+    """Return a static file from the result of stat."""
+    return StaticFile(
+        path,
+        stat_result.st_size,
+        stat_result.st_mtime,
+        f"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}",
+    )
+
+
+def _index_entry(filepath: Path) -> IndexEntry | None:
+    """Return the index entry of a file, None if it is not a regular file."""
+    try:
+        stat_result = filepath.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+
+    content_type, encoding = mimetypes.guess_type(str(filepath))
+    files: dict[str | None, StaticFile] = {None: _static_file(filepath, stat_result)}
+    # Files which are compressed themselves are served as they are
+    if encoding is None:
+        for variant_encoding, suffix in PRECOMPRESSED_SUFFIXES:
+            variant = filepath.with_name(filepath.name + suffix)
+            try:
+                variant_stat = variant.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(variant_stat.st_mode):
+                files[variant_encoding] = _static_file(variant, variant_stat)
+
+    return IndexEntry(content_type or "application/octet-stream", encoding, files)
+
+
+def _open_file(path: Path) -> tuple[IO[Any], StaticFile]:
+    """Open a file and return it with its current size and modification time."""
+    fobj = path.open("rb")
+    try:
+        return fobj, _static_file(path, os.fstat(fobj.fileno()))
+    except OSError:
+        fobj.close()
+        raise
+
+
+def _accepted_encodings(request: Request) -> set[str]:
+    """Return the content encodings a request accepts."""
+    accepted = set()
+    for coding in request.headers.get(hdrs.ACCEPT_ENCODING, "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+class IndexedFileResponse(FileResponse):
+    """Response sending a file from the static index.
+
+    The file is opened when the response is prepared, so it is not left open
+    when the response is never sent.
+    """
+
+    def __init__(
+        self,
+        static_file: StaticFile,
+        chunk_size: int,
+        headers: Mapping[str, str],
+        file_changed: Callable[[StaticFile | None], None],
+    ) -> None:
+        """Initialize the response."""
+        super().__init__(static_file.path, chunk_size, headers=headers)
+        self._static_file = static_file
+        self._file_changed = file_changed
+
+    async def prepare(self, request: BaseRequest) -> AbstractStreamWriter | None:
+        """Send the headers and the file."""
+        loop = asyncio.get_running_loop()
+        try:
+            fobj, static_file = await loop.run_in_executor(
+                None, _open_file, self._static_file.path
+            )
+        except OSError:
+            # The file was removed or replaced since it was indexed
+            self._file_changed(None)
+            for header in (hdrs.CACHE_CONTROL, hdrs.CONTENT_ENCODING, hdrs.VARY):
+                self.headers.pop(header, None)
+            self.set_status(HTTPNotFound.status_code)
+            self.content_type = "text/plain"
+            self.content_length = 0
+            return await super(FileResponse, self).prepare(request)
+        if static_file != self._static_file:
+            self._file_changed(static_file)
+
+        self.etag = static_file.etag  # type: ignore[assignment]
+        self.last_modified = static_file.mtime  # type: ignore[assignment]
+        self.content_length = static_file.size
+        self.headers[hdrs.ACCEPT_RANGES] = "bytes"
+
+        try:
+            # sendfile fails for empty files
+            if request.method == hdrs.METH_HEAD or not static_file.size:
+                return await super(FileResponse, self).prepare(request)
+            return await self._sendfile(request, fobj, 0, static_file.size)
+        finally:
+            await loop.run_in_executor(None, fobj.close)
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    The files which can be served are kept in an index, so a request for a
+    known file does no blocking filesystem calls on the event loop.
+    Conditional requests check the file again in the executor before they
+    are answered with 304 Not Modified. Files missing from the index are
+    looked up in the executor and added, up to MAX_INDEXED_FILES files, when
+    they are requested by their path relative to the directory.
+    Precompressed .br and .gz variants next to a file are served to clients
+    which accept them.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the resource."""
+        super().__init__(*args, **kwargs)
+        self._index: dict[str, IndexEntry] = {}
+
+    def _resolve(self, rel_url: str) -> Path:
+        """Resolve a path relative to the directory, raising if not allowed."""
+        filename = Path(rel_url)
+        if filename.anchor:
+            # rel_url is an absolute name like
+            # /static/\\machine_name\c$ or /static/D:\path
+            # where the static dir is totally different
+            raise HTTPForbidden()
+        filepath = self._directory.joinpath(filename).resolve()
+        if not self._follow_symlinks:
+            filepath.relative_to(self._directory)
+        return filepath
+
+    def _lookup(self, rel_url: str) -> tuple[str | None, IndexEntry] | None:
+        """Return the index key and entry for a path, None if it is a directory.
+
+        The key is the path of the file relative to the directory, None if the
+        file is outside of it.
+        """
+        filepath = self._resolve(rel_url)
+        if filepath.is_dir():
+            return None
+        if (entry := _index_entry(filepath)) is None:
+            raise HTTPNotFound()
+        try:
+            key = filepath.relative_to(self._directory).as_posix()
+        except ValueError:
+            key = None
+        return key, entry
+
+    def _scan(self) -> dict[str, IndexEntry]:
+        """Return the index entries of the files in the directory."""
+        index: dict[str, IndexEntry] = {}
+        for dirpath, _, filenames in os.walk(
+            self._directory, followlinks=self._follow_symlinks
+        ):
+            for name in filenames:
+                if len(index) >= MAX_INDEXED_FILES:
+                    return index
+                rel_url = Path(dirpath, name).relative_to(self._directory).as_posix()
+                try:
+                    filepath = self._resolve(rel_url)
+                except (ValueError, OSError, HTTPForbidden):
+                    continue
+                if (entry := _index_entry(filepath)) is not None:
+                    index[rel_url] = entry
+        return index
+
+    async def async_build_index(self) -> None:
+        """Add the files in the directory to the index."""
+        index = await asyncio.get_running_loop().run_in_executor(None, self._scan)
+        self._index.update(index)
+        _LOGGER.debug("Indexed %s files of %s", len(index), self._directory)
 
     async def _handle(self, request: Request) -> StreamResponse:
         rel_url = request.match_info["filename"]
-        try:
-            filename = Path(rel_url)
-            if filename.anchor:
-                # rel_url is an absolute name like
-                # /static/\\machine_name\c$ or /static/D:\path
-                # where the static dir is totally different
-                raise HTTPForbidden()
-            filepath = self._directory.joinpath(filename).resolve()
-            if not self._follow_symlinks:
-                filepath.relative_to(self._directory)
-        except (ValueError, FileNotFoundError) as error:
-            # relatively safe
-            raise HTTPNotFound() from error
-        except Exception as error:
-            # perm error or other kind!
-            request.app.logger.exception(error)
-            raise HTTPNotFound() from error
-
-        # on opening a dir, load its contents if allowed
-        if filepath.is_dir():
-            return await super()._handle(request)
-        if filepath.is_file():
+        loop = asyncio.get_running_loop()
+
+        if (entry := self._index.get(rel_url)) is None:
+            try:
+                found = await loop.run_in_executor(None, self._lookup, rel_url)
+            except (ValueError, FileNotFoundError) as error:
+                # relatively safe
+                raise HTTPNotFound() from error
+            except (HTTPForbidden, HTTPNotFound):
+                raise
+            except Exception as error:
+                # perm error or other kind!
+                request.app.logger.exception(error)
+                raise HTTPNotFound() from error
+
+            # on opening a dir, load its contents if allowed
+            if found is None:
+                return await super()._handle(request)
+            key, entry = found
+            # Other spellings of the path, like a//b.js, are not added so
+            # requests can't grow the index without bound
+            if key == rel_url and len(self._index) < MAX_INDEXED_FILES:
+                self._index[rel_url] = entry
+
+        if (
+            hdrs.RANGE in request.headers
+            or hdrs.IF_RANGE in request.headers
+            or hdrs.IF_MATCH in request.headers
+            or hdrs.IF_UNMODIFIED_SINCE in request.headers
+        ):
+            # Partial and other conditional requests are rare for static
+            # files, they are handled by aiohttp from the disk
             return FileResponse(
-                filepath,
+                entry.files[None].path,
                 chunk_size=self._chunk_size,
                 headers=CACHE_HEADERS,
             )
-        raise HTTPNotFound
+
+        if hdrs.IF_NONE_MATCH in request.headers or (
+            hdrs.IF_MODIFIED_SINCE in request.headers
+        ):
+            # Files can be changed while Home Assistant runs, like the files
+            # in www, so they are checked again before answering 304
+            entry = await loop.run_in_executor(
+                None, _index_entry, entry.files[None].path
+            )
+            if entry is None:
+                self._index.pop(rel_url, None)
+                raise HTTPNotFound()
+            if rel_url in self._index:
+                self._index[rel_url] = entry
+
+        encoding = None
+        if len(entry.files) > 1:
+            accepted = _accepted_encodings(request)
+            encoding = next(
+                (
+                    variant_encoding
+                    for variant_encoding, _ in PRECOMPRESSED_SUFFIXES
+                    if variant_encoding in entry.files and variant_encoding in accepted
+                ),
+                None,
+            )
+        static_file = entry.files[encoding]
+
+        headers = {**CACHE_HEADERS, hdrs.CONTENT_TYPE: entry.content_type}
+        if content_encoding := encoding or entry.encoding:
+            headers[hdrs.CONTENT_ENCODING] = content_encoding
+        if len(entry.files) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+        if (if_none_match := request.if_none_match) is not None:
+            not_modified = any(
+                etag.value in (static_file.etag, "*") for etag in if_none_match
+            )
+        else:
+            not_modified = (
+                modified_since := request.if_modified_since
+            ) is not None and static_file.mtime <= modified_since.timestamp()
+
+        if not_modified:
+            del headers[hdrs.CONTENT_TYPE]
+            headers.pop(hdrs.CONTENT_ENCODING, None)
+            response = Response(status=HTTPNotModified.status_code, headers=headers)
+            response.etag = static_file.etag  # type: ignore[assignment]
+            response.last_modified = static_file.mtime  # type: ignore[assignment]
+            return response
+
+        return IndexedFileResponse(
+            static_file,
+            self._chunk_size,
+            headers,
+            partial(self._file_changed, rel_url, entry, encoding),
+        )
+
+    def _file_changed(
+        self,
+        rel_url: str,
+        entry: IndexEntry,
+        encoding: str | None,
+        static_file: StaticFile | None,
+    ) -> None:
+        """Update the index with a file opened by a response, None if missing."""
+        if static_file is None:
+            self._index.pop(rel_url, None)
+        else:
+            entry.files[encoding] = static_file
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 import logging
@@ -56,6 +57,7 @@ from .const import (
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_GZIP,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
     CONF_MEASUREMENT_ATTR,
@@ -87,6 +89,7 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_IN_FLIGHT_WRITES,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
@@ -343,6 +346,8 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
         kwargs[CONF_VERIFY_SSL] = conf[CONF_VERIFY_SSL]
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
+        if conf.get(CONF_GZIP):
+            kwargs["enable_gzip"] = True
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
@@ -424,6 +429,9 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
+    if conf.get(CONF_GZIP):
+        kwargs[CONF_GZIP] = True
+
     influx = InfluxDBClient(**kwargs)
 
     def write_v1(json):
@@ -497,7 +505,12 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+    """A threaded event handler class.
+
+    Batches are written by a pool of writers so up to MAX_IN_FLIGHT_WRITES
+    writes are in flight while the next batch is collected. When all writers
+    are busy the events queue up and are dropped once they are too old.
+    """
 
     def __init__(self, hass, influx, event_to_json, max_tries):
         """Initialize the listener."""
@@ -508,6 +521,15 @@ class InfluxThread(threading.Thread):
         self.max_tries = max_tries
         self.write_errors = 0
         self.shutdown = False
+        self.in_flight = 0
+        self.written_points = 0
+        self.dropped_points = 0
+        self.write_latency: float | None = None
+        self._lock = threading.Lock()
+        self._writers = threading.BoundedSemaphore(MAX_IN_FLIGHT_WRITES)
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_IN_FLIGHT_WRITES, thread_name_prefix=f"{DOMAIN}_writer"
+        )
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -550,6 +572,8 @@ class InfluxThread(threading.Thread):
                         dropped += 1
 
         if dropped:
+            with self._lock:
+                self.dropped_points += dropped
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
         return count, json
@@ -558,33 +582,59 @@ class InfluxThread(threading.Thread):
         """Write preprocessed events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
             try:
+                start = time.monotonic()
                 self.influx.write(json)
+                latency = time.monotonic() - start
 
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
+                with self._lock:
+                    if self.write_errors:
+                        _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+                        self.write_errors = 0
+                    self.written_points += len(json)
+                    self.write_latency = latency
 
                 _LOGGER.debug(WROTE_MESSAGE, len(json))
                 break
             except ValueError as err:
                 _LOGGER.error(err)
+                with self._lock:
+                    self.dropped_points += len(json)
                 break
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
                 else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    with self._lock:
+                        if not self.write_errors:
+                            _LOGGER.error(err)
+                        self.write_errors += len(json)
+                        self.dropped_points += len(json)
+
+    def _write_batch(self, count, json):
+        """Write a batch in a writer and mark its events as done."""
+        try:
+            self.write_to_influxdb(json)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._writers.release()
+            for _ in range(count):
+                self.queue.task_done()
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
             count, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
-            for _ in range(count):
-                self.queue.task_done()
+            if not json:
+                for _ in range(count):
+                    self.queue.task_done()
+                continue
+            # Wait for a free writer, events queue up in the meantime
+            self._writers.acquire()
+            with self._lock:
+                self.in_flight += 1
+            self._executor.submit(self._write_batch, count, json)
+        self._executor.shutdown()
 
     def block_till_done(self):
         """Block till all events processed."""
@@ -0,0 +1,32 @@
+"""Provide info to system health."""
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass):
+    """Get info for the info page."""
+    if (instance := hass.data.get(DOMAIN)) is None:
+        # Setup is still waiting to connect to InfluxDB
+        return {"connected": False}
+
+    write_latency = instance.write_latency
+    return {
+        "connected": True,
+        "queue_depth": instance.queue.qsize(),
+        "writes_in_flight": instance.in_flight,
+        "written_points": instance.written_points,
+        "dropped_points": instance.dropped_points,
+        "write_latency": (
+            f"{write_latency * 1000:.0f} ms" if write_latency is not None else None
+        ),
+    }
@@ -1,7 +1,10 @@
 """Support for displaying minimal, maximal, mean or median values."""
 from __future__ import annotations
 
+from bisect import bisect_left, insort
+from heapq import heapify, heappop, heappush
 import logging
+import math
 
 import voluptuous as vol
 
@@ -15,6 +18,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.reload import async_setup_reload_service
@@ -48,6 +52,7 @@ ATTR_TO_PROPERTY = [
 
 CONF_ENTITY_IDS = "entity_ids"
 CONF_ROUND_DIGITS = "round_digits"
+CONF_DEBOUNCE = "debounce"
 
 ICON = "mdi:calculator"
 
@@ -67,6 +72,7 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_NAME): cv.string,
         vol.Required(CONF_ENTITY_IDS): cv.entity_ids,
         vol.Optional(CONF_ROUND_DIGITS, default=2): vol.Coerce(int),
+        vol.Optional(CONF_DEBOUNCE): cv.positive_time_period,
     }
 )
 
@@ -82,73 +88,115 @@ async def async_setup_platform(
     name = config.get(CONF_NAME)
     sensor_type = config.get(CONF_TYPE)
     round_digits = config.get(CONF_ROUND_DIGITS)
+    debounce = config.get(CONF_DEBOUNCE)
 
     await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
 
-    async_add_entities([MinMaxSensor(entity_ids, name, sensor_type, round_digits)])
-
-
-def calc_min(sensor_values):
-    """Calculate min value, honoring unknown states."""
-    val = None
-    entity_id = None
-    for sensor_id, sensor_value in sensor_values:
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE] and (
-            val is None or val > sensor_value
-        ):
-            entity_id, val = sensor_id, sensor_value
-    return entity_id, val
-
+    async_add_entities(
+        [MinMaxSensor(hass, entity_ids, name, sensor_type, round_digits, debounce)]
+    )
+
+
+class SensorValues:
+    """Numeric values of the sensors with running aggregates.
+
+    Min and max are kept in heaps whose stale entries are dropped lazily and
+    the values are kept sorted for the median, so a change of one sensor
+    doesn't iterate the values of all sensors.
+    """
+
+    def __init__(self, entity_ids: list[str]) -> None:
+        """Initialize the values."""
+        # Ties are won by the sensor which is configured first
+        self._order: dict[str, int] = {}
+        for idx, entity_id in enumerate(entity_ids):
+            self._order.setdefault(entity_id, idx)
+        self._values: dict[str, float] = {}
+        self._sorted: list[float] = []
+        self._min_heap: list[tuple[float, int, str]] = []
+        self._max_heap: list[tuple[float, int, str]] = []
+        self._sum = 0.0
+        self._changes = 0
+
+    def set(self, entity_id: str, value: float | None) -> None:
+        """Set the value of a sensor, None if it is unknown."""
+        if (old := self._values.pop(entity_id, None)) is not None:
+            del self._sorted[bisect_left(self._sorted, old)]
+            self._sum -= old
+
+        # NaN can't be ordered
+        if value is not None and not math.isnan(value):
+            self._values[entity_id] = value
+            insort(self._sorted, value)
+            self._sum += value
+            order = self._order.get(entity_id, len(self._order))
+            heappush(self._min_heap, (value, order, entity_id))
+            heappush(self._max_heap, (-value, order, entity_id))
+
+        self._changes += 1
+        if self._changes >= len(self._values):
+            # Don't let rounding errors of the running sum add up
+            self._sum = math.fsum(self._values.values())
+            self._changes = 0
+        if len(self._min_heap) > 2 * len(self._values) + 16:
+            self._rebuild_heaps()
+
+    def _rebuild_heaps(self) -> None:
+        """Drop the stale entries of the heaps."""
+        order = self._order
+        self._min_heap = [
+            (value, order.get(entity_id, len(order)), entity_id)
+            for entity_id, value in self._values.items()
+        ]
+        self._max_heap = [
+            (-value, order_idx, entity_id)
+            for value, order_idx, entity_id in self._min_heap
+        ]
+        heapify(self._min_heap)
+        heapify(self._max_heap)
+
+    def _top(
+        self, heap: list[tuple[float, int, str]], sign: int
+    ) -> tuple[str | None, float | None]:
+        """Return the first current entry of a heap."""
+        while heap:
+            value, _, entity_id = heap[0]
+            if self._values.get(entity_id) == sign * value:
+                return entity_id, sign * value
+            heappop(heap)
+        return None, None
+
+    def min(self) -> tuple[str | None, float | None]:
+        """Return the sensor with the min value and the value."""
+        return self._top(self._min_heap, 1)
+
+    def max(self) -> tuple[str | None, float | None]:
+        """Return the sensor with the max value and the value."""
+        return self._top(self._max_heap, -1)
+
+    def mean(self, round_digits: int) -> float | None:
+        """Return the mean value."""
+        if not self._values:
+            return None
+        return round(self._sum / len(self._values), round_digits)
 
-def calc_max(sensor_values):
-    """Calculate max value, honoring unknown states."""
-    val = None
-    entity_id = None
-    for sensor_id, sensor_value in sensor_values:
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE] and (
-            val is None or val < sensor_value
-        ):
-            entity_id, val = sensor_id, sensor_value
-    return entity_id, val
-
-
-def calc_mean(sensor_values, round_digits):
-    """Calculate mean value, honoring unknown states."""
-    result = [
-        sensor_value
-        for _, sensor_value in sensor_values
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE]
-    ]
-
-    if not result:
-        return None
-    return round(sum(result) / len(result), round_digits)
-
-
-def calc_median(sensor_values, round_digits):
-    """Calculate median value, honoring unknown states."""
-    result = [
-        sensor_value
-        for _, sensor_value in sensor_values
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE]
-    ]
-
-    if not result:
-        return None
-    result.sort()
-    if len(result) % 2 == 0:
-        median1 = result[len(result) // 2]
-        median2 = result[len(result) // 2 - 1]
-        median = (median1 + median2) / 2
-    else:
-        median = result[len(result) // 2]
-    return round(median, round_digits)
+    def median(self, round_digits: int) -> float | None:
+        """Return the median value."""
+        if not (result := self._sorted):
+            return None
+        if len(result) % 2 == 0:
+            median1 = result[len(result) // 2]
+            median2 = result[len(result) // 2 - 1]
+            median = (median1 + median2) / 2
+        else:
+            median = result[len(result) // 2]
+        return round(median, round_digits)
 
 
 class MinMaxSensor(SensorEntity):
     """Representation of a min/max sensor."""
 
-    def __init__(self, entity_ids, name, sensor_type, round_digits):
+    def __init__(self, hass, entity_ids, name, sensor_type, round_digits, debounce):
         """Initialize the min/max sensor."""
         self._entity_ids = entity_ids
         self._sensor_type = sensor_type
@@ -163,7 +211,16 @@ class MinMaxSensor(SensorEntity):
         self.min_value = self.max_value = self.mean = self.last = self.median = None
         self.min_entity_id = self.max_entity_id = self.last_entity_id = None
         self.count_sensors = len(self._entity_ids)
-        self.states = {}
+        self.values = SensorValues(self._entity_ids)
+        self._debouncer: Debouncer | None = None
+        if debounce:
+            self._debouncer = Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=debounce.total_seconds(),
+                immediate=True,
+                function=self.async_write_ha_state,
+            )
 
     async def async_added_to_hass(self):
         """Handle added to Hass."""
@@ -173,6 +230,9 @@ class MinMaxSensor(SensorEntity):
             )
         )
 
+        if self._debouncer is not None:
+            self.async_on_remove(self._debouncer.async_cancel)
+
         self._calc_values()
 
     @property
@@ -225,9 +285,9 @@ class MinMaxSensor(SensorEntity):
             STATE_UNKNOWN,
             STATE_UNAVAILABLE,
         ]:
-            self.states[entity] = STATE_UNKNOWN
+            self.values.set(entity, None)
             self._calc_values()
-            self.async_write_ha_state()
+            self._async_write_state()
             return
 
         if self._unit_of_measurement is None:
@@ -244,8 +304,9 @@ class MinMaxSensor(SensorEntity):
             self._unit_of_measurement_mismatch = True
 
         try:
-            self.states[entity] = float(new_state.state)
-            self.last = float(new_state.state)
+            value = float(new_state.state)
+            self.values.set(entity, value)
+            self.last = value
             self.last_entity_id = entity
         except ValueError:
             _LOGGER.warning(
@@ -253,17 +314,20 @@ class MinMaxSensor(SensorEntity):
             )
 
         self._calc_values()
-        self.async_write_ha_state()
+        self._async_write_state()
+
+    @callback
+    def _async_write_state(self):
+        """Write the state, at most once per debounce period if configured."""
+        if self._debouncer is None:
+            self.async_write_ha_state()
+            return
+        self.hass.async_create_task(self._debouncer.async_call())
 
     @callback
     def _calc_values(self):
         """Calculate the values."""
-        sensor_values = [
-            (entity_id, self.states[entity_id])
-            for entity_id in self._entity_ids
-            if entity_id in self.states
-        ]
-        self.min_entity_id, self.min_value = calc_min(sensor_values)
-        self.max_entity_id, self.max_value = calc_max(sensor_values)
-        self.mean = calc_mean(sensor_values, self._round_digits)
-        self.median = calc_median(sensor_values, self._round_digits)
+        self.min_entity_id, self.min_value = self.values.min()
+        self.max_entity_id, self.max_value = self.values.max()
+        self.mean = self.values.mean(self._round_digits)
+        self.median = self.values.median(self._round_digits)
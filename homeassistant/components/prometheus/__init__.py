@@ -2,12 +2,13 @@
 from contextlib import suppress
 import logging
 import string
+import time
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
 import voluptuous as vol
 
-from homeassistant import core as hacore
 from homeassistant.components.climate.const import (
     ATTR_CURRENT_TEMPERATURE,
     ATTR_HVAC_ACTION,
@@ -29,6 +30,7 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     ATTR_UNIT_OF_MEASUREMENT,
     CONTENT_TYPE_TEXT_PLAIN,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     PERCENTAGE,
     STATE_ON,
@@ -37,7 +39,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
@@ -56,12 +58,17 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_SCRAPE_CACHE_TIME = "scrape_cache_time"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
 
 DEFAULT_NAMESPACE = "homeassistant"
 
+LABELS = ["entity", "friendly_name", "domain"]
+# States without a value, only counted as state changes
+IGNORED_STATES = (STATE_UNAVAILABLE, STATE_UNKNOWN)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -70,6 +77,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_PROM_NAMESPACE, default=DEFAULT_NAMESPACE): cv.string,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
+                vol.Optional(CONF_SCRAPE_CACHE_TIME, default=0): cv.positive_float,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
                     {cv.entity_id: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
@@ -103,34 +111,84 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     metrics = PrometheusMetrics(
-        prometheus_client,
+        hass,
         entity_filter,
         namespace,
         climate_units,
         component_config,
         override_metric,
         default_metric,
+        conf[CONF_SCRAPE_CACHE_TIME],
     )
 
+    registry = prometheus_client.REGISTRY
+    registry.register(metrics)
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
+
+    def unregister_metrics(event: Event) -> None:
+        """Unregister the collector of the metrics."""
+        registry.unregister(metrics)
+
+    hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, unregister_metrics)
     return True
 
 
+class _MetricSamples:
+    """Collect the samples of one metric for an entity."""
+
+    def __init__(self, samples, name, documentation, labelnames):
+        """Initialize the metric samples."""
+        self._samples = samples
+        self._name = name
+        self._documentation = documentation
+        self._labelnames = labelnames
+
+    def labels(self, **labels):
+        """Return the sample with the given labels."""
+        return _Sample(self, tuple(str(labels[name]) for name in self._labelnames))
+
+    def add(self, label_values, value):
+        """Add a sample value."""
+        self._samples.append(
+            (self._name, self._documentation, self._labelnames, label_values, value)
+        )
+
+
+class _Sample:
+    """A single labelled sample of a metric."""
+
+    def __init__(self, metric, label_values):
+        """Initialize the sample."""
+        self._metric = metric
+        self._label_values = label_values
+
+    def set(self, value):
+        """Set the value of the sample."""
+        self._metric.add(self._label_values, float(value))
+
+
 class PrometheusMetrics:
-    """Model all of the metrics which should be exposed to Prometheus."""
+    """Model all of the metrics which should be exposed to Prometheus.
+
+    This is a custom collector: metric families are built from the current
+    states when Prometheus scrapes, instead of updating metrics on every
+    state change. The samples of each entity are cached until its state
+    object is replaced.
+    """
 
     def __init__(
         self,
-        prometheus_cli,
+        hass,
         entity_filter,
         namespace,
         climate_units,
         component_config,
         override_metric,
         default_metric,
+        scrape_cache_time=0,
     ):
         """Initialize Prometheus Metrics."""
-        self.prometheus_cli = prometheus_cli
+        self.hass = hass
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -147,53 +205,122 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
-        self._metrics = {}
         self._climate_units = climate_units
+        self._scrape_cache_time = scrape_cache_time
+        self._scrape_cache = None
+        self._entity_samples = {}
+        self._state_changes = {}
+        self._samples = None
 
+    @callback
     def handle_event(self, event):
-        """Listen for new messages on the bus, and add them to Prometheus."""
+        """Count the state changes of exported entities."""
         if (state := event.data.get("new_state")) is None:
             return
 
-        entity_id = state.entity_id
-        _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
-
         if not self._filter(state.entity_id):
             return
 
-        ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
-
-        handler = f"_handle_{domain}"
-
-        if hasattr(self, handler) and state.state not in ignored_states:
-            getattr(self, handler)(state)
+        entity_id = state.entity_id
+        _, changes, triggered = self._state_changes.get(entity_id, (None, 0, 0))
+        if state.domain == "automation" and state.state not in IGNORED_STATES:
+            triggered += 1
+        self._state_changes[entity_id] = (self._labels(state), changes + 1, triggered)
+
+    def describe(self):
+        """Describe the metrics, which are only known at scrape time."""
+        return []
+
+    def collect(self):
+        """Build the metric families from the current states.
+
+        Called by the Prometheus registry, which the view runs inside the
+        event loop.
+        """
+        now = time.monotonic()
+        if self._scrape_cache is not None and now < self._scrape_cache[0]:
+            return self._scrape_cache[1]
+
+        families = {}
+        entity_samples = {}
+        for state in self.hass.states.async_all():
+            entity_id = state.entity_id
+            if not self._filter(entity_id):
+                continue
+            if (cached := self._entity_samples.get(entity_id)) is None or (
+                cached[0] is not state
+            ):
+                cached = (state, self._state_samples(state))
+            entity_samples[entity_id] = cached
+            for name, documentation, labelnames, label_values, value in cached[1]:
+                if (family := families.get(name)) is None:
+                    family = families[name] = GaugeMetricFamily(
+                        name, documentation, labels=labelnames
+                    )
+                family.add_metric(label_values, value)
+        self._entity_samples = entity_samples
+
+        families.update(self._state_change_families())
+
+        metrics = list(families.values())
+        if self._scrape_cache_time:
+            self._scrape_cache = (now + self._scrape_cache_time, metrics)
+        return metrics
+
+    def _state_samples(self, state):
+        """Return the samples of all gauges for a state."""
+        self._samples = samples = []
+        try:
+            handler = f"_handle_{state.domain}"
 
-        labels = self._labels(state)
-        state_change = self._metric(
-            "state_change", self.prometheus_cli.Counter, "The number of state changes"
-        )
-        state_change.labels(**labels).inc()
+            if hasattr(self, handler) and state.state not in IGNORED_STATES:
+                getattr(self, handler)(state)
 
-        entity_available = self._metric(
-            "entity_available",
-            self.prometheus_cli.Gauge,
-            "Entity is available (not in the unavailable or unknown state)",
-        )
-        entity_available.labels(**labels).set(float(state.state not in ignored_states))
+            labels = self._labels(state)
+            entity_available = self._metric(
+                "entity_available",
+                "Entity is available (not in the unavailable or unknown state)",
+            )
+            entity_available.labels(**labels).set(
+                float(state.state not in IGNORED_STATES)
+            )
 
-        last_updated_time_seconds = self._metric(
-            "last_updated_time_seconds",
-            self.prometheus_cli.Gauge,
-            "The last_updated timestamp",
-        )
-        last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
+            last_updated_time_seconds = self._metric(
+                "last_updated_time_seconds",
+                "The last_updated timestamp",
+            )
+            last_updated_time_seconds.labels(**labels).set(
+                state.last_updated.timestamp()
+            )
+        finally:
+            self._samples = None
+        return samples
+
+    def _state_change_families(self):
+        """Return the counters of state changes."""
+        families = {}
+        metrics = [
+            ("state_change", "The number of state changes"),
+            (
+                "automation_triggered_count",
+                "Count of times an automation has been triggered",
+            ),
+        ]
+        for index, (metric, documentation) in enumerate(metrics, 1):
+            name = self._sanitize_metric_name(f"{self.metrics_prefix}{metric}")
+            family = CounterMetricFamily(name, documentation, labels=LABELS)
+            for entry in self._state_changes.values():
+                if count := entry[index]:
+                    labels = entry[0]
+                    family.add_metric([str(labels[label]) for label in LABELS], count)
+            if family.samples:
+                families[name] = family
+        return families
 
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
             metric = self._metric(
                 f"{state.domain}_attr_{key.lower()}",
-                self.prometheus_cli.Gauge,
                 f"{key} attribute of {state.domain} entity",
             )
 
@@ -203,24 +330,17 @@ class PrometheusMetrics:
             except (ValueError, TypeError):
                 pass
 
-    def _metric(self, metric, factory, documentation, extra_labels=None):
-        labels = ["entity", "friendly_name", "domain"]
+    def _metric(self, metric, documentation, extra_labels=None):
+        labels = LABELS
         if extra_labels is not None:
-            labels.extend(extra_labels)
+            labels = [*labels, *extra_labels]
 
-        try:
-            return self._metrics[metric]
-        except KeyError:
-            full_metric_name = self._sanitize_metric_name(
-                f"{self.metrics_prefix}{metric}"
-            )
-            self._metrics[metric] = factory(
-                full_metric_name,
-                documentation,
-                labels,
-                registry=self.prometheus_cli.REGISTRY,
-            )
-            return self._metrics[metric]
+        return _MetricSamples(
+            self._samples,
+            self._sanitize_metric_name(f"{self.metrics_prefix}{metric}"),
+            documentation,
+            labels,
+        )
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -258,7 +378,6 @@ class PrometheusMetrics:
         if "battery_level" in state.attributes:
             metric = self._metric(
                 "battery_level_percent",
-                self.prometheus_cli.Gauge,
                 "Battery level as a percentage of its capacity",
             )
             try:
@@ -270,7 +389,6 @@ class PrometheusMetrics:
     def _handle_binary_sensor(self, state):
         metric = self._metric(
             "binary_sensor_state",
-            self.prometheus_cli.Gauge,
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
@@ -279,7 +397,6 @@ class PrometheusMetrics:
     def _handle_input_boolean(self, state):
         metric = self._metric(
             "input_boolean_state",
-            self.prometheus_cli.Gauge,
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
@@ -289,13 +406,11 @@ class PrometheusMetrics:
         if unit := self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)):
             metric = self._metric(
                 f"input_number_state_{unit}",
-                self.prometheus_cli.Gauge,
                 f"State of the input number measured in {unit}",
             )
         else:
             metric = self._metric(
                 "input_number_state",
-                self.prometheus_cli.Gauge,
                 "State of the input number",
             )
 
@@ -308,23 +423,19 @@ class PrometheusMetrics:
     def _handle_device_tracker(self, state):
         metric = self._metric(
             "device_tracker_state",
-            self.prometheus_cli.Gauge,
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
     def _handle_person(self, state):
-        metric = self._metric(
-            "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
-        )
+        metric = self._metric("person_state", "State of the person (0/1)")
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
     def _handle_light(self, state):
         metric = self._metric(
             "light_brightness_percent",
-            self.prometheus_cli.Gauge,
             "Light brightness percentage (0..100)",
         )
 
@@ -339,9 +450,7 @@ class PrometheusMetrics:
             pass
 
     def _handle_lock(self, state):
-        metric = self._metric(
-            "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
-        )
+        metric = self._metric("lock_state", "State of the lock (0/1)")
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
@@ -351,7 +460,6 @@ class PrometheusMetrics:
                 temp = fahrenheit_to_celsius(temp)
             metric = self._metric(
                 metric_name,
-                self.prometheus_cli.Gauge,
                 metric_description,
             )
             metric.labels(**self._labels(state)).set(temp)
@@ -385,7 +493,6 @@ class PrometheusMetrics:
         if current_action := state.attributes.get(ATTR_HVAC_ACTION):
             metric = self._metric(
                 "climate_action",
-                self.prometheus_cli.Gauge,
                 "HVAC action",
                 ["action"],
             )
@@ -399,7 +506,6 @@ class PrometheusMetrics:
         if current_mode and available_modes:
             metric = self._metric(
                 "climate_mode",
-                self.prometheus_cli.Gauge,
                 "HVAC mode",
                 ["mode"],
             )
@@ -413,14 +519,12 @@ class PrometheusMetrics:
         if humidifier_target_humidity_percent:
             metric = self._metric(
                 "humidifier_target_humidity_percent",
-                self.prometheus_cli.Gauge,
                 "Target Relative Humidity",
             )
             metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
-            self.prometheus_cli.Gauge,
             "State of the humidifier (0/1)",
         )
         try:
@@ -434,7 +538,6 @@ class PrometheusMetrics:
         if current_mode and available_modes:
             metric = self._metric(
                 "humidifier_mode",
-                self.prometheus_cli.Gauge,
                 "Humidifier Mode",
                 ["mode"],
             )
@@ -456,7 +559,7 @@ class PrometheusMetrics:
             if unit:
                 documentation = f"Sensor data measured in {unit}"
 
-            _metric = self._metric(metric, self.prometheus_cli.Gauge, documentation)
+            _metric = self._metric(metric, documentation)
 
             try:
                 value = self.state_as_number(state)
@@ -518,9 +621,7 @@ class PrometheusMetrics:
         return units.get(unit, default)
 
     def _handle_switch(self, state):
-        metric = self._metric(
-            "switch_state", self.prometheus_cli.Gauge, "State of the switch (0/1)"
-        )
+        metric = self._metric("switch_state", "State of the switch (0/1)")
 
         try:
             value = self.state_as_number(state)
@@ -533,19 +634,9 @@ class PrometheusMetrics:
     def _handle_zwave(self, state):
         self._battery(state)
 
-    def _handle_automation(self, state):
-        metric = self._metric(
-            "automation_triggered_count",
-            self.prometheus_cli.Counter,
-            "Count of times an automation has been triggered",
-        )
-
-        metric.labels(**self._labels(state)).inc()
-
     def _handle_counter(self, state):
         metric = self._metric(
             "counter_value",
-            self.prometheus_cli.Gauge,
             "Value of counter entities",
         )
 
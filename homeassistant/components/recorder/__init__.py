@@ -32,7 +32,7 @@ from homeassistant.const import (
     EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
-from homeassistant.core import CoreState, HomeAssistant, ServiceCall, callback
+from homeassistant.core import CoreState, Event, HomeAssistant, ServiceCall, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -61,6 +61,7 @@ from .const import (
     MAX_QUEUE_BACKLOG,
     SQLITE_URL_PREFIX,
 )
+from .history_cache import HistoryCache
 from .models import (
     Base,
     Events,
@@ -137,6 +138,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_HISTORY_CACHE_HOURS = "history_cache_hours"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -174,6 +176,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_HISTORY_CACHE_HOURS, default=0): vol.All(
+                        vol.Coerce(int), vol.Range(min=0)
+                    ),
                 }
             ),
         )
@@ -243,6 +248,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    # Purged states can not be served from the cache
+    history_cache_hours = min(conf[CONF_HISTORY_CACHE_HOURS], keep_days * 24)
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -263,6 +270,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        history_cache_hours=history_cache_hours,
     )
     instance.async_initialize()
     instance.start()
@@ -374,6 +382,8 @@ class PurgeTask(RecorderTask):
         if purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
         ):
+            if instance.history_cache:
+                instance.history_cache.purge(self.purge_before)
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
@@ -392,6 +402,8 @@ class PurgeEntitiesTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
         if purge.purge_entity_data(instance, self.entity_filter):
+            if instance.history_cache:
+                instance.history_cache.purge_entities(self.entity_filter)
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue.put(PurgeEntitiesTask(self.entity_filter))
@@ -478,6 +490,19 @@ class EventTask(RecorderTask):
         instance._process_one_event(self.event)
 
 
+@dataclass
+class EventsTask(RecorderTask):
+    """An object to insert a burst of events into the recorder queue."""
+
+    events: list[Event]
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        for event in self.events:
+            # pylint: disable-next=[protected-access]
+            instance._process_one_event(event)
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -494,6 +519,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        history_cache_hours: int = 0,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -515,6 +541,9 @@ class Recorder(threading.Thread):
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
+        self.history_cache: HistoryCache | None = (
+            HistoryCache(history_cache_hours) if history_cache_hours else None
+        )
 
         self._timechanges_seen = 0
         self._commits_without_expire = 0
@@ -525,6 +554,7 @@ class Recorder(threading.Thread):
         self.get_session = None
         self._completed_first_database_setup = None
         self._event_listener = None
+        self._state_changed_listener = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
@@ -543,6 +573,10 @@ class Recorder(threading.Thread):
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL, self.event_listener, event_filter=self._async_event_filter
         )
+        if EVENT_STATE_CHANGED not in self.exclude_t:
+            self._state_changed_listener = self.hass.bus.async_listen_batch(
+                EVENT_STATE_CHANGED, self._async_state_changed_listener
+            )
         self._queue_watcher = async_track_time_interval(
             self.hass, self._async_check_queue, timedelta(minutes=10)
         )
@@ -572,6 +606,9 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        if self._state_changed_listener:
+            self._state_changed_listener()
+            self._state_changed_listener = None
 
     @callback
     def _async_event_filter(self, event) -> bool:
@@ -579,6 +616,10 @@ class Recorder(threading.Thread):
         if event.event_type in self.exclude_t:
             return False
 
+        if event.event_type == EVENT_STATE_CHANGED:
+            # Handled in bursts by _async_state_changed_listener
+            return False
+
         if (entity_id := event.data.get(ATTR_ENTITY_ID)) is None:
             return True
 
@@ -594,6 +635,14 @@ class Recorder(threading.Thread):
         # Unknown what it is.
         return True
 
+    @callback
+    def _async_state_changed_listener(self, events: list[Event]) -> None:
+        """Queue a burst of state changed events as a single task."""
+        if events := [
+            event for event in events if self.entity_filter(event.data["entity_id"])
+        ]:
+            self.queue.put(EventsTask(events))
+
     def do_adhoc_purge(self, **kwargs):
         """Trigger an adhoc purge retaining keep_days worth of data."""
         keep_days = kwargs.get(ATTR_KEEP_DAYS, self.keep_days)
@@ -930,6 +979,15 @@ class Recorder(threading.Thread):
                 dbstate.event = dbevent
                 dbstate.created = event.time_fired
                 self.event_session.add(dbstate)
+                if self.history_cache:
+                    self.history_cache.add(
+                        dbstate.entity_id,
+                        dbstate.domain,
+                        dbstate.state,
+                        dbstate.attributes,
+                        dbstate.last_changed,
+                        dbstate.last_updated,
+                    )
                 if has_new_state:
                     self._old_states[dbstate.entity_id] = dbstate
                     self._pending_expunge.append(dbstate)
@@ -1162,6 +1220,9 @@ class Recorder(threading.Thread):
             session.expunge(self.run_info)
             self._schedule_compile_missing_statistics(session)
 
+        if self.history_cache:
+            self.history_cache.start_run(start)
+
         self._open_event_session()
 
     def _schedule_compile_missing_statistics(self, session: Session) -> None:
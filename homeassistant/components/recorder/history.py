@@ -13,6 +13,8 @@ from homeassistant.components import recorder
 from homeassistant.core import split_entity_id
 import homeassistant.util.dt as dt_util
 
+from .const import DATA_INSTANCE
+from .history_cache import HistoryCache
 from .models import LazyState, States, process_timestamp_to_utc_isoformat
 from .util import execute, session_scope
 
@@ -56,6 +58,54 @@ def async_setup(hass):
     hass.data[HISTORY_BAKERY] = baked.bakery()
 
 
+def _get_history_cache(hass) -> HistoryCache | None:
+    """Return the recent history cache of the recorder, if enabled."""
+    if (instance := hass.data.get(DATA_INSTANCE)) is None:
+        return None
+    return instance.history_cache
+
+
+def _include_significant(domain, last_changed, last_updated):
+    """Return if a cached state is significant."""
+    return domain in SIGNIFICANT_DOMAINS or last_changed == last_updated
+
+
+def _include_state_change(domain, last_changed, last_updated):
+    """Return if a cached state is a state change."""
+    return last_changed == last_updated
+
+
+def _include_all(domain, last_changed, last_updated):
+    """Include all cached states."""
+    return True
+
+
+def _cached_states_during_period(
+    hass, start_time, end_time, entity_ids, include, include_start_time_state
+):
+    """Return the start time states and states during a period from the cache.
+
+    Returns None if the period is not in the recent history cache.
+    """
+    if (history_cache := _get_history_cache(hass)) is None:
+        return None
+
+    if (
+        cached := history_cache.states_during_period(
+            start_time,
+            end_time,
+            entity_ids,
+            include,
+            include_start_time_state,
+            IGNORE_DOMAINS,
+        )
+    ) is None:
+        return None
+
+    start_time_states, states = cached
+    return [LazyState(row) for row in start_time_states], states
+
+
 def get_significant_states(hass, *args, **kwargs):
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass) as session:
@@ -87,6 +137,30 @@ def get_significant_states_with_session(
     """
     timer_start = time.perf_counter()
 
+    # The custom filters only exist as SQL
+    if (entity_ids is not None or not filters) and (
+        cached := _cached_states_during_period(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            _include_significant if significant_changes_only else _include_all,
+            include_start_time_state,
+        )
+    ) is not None:
+        start_time_states, states = cached
+        return _sorted_states_to_dict(
+            hass,
+            session,
+            states,
+            start_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            minimal_response,
+            start_time_states,
+        )
+
     baked_query = hass.data[HISTORY_BAKERY](
         lambda session: session.query(*QUERY_STATES)
     )
@@ -140,6 +214,23 @@ def get_significant_states_with_session(
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
+    if entity_id is not None:
+        entity_id = entity_id.lower()
+        if (
+            cached := _cached_states_during_period(
+                hass, start_time, end_time, [entity_id], _include_state_change, True
+            )
+        ) is not None:
+            start_time_states, states = cached
+            return _sorted_states_to_dict(
+                hass,
+                None,
+                states,
+                start_time,
+                [entity_id],
+                start_time_states=start_time_states,
+            )
+
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
             lambda session: session.query(*QUERY_STATES)
@@ -176,6 +267,25 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     """Return the last number_of_states."""
     start_time = dt_util.utcnow()
 
+    if (
+        entity_id is not None
+        and (history_cache := _get_history_cache(hass)) is not None
+        and (
+            states := history_cache.last_state_changes(
+                number_of_states, entity_id.lower()
+            )
+        )
+        is not None
+    ):
+        return _sorted_states_to_dict(
+            hass,
+            None,
+            states,
+            start_time,
+            [entity_id.lower()],
+            include_start_time_state=False,
+        )
+
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
             lambda session: session.query(*QUERY_STATES)
@@ -334,6 +444,7 @@ def _sorted_states_to_dict(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    start_time_states=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -344,7 +455,7 @@ def _sorted_states_to_dict(
 
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
-    axis correctly.
+    axis correctly. These are queried unless start_time_states is given.
     """
     result = defaultdict(list)
     # Set all entity IDs to empty lists in result set to maintain the order
@@ -355,10 +466,12 @@ def _sorted_states_to_dict(
     # Get the states at the start time
     timer_start = time.perf_counter()
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
-        ):
+        if start_time_states is None:
+            run = recorder.run_information_from_instance(hass, start_time)
+            start_time_states = _get_states_with_session(
+                hass, session, start_time, entity_ids, run=run, filters=filters
+            )
+        for state in start_time_states:
             state.last_changed = start_time
             state.last_updated = start_time
             result[state.entity_id].append(state)
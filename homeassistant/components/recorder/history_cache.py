@@ -0,0 +1,226 @@
+"""In-memory cache of the recently recorded states."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from datetime import datetime
+import sys
+import threading
+from typing import NamedTuple
+
+import homeassistant.util.dt as dt_util
+
+# Trim the entries of an entity once this many are outside of the window
+TRIM_THRESHOLD = 32
+
+
+class CachedState(NamedTuple):
+    """A recorded state with the columns of a history query."""
+
+    domain: str
+    entity_id: str
+    state: str | None
+    attributes: str
+    last_changed: datetime
+    last_updated: datetime
+
+
+class _EntityHistory:
+    """Recent states of a single entity, stored column by column."""
+
+    __slots__ = ("domain", "last_updated", "last_changed", "states", "attributes")
+
+    def __init__(self, domain: str) -> None:
+        """Initialize the entity history."""
+        self.domain = domain
+        self.last_updated = array("d")
+        self.last_changed = array("d")
+        self.states: list[str | None] = []
+        self.attributes: list[str] = []
+
+    def append(
+        self,
+        state: str | None,
+        attributes: str,
+        last_changed: float,
+        last_updated: float,
+    ) -> None:
+        """Append a state."""
+        if self.attributes and self.attributes[-1] == attributes:
+            # Share the string with the previous state
+            attributes = self.attributes[-1]
+        self.states.append(state if state is None else sys.intern(state))
+        self.attributes.append(attributes)
+        self.last_changed.append(last_changed)
+        self.last_updated.append(last_updated)
+
+    def delete_before(self, idx: int) -> None:
+        """Delete the states before an index."""
+        del self.states[:idx]
+        del self.attributes[:idx]
+        del self.last_changed[:idx]
+        del self.last_updated[:idx]
+
+    def row(self, entity_id: str, idx: int) -> CachedState:
+        """Return a state as a row."""
+        return CachedState(
+            self.domain,
+            entity_id,
+            self.states[idx],
+            self.attributes[idx],
+            dt_util.utc_from_timestamp(self.last_changed[idx]),
+            dt_util.utc_from_timestamp(self.last_updated[idx]),
+        )
+
+
+class HistoryCache:
+    """Cache the states of the last hours recorded in the current run.
+
+    The recorder thread adds every state it writes. For each entity all
+    states within the window are kept, plus the last one before it so the
+    state at the start of any period within the window is known.
+
+    Queries return None when the cache cannot answer them exactly like the
+    database would, in which case the database has to be queried.
+    """
+
+    def __init__(self, hours: int) -> None:
+        """Initialize the cache."""
+        self._window = hours * 3600
+        self._lock = threading.Lock()
+        self._entities: dict[str, _EntityHistory] = {}
+        # Start of the current run, all states since then are cached
+        self._run_start: float | None = None
+
+    def start_run(self, run_start: datetime) -> None:
+        """Drop all states and start caching a new recorder run."""
+        with self._lock:
+            self._entities = {}
+            self._run_start = run_start.timestamp()
+
+    def add(
+        self,
+        entity_id: str,
+        domain: str,
+        state: str | None,
+        attributes: str,
+        last_changed: datetime,
+        last_updated: datetime,
+    ) -> None:
+        """Add a state written by the recorder."""
+        last_updated_ts = last_updated.timestamp()
+        with self._lock:
+            if (history := self._entities.get(entity_id)) is None:
+                history = self._entities[entity_id] = _EntityHistory(domain)
+            history.append(state, attributes, last_changed.timestamp(), last_updated_ts)
+            outdated = bisect_left(history.last_updated, last_updated_ts - self._window)
+            if outdated > TRIM_THRESHOLD:
+                # Keep the last state before the window
+                history.delete_before(outdated - 1)
+
+    def purge(self, purge_before: datetime) -> None:
+        """Drop the states purged from the database."""
+        purge_before_ts = purge_before.timestamp()
+        with self._lock:
+            for entity_id, history in list(self._entities.items()):
+                history.delete_before(
+                    bisect_left(history.last_updated, purge_before_ts)
+                )
+                if not history.states:
+                    del self._entities[entity_id]
+
+    def purge_entities(self, entity_filter: Callable[[str], bool]) -> None:
+        """Drop all states of the entities purged from the database."""
+        with self._lock:
+            for entity_id in list(self._entities):
+                if entity_filter(entity_id):
+                    del self._entities[entity_id]
+
+    def _covers(self, start: float) -> bool:
+        """Return if all states after a timestamp are cached."""
+        return (
+            self._run_start is not None
+            and start >= self._run_start
+            and start >= dt_util.utcnow().timestamp() - self._window
+        )
+
+    def states_during_period(
+        self,
+        start_time: datetime,
+        end_time: datetime | None,
+        entity_ids: Iterable[str] | None,
+        include: Callable[[str, float, float], bool],
+        include_start_time_state: bool,
+        ignore_domains: Iterable[str] = (),
+    ) -> tuple[list[CachedState], list[CachedState]] | None:
+        """Return the states at start_time and the states during the period.
+
+        Without entity_ids the states of all entities outside of
+        ignore_domains are returned. include is called with the domain,
+        last_changed and last_updated timestamps to filter the states during
+        the period. States are sorted by entity_id and last_updated.
+        """
+        start = start_time.timestamp()
+        end = end_time.timestamp() if end_time is not None else None
+        start_states: list[CachedState] = []
+        states: list[CachedState] = []
+
+        with self._lock:
+            if not self._covers(start):
+                return None
+
+            if entity_ids is None:
+                entities = sorted(
+                    (entity_id, history)
+                    for entity_id, history in self._entities.items()
+                    if history.domain not in ignore_domains
+                )
+            else:
+                entities = []
+                for entity_id in sorted(entity_ids):
+                    history = self._entities.get(entity_id)
+                    if history is None or (
+                        include_start_time_state and history.last_updated[0] >= start
+                    ):
+                        # The state at start_time may be in an older run
+                        return None
+                    entities.append((entity_id, history))
+
+            for entity_id, history in entities:
+                if include_start_time_state and (
+                    before := bisect_left(history.last_updated, start)
+                ):
+                    start_states.append(history.row(entity_id, before - 1))
+                first = bisect_right(history.last_updated, start)
+                last = (
+                    len(history.states)
+                    if end is None
+                    else bisect_left(history.last_updated, end)
+                )
+                last_changed = history.last_changed
+                last_updated = history.last_updated
+                states.extend(
+                    history.row(entity_id, idx)
+                    for idx in range(first, last)
+                    if include(history.domain, last_changed[idx], last_updated[idx])
+                )
+
+        return start_states, states
+
+    def last_state_changes(
+        self, number_of_states: int, entity_id: str
+    ) -> list[CachedState] | None:
+        """Return the last state changes of an entity, oldest first."""
+        with self._lock:
+            if (history := self._entities.get(entity_id)) is None:
+                return None
+            changes: list[CachedState] = []
+            for idx in range(len(history.states) - 1, -1, -1):
+                if history.last_changed[idx] == history.last_updated[idx]:
+                    changes.append(history.row(entity_id, idx))
+                    if len(changes) == number_of_states:
+                        changes.reverse()
+                        return changes
+        # Older state changes may only be in the database
+        return None
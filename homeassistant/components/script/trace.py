@@ -5,8 +5,11 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
-from homeassistant.components.trace.const import CONF_STORED_TRACES
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_finish_trace,
+    async_start_trace,
+)
 from homeassistant.core import Context, HomeAssistant
 
 from .const import DOMAIN
@@ -29,7 +32,7 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    async_start_trace(hass, trace, trace_config)
 
     try:
         yield trace
@@ -39,4 +42,4 @@ def trace_script(
         raise ex
     finally:
         if item_id:
-            trace.finished()
+            async_finish_trace(hass, trace, trace_config)
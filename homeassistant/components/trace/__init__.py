@@ -10,7 +10,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Context, HomeAssistant
+from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
@@ -21,6 +21,7 @@ from homeassistant.helpers.trace import (
     trace_id_get,
     trace_id_set,
     trace_set_child_id,
+    trace_variables_set,
 )
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
@@ -28,11 +29,20 @@ import homeassistant.util.uuid as uuid_util
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
+    CONF_TRACE_LEVEL,
     DATA_TRACE,
+    DATA_TRACE_SAMPLES,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_RATE,
     DEFAULT_STORED_TRACES,
+    TRACE_LEVEL_ERRORS,
+    TRACE_LEVEL_FULL,
+    TRACE_LEVEL_SAMPLED,
+    TRACE_LEVEL_SUMMARY,
+    TRACE_LEVELS,
 )
 from .utils import LimitedSizeDict
 
@@ -44,7 +54,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_LEVEL, default=TRACE_LEVEL_FULL): vol.In(TRACE_LEVELS),
+    vol.Optional(CONF_SAMPLE_RATE, default=DEFAULT_SAMPLE_RATE): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 
@@ -142,6 +156,34 @@ def async_store_trace(hass, trace, stored_traces):
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_start_trace(hass, trace, trace_config):
+    """Start a trace according to the trace level of the script or automation.
+
+    Sampled runs which are not stored don't record changed variables, the
+    trace of a run with level errors is only stored if the run fails.
+    """
+    level = trace_config[CONF_TRACE_LEVEL]
+    sampled = True
+    if level == TRACE_LEVEL_SAMPLED:
+        samples = hass.data.setdefault(DATA_TRACE_SAMPLES, {})
+        run = samples.get(trace.key, 0)
+        samples[trace.key] = run + 1
+        sampled = run % trace_config[CONF_SAMPLE_RATE] == 0
+
+    trace_variables_set(sampled and level != TRACE_LEVEL_SUMMARY)
+    if sampled and level != TRACE_LEVEL_ERRORS:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
+@callback
+def async_finish_trace(hass, trace, trace_config):
+    """Finish a trace and store it if only failed runs are stored."""
+    trace.finished()
+    if trace_config[CONF_TRACE_LEVEL] == TRACE_LEVEL_ERRORS and trace.error is not None:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
 def _async_store_restored_trace(hass, trace):
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
@@ -241,6 +283,11 @@ class ActionTrace(BaseTrace):
         """Set action trace."""
         self._trace = trace
 
+    @property
+    def error(self) -> Exception | None:
+        """Return the error of the run."""
+        return self._error
+
     def set_error(self, ex: Exception) -> None:
         """Set error."""
         self._error = ex
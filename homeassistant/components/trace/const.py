@@ -5,3 +5,22 @@ DATA_TRACE = "trace"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+CONF_TRACE_LEVEL = "level"
+CONF_SAMPLE_RATE = "sample_rate"
+DATA_TRACE_SAMPLES = "trace_samples"
+DEFAULT_SAMPLE_RATE = 10  # Store one of this many runs when sampling traces
+
+# Store all runs
+TRACE_LEVEL_FULL = "full"
+# Store all runs without the changed variables of each step
+TRACE_LEVEL_SUMMARY = "summary"
+# Store one of sample_rate runs
+TRACE_LEVEL_SAMPLED = "sampled"
+# Store failed runs
+TRACE_LEVEL_ERRORS = "errors"
+TRACE_LEVELS = [
+    TRACE_LEVEL_FULL,
+    TRACE_LEVEL_SUMMARY,
+    TRACE_LEVEL_SAMPLED,
+    TRACE_LEVEL_ERRORS,
+]
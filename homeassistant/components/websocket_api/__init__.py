@@ -6,6 +6,7 @@ from typing import Final, cast
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
@@ -41,6 +42,12 @@ DOMAIN: Final = const.DOMAIN
 
 DEPENDENCIES: Final[tuple[str]] = ("http",)
 
+WEBSOCKET_API_SCHEMA: Final = vol.Schema(
+    {vol.Optional(const.CONF_COMPRESS, default=True): cv.boolean}
+)
+
+CONFIG_SCHEMA: Final = vol.Schema({DOMAIN: WEBSOCKET_API_SCHEMA}, extra=vol.ALLOW_EXTRA)
+
 
 @bind_hass
 @callback
@@ -65,6 +72,9 @@ def async_register_command(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the websocket API."""
-    hass.http.register_view(http.WebsocketAPIView())
+    if (conf := config.get(DOMAIN)) is None:
+        conf = WEBSOCKET_API_SCHEMA({})
+
+    hass.http.register_view(http.WebsocketAPIView(conf[const.CONF_COMPRESS]))
     commands.async_register_commands(hass, async_register_command)
     return True
@@ -37,6 +37,12 @@ from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
+from .subscription import (
+    SharedSubscription,
+    async_get_shared_subscription,
+    async_register_shared_subscription,
+    subscription_key,
+)
 
 
 @callback
@@ -46,6 +52,7 @@ def async_register_commands(
 ) -> None:
     """Register commands."""
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_connection_stats)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
@@ -60,6 +67,7 @@ def async_register_commands(
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
+    async_reg(hass, handle_supported_features)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
 
@@ -310,6 +318,37 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "supported_features",
+        vol.Required("features"): {str: int},
+    }
+)
+def handle_supported_features(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setting the features the client supports."""
+    connection.supported_features = msg["features"]
+    connection.send_result(msg["id"])
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "connection_stats"})
+@decorators.require_admin
+def handle_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle the statistics of the active connections command."""
+    connection.send_result(
+        msg["id"],
+        [
+            stats.as_dict()
+            for stats in hass.data.get(const.DATA_CONNECTION_STATS, {}).values()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -333,44 +372,66 @@ def handle_ping(
 async def handle_render_template(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle render_template command."""
+    """Handle render_template command.
+
+    Identical subscriptions of all connections share one tracker.
+    """
     template_str = msg["template"]
-    template_obj = template.Template(template_str, hass)  # type: ignore[no-untyped-call]
     variables = msg.get("variables")
     timeout = msg.get("timeout")
-    info = None
+    key = subscription_key(
+        connection, "render_template", template_str, variables, msg["strict"]
+    )
 
-    if timeout:
-        try:
-            timed_out = await template_obj.async_render_will_timeout(
-                timeout, strict=msg["strict"]
-            )
-        except TemplateError as ex:
-            connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(ex))
-            return
+    if (shared := async_get_shared_subscription(hass, key)) is None:
+        template_obj = template.Template(template_str, hass)  # type: ignore[no-untyped-call]
 
-        if timed_out:
-            connection.send_error(
-                msg["id"],
-                const.ERR_TEMPLATE_ERROR,
-                f"Exceeded maximum execution time of {timeout}s",
-            )
-            return
+        if timeout:
+            try:
+                timed_out = await template_obj.async_render_will_timeout(
+                    timeout, strict=msg["strict"]
+                )
+            except TemplateError as ex:
+                connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(ex))
+                return
+
+            if timed_out:
+                connection.send_error(
+                    msg["id"],
+                    const.ERR_TEMPLATE_ERROR,
+                    f"Exceeded maximum execution time of {timeout}s",
+                )
+                return
+
+    # An identical subscription may have been made while checking the timeout
+    if (
+        shared is not None
+        or (shared := async_get_shared_subscription(hass, key)) is not None
+    ):
+        shared.async_subscribe(connection, msg["id"])
+        connection.send_result(msg["id"])
+        shared.async_replay(connection, msg["id"])
+        return
+
+    shared = SharedSubscription(hass, key)
+    info = None
 
     @callback
     def _template_listener(
         event: Event | None, updates: list[TrackTemplateResult]
     ) -> None:
-        nonlocal info
         track_template_result = updates.pop()
         result = track_template_result.result
         if isinstance(result, TemplateError):
-            connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(result))
+            shared.async_send_error(const.ERR_TEMPLATE_ERROR, str(result))
             return
 
-        connection.send_message(
-            messages.event_message(
-                msg["id"], {"result": result, "listeners": info.listeners}  # type: ignore[attr-defined]
+        shared.async_send_event(
+            messages.message_to_json(
+                messages.event_message(
+                    messages.IDEN_TEMPLATE,
+                    {"result": result, "listeners": info.listeners},  # type: ignore[attr-defined]
+                )
             )
         )
 
@@ -386,7 +447,9 @@ async def handle_render_template(
         connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(ex))
         return
 
-    connection.subscriptions[msg["id"]] = info.async_remove
+    shared.unsub = info.async_remove
+    async_register_shared_subscription(hass, shared)
+    shared.async_subscribe(connection, msg["id"])
 
     connection.send_result(msg["id"])
 
@@ -448,27 +511,37 @@ def handle_entity_source(
 async def handle_subscribe_trigger(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe trigger command."""
+    """Handle subscribe trigger command.
+
+    Identical subscriptions of all connections share one set of triggers.
+    """
     # Circular dep
     # pylint: disable=import-outside-toplevel
     from homeassistant.helpers import trigger
 
-    trigger_config = await trigger.async_validate_trigger_config(hass, msg["trigger"])
+    key = subscription_key(
+        connection, "subscribe_trigger", msg["trigger"], msg.get("variables")
+    )
 
-    @callback
-    def forward_triggers(
-        variables: dict[str, Any], context: Context | None = None
-    ) -> None:
-        """Forward events to websocket."""
-        message = messages.event_message(
-            msg["id"], {"variables": variables, "context": context}
-        )
-        connection.send_message(
-            json.dumps(message, cls=ExtendedJSONEncoder, allow_nan=False)
+    if (shared := async_get_shared_subscription(hass, key)) is None:
+        trigger_config = await trigger.async_validate_trigger_config(
+            hass, msg["trigger"]
         )
+        new_shared = SharedSubscription(hass, key)
 
-    connection.subscriptions[msg["id"]] = (
-        await trigger.async_initialize_triggers(
+        @callback
+        def forward_triggers(
+            variables: dict[str, Any], context: Context | None = None
+        ) -> None:
+            """Forward events to websocket."""
+            message = messages.event_message(
+                messages.IDEN_TEMPLATE, {"variables": variables, "context": context}
+            )
+            new_shared.async_send_event(
+                json.dumps(message, cls=ExtendedJSONEncoder, allow_nan=False)
+            )
+
+        new_shared.unsub = await trigger.async_initialize_triggers(
             hass,
             trigger_config,
             forward_triggers,
@@ -477,11 +550,15 @@ async def handle_subscribe_trigger(
             connection.logger.log,
             variables=msg.get("variables"),
         )
-    ) or (
-        # Some triggers won't return an unsub function. Since the caller expects
-        # a subscription, we're going to fake one.
-        lambda: None
-    )
+
+        # An identical subscription may have been made while setting up
+        if (shared := async_get_shared_subscription(hass, key)) is None:
+            shared = new_shared
+            async_register_shared_subscription(hass, shared)
+        elif new_shared.unsub is not None:
+            new_shared.unsub()
+
+    shared.async_subscribe(connection, msg["id"])
     connection.send_result(msg["id"])
 
 
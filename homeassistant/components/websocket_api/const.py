@@ -52,5 +52,12 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to store the statistics of the active connections
+DATA_CONNECTION_STATS: Final = f"{DOMAIN}.connection_stats"
+
+CONF_COMPRESS: Final = "compress"
+
+# Features a client can enable with the supported_features command
+FEATURE_COALESCE_MESSAGES: Final = "coalesce_messages"
 
 JSON_DUMP: Final = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from dataclasses import dataclass
 import datetime as dt
 import logging
 from typing import Any, Final
@@ -17,9 +18,12 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
 from .auth import AuthPhase, auth_required_message
+from .connection import ActiveConnection
 from .const import (
     CANCELLATION_ERRORS,
+    DATA_CONNECTION_STATS,
     DATA_CONNECTIONS,
+    FEATURE_COALESCE_MESSAGES,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -40,10 +44,15 @@ class WebsocketAPIView(HomeAssistantView):
     url: str = URL
     requires_auth: bool = False
 
+    def __init__(self, compress: bool = True) -> None:
+        """Initialize the view."""
+        self.compress = compress
+
     async def get(self, request: web.Request) -> web.WebSocketResponse:
         """Handle an incoming websocket connection."""
-        # pylint: disable=no-self-use
-        return await WebSocketHandler(request.app["hass"], request).async_handle()
+        return await WebSocketHandler(
+            request.app["hass"], request, self.compress
+        ).async_handle()
 
 
 class WebSocketAdapter(logging.LoggerAdapter):
@@ -54,30 +63,92 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+@dataclass
+class ConnectionStats:
+    """Statistics of a websocket connection."""
+
+    connection_id: int
+    user_id: str | None = None
+    compressed: bool = False
+    messages: int = 0
+    frames: int = 0
+    # Messages are ASCII JSON so this is the size before compression
+    bytes_sent: int = 0
+    queue_high_water: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "connection_id": self.connection_id,
+            "user_id": self.user_id,
+            "compressed": self.compressed,
+            "messages": self.messages,
+            "frames": self.frames,
+            "bytes_sent": self.bytes_sent,
+            "coalescing_ratio": self.messages / self.frames if self.frames else 1.0,
+            "queue_high_water": self.queue_high_water,
+        }
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
-    def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
+    def __init__(
+        self, hass: HomeAssistant, request: web.Request, compress: bool = True
+    ) -> None:
         """Initialize an active connection."""
         self.hass = hass
         self.request = request
-        self.wsock = web.WebSocketResponse(heartbeat=55)
+        self.wsock = web.WebSocketResponse(heartbeat=55, compress=compress)
         self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._connection: ActiveConnection | None = None
+        self._stats = ConnectionStats(id(self))
 
     async def _writer(self) -> None:
-        """Write outgoing messages."""
+        """Write outgoing messages.
+
+        Messages which are queued while a message is written are sent as a
+        single frame with a JSON array of messages if the client supports it.
+        """
+        to_write = self._to_write
+        stats = self._stats
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                if (message := await self._to_write.get()) is None:
+                if (message := await to_write.get()) is None:
                     break
 
+                messages = [message]
+                closing = False
+                if (
+                    self._connection is not None
+                    and self._connection.supported_features.get(
+                        FEATURE_COALESCE_MESSAGES
+                    )
+                ):
+                    while not to_write.empty():
+                        if (message := to_write.get_nowait()) is None:
+                            closing = True
+                            break
+                        messages.append(message)
+
+                if len(messages) == 1:
+                    message = messages[0]
+                else:
+                    message = f"[{','.join(messages)}]"
+
                 self._logger.debug("Sending %s", message)
                 await self.wsock.send_str(message)
+                stats.messages += len(messages)
+                stats.frames += 1
+                stats.bytes_sent += len(message)
+
+                if closing:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
@@ -104,7 +175,10 @@ class WebSocketHandler:
 
             self._cancel()
 
-        if self._to_write.qsize() < PENDING_MSG_PEAK:
+        if (queued := self._to_write.qsize()) > self._stats.queue_high_water:
+            self._stats.queue_high_water = queued
+
+        if queued < PENDING_MSG_PEAK:
             if self._peak_checker_unsub:
                 self._peak_checker_unsub()
                 self._peak_checker_unsub = None
@@ -196,7 +270,12 @@ class WebSocketHandler:
                 raise Disconnect from err
 
             self._logger.debug("Received %s", msg_data)
-            connection = await auth.async_handle(msg_data)
+            connection = self._connection = await auth.async_handle(msg_data)
+            self._stats.user_id = connection.user.id
+            self._stats.compressed = bool(wsock.compress)
+            self.hass.data.setdefault(DATA_CONNECTION_STATS, {})[
+                self._stats.connection_id
+            ] = self._stats
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
@@ -255,6 +334,7 @@ class WebSocketHandler:
 
                 if connection is not None:
                     self.hass.data[DATA_CONNECTIONS] -= 1
+                    del self.hass.data[DATA_CONNECTION_STATS][self._stats.connection_id]
                 self.hass.helpers.dispatcher.async_dispatcher_send(
                     SIGNAL_WEBSOCKET_DISCONNECTED
                 )
@@ -0,0 +1,125 @@
+"""Subscriptions shared by the connections of the Websocket API.
+
+Dashboards open the same template and trigger subscriptions on every
+connection. Identical subscriptions, with the same config, variables and
+permissions, share one tracker. Its results are serialized once and sent to
+every subscriber with its own message id. The tracker is removed when the
+last subscriber unsubscribes.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+import json
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from . import messages
+from .connection import ActiveConnection
+
+DATA_SHARED_SUBSCRIPTIONS = "websocket_api_shared_subscriptions"
+
+
+def subscription_key(
+    connection: ActiveConnection, command: str, *config: Any
+) -> Hashable | None:
+    """Return the key of a subscription, None if it can't be shared."""
+    try:
+        config_key = json.dumps(config, sort_keys=True, allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+    user = connection.user
+    return (command, config_key, "admin" if user.is_admin else user.id)
+
+
+class SharedSubscription:
+    """A tracker with the subscriptions of all connections using it."""
+
+    def __init__(self, hass: HomeAssistant, key: Hashable | None) -> None:
+        """Initialize the shared subscription."""
+        self.hass = hass
+        self.key = key
+        self.unsub: Callable[[], Any] | None = None
+        # Ordered set of the connection and message id of the subscribers
+        self._subscribers: dict[tuple[ActiveConnection, int], None] = {}
+        self._last_json: str | None = None
+        self._last_error: tuple[str, str] | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Return the number of subscribers."""
+        return len(self._subscribers)
+
+    @callback
+    def async_subscribe(self, connection: ActiveConnection, msg_id: int) -> None:
+        """Add a subscriber."""
+        self._subscribers[(connection, msg_id)] = None
+
+        @callback
+        def unsubscribe() -> None:
+            """Remove the subscriber, and the tracker with the last one."""
+            self._subscribers.pop((connection, msg_id), None)
+            if self._subscribers:
+                return
+            shared = self.hass.data.get(DATA_SHARED_SUBSCRIPTIONS, {})
+            if shared.get(self.key) is self:
+                del shared[self.key]
+            if self.unsub is not None:
+                self.unsub()
+                self.unsub = None
+
+        connection.subscriptions[msg_id] = unsubscribe
+
+    @callback
+    def async_replay(self, connection: ActiveConnection, msg_id: int) -> None:
+        """Send the last result to a new subscriber."""
+        if self._last_error is not None:
+            connection.send_error(msg_id, *self._last_error)
+        elif self._last_json is not None:
+            connection.send_message(
+                self._last_json.replace(messages.IDEN_JSON_TEMPLATE, str(msg_id), 1)
+            )
+
+    @callback
+    def async_send_event(self, event_json: str) -> None:
+        """Send an event serialized with the iden template to all subscribers."""
+        self._last_json = event_json
+        self._last_error = None
+        for connection, msg_id in list(self._subscribers):
+            connection.send_message(
+                event_json.replace(messages.IDEN_JSON_TEMPLATE, str(msg_id), 1)
+            )
+
+    @callback
+    def async_send_error(self, code: str, message: str) -> None:
+        """Send an error to all subscribers."""
+        self._last_json = None
+        self._last_error = (code, message)
+        for connection, msg_id in list(self._subscribers):
+            connection.send_error(msg_id, code, message)
+
+
+@callback
+def async_get_shared_subscription(
+    hass: HomeAssistant, key: Hashable | None
+) -> SharedSubscription | None:
+    """Return the active shared subscription of a key."""
+    if key is None:
+        return None
+    shared: dict[Hashable, SharedSubscription] = hass.data.get(
+        DATA_SHARED_SUBSCRIPTIONS, {}
+    )
+    return shared.get(key)
+
+
+@callback
+def async_register_shared_subscription(
+    hass: HomeAssistant, subscription: SharedSubscription
+) -> None:
+    """Register a shared subscription so identical subscriptions can join it."""
+    if subscription.key is None:
+        return
+    shared: dict[Hashable, SharedSubscription] = hass.data.setdefault(
+        DATA_SHARED_SUBSCRIPTIONS, {}
+    )
+    shared[subscription.key] = subscription
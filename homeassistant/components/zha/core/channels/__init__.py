@@ -117,13 +117,14 @@ class Channels:
             return
         self._pools.append(ChannelPool.new(self, ep_id))
 
-    async def async_initialize(self, from_cache: bool = False) -> None:
-        """Initialize claimed channels."""
+    async def async_initialize(self, from_cache: bool = False) -> bool:
+        """Initialize claimed channels and return if all of them succeeded."""
         await self.zdo_channel.async_initialize(from_cache)
         self.zdo_channel.debug("'async_initialize' stage succeeded")
-        await asyncio.gather(
+        results = await asyncio.gather(
             *(pool.async_initialize(from_cache) for pool in self.pools)
         )
+        return all(results)
 
     async def async_configure(self) -> None:
         """Configure claimed channels."""
@@ -319,16 +320,19 @@ class ChannelPool:
                 channel = channel_class(cluster, self)
                 self.client_channels[channel.id] = channel
 
-    async def async_initialize(self, from_cache: bool = False) -> None:
-        """Initialize claimed channels."""
-        await self._execute_channel_tasks("async_initialize", from_cache)
+    async def async_initialize(self, from_cache: bool = False) -> bool:
+        """Initialize claimed channels and return if all of them succeeded."""
+        return await self._execute_channel_tasks("async_initialize", from_cache)
 
     async def async_configure(self) -> None:
         """Configure claimed channels."""
         await self._execute_channel_tasks("async_configure")
 
-    async def _execute_channel_tasks(self, func_name: str, *args: Any) -> None:
-        """Add a throttled channel task and swallow exceptions."""
+    async def _execute_channel_tasks(self, func_name: str, *args: Any) -> bool:
+        """Add a throttled channel task and swallow exceptions.
+
+        Return if all channel tasks succeeded.
+        """
 
         async def _throttle(coro):
             async with self._channels.semaphore:
@@ -337,11 +341,14 @@ class ChannelPool:
         channels = [*self.claimed_channels.values(), *self.client_channels.values()]
         tasks = [_throttle(getattr(ch, func_name)(*args)) for ch in channels]
         results = await asyncio.gather(*tasks, return_exceptions=True)
+        success = True
         for channel, outcome in zip(channels, results):
             if isinstance(outcome, Exception):
                 channel.warning("'%s' stage failed: %s", func_name, str(outcome))
+                success = False
                 continue
             channel.debug("'%s' stage succeeded", func_name)
+        return success
 
     @callback
     def async_new_entity(
@@ -359,6 +366,11 @@ class ChannelPool:
         """Send a signal through hass dispatcher."""
         self._channels.async_send_signal(signal, *args)
 
+    @callback
+    def async_prioritize_refresh(self) -> None:
+        """Refresh the device before others if it is waiting for a refresh."""
+        self._channels.zha_device.async_prioritize_refresh()
+
     @callback
     def claim_channels(self, channels: list[zha_typing.ChannelType]) -> None:
         """Claim a channel."""
@@ -55,6 +55,8 @@ def decorate_command(channel, command):
 
     @wraps(command)
     async def wrapper(*args, **kwds):
+        # The user interacts with the device, make sure its state is current
+        channel.async_prioritize_refresh()
         try:
             result = await command(*args, **kwds)
             channel.debug(
@@ -157,6 +159,11 @@ class ZigbeeChannel(LogMixin):
         """Send a signal through hass dispatcher."""
         self._ch_pool.async_send_signal(signal, *args)
 
+    @callback
+    def async_prioritize_refresh(self) -> None:
+        """Refresh the device before others if it is waiting for a refresh."""
+        self._ch_pool.async_prioritize_refresh()
+
     async def bind(self):
         """Bind a zigbee cluster.
 
@@ -446,13 +446,19 @@ class ZHADevice(LogMixin):
                 EFFECT_OKAY, EFFECT_DEFAULT_VARIANT
             )
 
-    async def async_initialize(self, from_cache=False):
-        """Initialize channels."""
+    async def async_initialize(self, from_cache=False) -> bool:
+        """Initialize channels and return if all of them succeeded."""
         self.debug("started initialization")
-        await self._channels.async_initialize(from_cache)
+        success = await self._channels.async_initialize(from_cache)
         self.debug("power source: %s", self.power_source)
         self.status = DeviceStatus.INITIALIZED
         self.debug("completed initialization")
+        return success
+
+    @callback
+    def async_prioritize_refresh(self) -> None:
+        """Refresh the device before others if it is waiting for a refresh."""
+        self.gateway.refresh_scheduler.async_prioritize(self)
 
     @callback
     def async_cleanup_handles(self) -> None:
@@ -28,6 +28,7 @@ from homeassistant.helpers.entity_registry import (
     async_get_registry as get_ent_reg,
 )
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util.async_ import gather_with_concurrency
 
 from . import discovery, typing as zha_typing
 from .const import (
@@ -80,6 +81,7 @@ from .const import (
 from .device import DeviceStatus, ZHADevice
 from .group import GroupMember, ZHAGroup
 from .registries import GROUP_ENTITY_DOMAINS
+from .scheduler import INITIAL_CONCURRENCY, DeviceRefreshScheduler
 from .store import async_get_registry
 from .typing import ZhaGroupType, ZigpyEndpointType, ZigpyGroupType
 
@@ -123,6 +125,7 @@ class ZHAGateway:
         self.debug_enabled = False
         self._log_relay_handler = LogRelayHandler(hass, self)
         self.config_entry = config_entry
+        self.refresh_scheduler = DeviceRefreshScheduler(hass)
         self._unsubs = []
 
     async def async_initialize(self):
@@ -208,29 +211,21 @@ class ZHAGateway:
             discovery.GROUP_PROBE.discover_group_entities(zha_group)
 
     async def async_initialize_devices_and_entities(self) -> None:
-        """Initialize devices and load entities."""
-        semaphore = asyncio.Semaphore(2)
-
-        async def _throttle(zha_device: zha_typing.ZhaDeviceType, cached: bool):
-            async with semaphore:
-                await zha_device.async_initialize(from_cache=cached)
-
-        _LOGGER.debug("Loading battery powered devices")
-        await asyncio.gather(
-            *(
-                _throttle(dev, cached=True)
-                for dev in self.devices.values()
-                if not dev.is_mains_powered
-            )
+        """Initialize devices and load entities.
+
+        All devices are initialized from the zigpy cache, a few at a time, so
+        their entities can be loaded right away, mains powered devices are then
+        refreshed from the network in the background.
+        """
+        _LOGGER.debug("Loading devices from cache")
+        await gather_with_concurrency(
+            INITIAL_CONCURRENCY,
+            *(dev.async_initialize(from_cache=True) for dev in self.devices.values()),
         )
 
-        _LOGGER.debug("Loading mains powered devices")
-        await asyncio.gather(
-            *(
-                _throttle(dev, cached=False)
-                for dev in self.devices.values()
-                if dev.is_mains_powered
-            )
+        _LOGGER.debug("Refreshing mains powered devices")
+        self.refresh_scheduler.async_schedule(
+            dev for dev in self.devices.values() if dev.is_mains_powered
         )
 
     def device_joined(self, device):
@@ -662,6 +657,7 @@ class ZHAGateway:
     async def shutdown(self):
         """Stop ZHA Controller Application."""
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
+        self.refresh_scheduler.async_cancel()
         for unsubscribe in self._unsubs:
             unsubscribe()
         await self.application_controller.pre_shutdown()
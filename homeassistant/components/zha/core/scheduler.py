@@ -0,0 +1,145 @@
+"""Background refresh of ZHA devices from the network."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import heapq
+import itertools
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from . import typing as zha_typing
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 1
+
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 8
+INITIAL_CONCURRENCY = 2
+
+# A refresh this many times slower than the average means the radio is congested
+SLOW_REFRESH_FACTOR = 2.0
+LATENCY_SMOOTHING = 0.2
+
+
+class DeviceRefreshScheduler:
+    """Refresh devices from the network in the background.
+
+    Devices are refreshed in priority order and devices the user interacts
+    with are moved to the front of the queue. The number of concurrent
+    refreshes grows by one after as many successful refreshes and is halved
+    when a refresh fails or is much slower than the average, so a congested
+    or unreliable network is not flooded with requests.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._queue: list[list[Any]] = []
+        self._entries: dict[Any, list[Any]] = {}
+        self._counter = itertools.count()
+        self._tasks: set[asyncio.Task] = set()
+        self._active = 0
+        self._successes = 0
+        self._latency: float | None = None
+        self.concurrency = INITIAL_CONCURRENCY
+
+    @property
+    def pending(self) -> int:
+        """Return the number of devices waiting for a refresh."""
+        return len(self._entries)
+
+    @callback
+    def async_schedule(
+        self,
+        devices: Iterable[zha_typing.ZhaDeviceType],
+        priority: int = PRIORITY_DEFAULT,
+    ) -> None:
+        """Schedule a refresh of devices."""
+        for device in devices:
+            self._async_enqueue(device, priority)
+        self._async_start_refreshes()
+
+    @callback
+    def async_prioritize(self, device: zha_typing.ZhaDeviceType) -> None:
+        """Refresh a device before all others if it is waiting for a refresh."""
+        if device.ieee in self._entries:
+            self._async_enqueue(device, PRIORITY_INTERACTIVE)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel all pending and running refreshes."""
+        self._queue.clear()
+        self._entries.clear()
+        for task in self._tasks:
+            task.cancel()
+
+    @callback
+    def _async_enqueue(self, device: zha_typing.ZhaDeviceType, priority: int) -> None:
+        """Add a device to the queue or move it to a higher priority."""
+        if (entry := self._entries.get(device.ieee)) is not None:
+            if entry[0] <= priority:
+                return
+            # Entries can't be removed from the heap, skip it when popped
+            entry[-1] = None
+        entry = [priority, next(self._counter), device]
+        self._entries[device.ieee] = entry
+        heapq.heappush(self._queue, entry)
+
+    @callback
+    def _async_start_refreshes(self) -> None:
+        """Start refreshes until the concurrency limit is reached."""
+        while self._queue and self._active < self.concurrency:
+            *_, device = heapq.heappop(self._queue)
+            if device is None:
+                continue
+            del self._entries[device.ieee]
+            self._active += 1
+            task = self._hass.async_create_task(self._async_refresh(device))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _async_refresh(self, device: zha_typing.ZhaDeviceType) -> None:
+        """Refresh a device and adapt the concurrency to how it went."""
+        start = time.monotonic()
+        try:
+            success = await device.async_initialize(from_cache=False)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error refreshing device %s", device.ieee)
+            success = False
+        finally:
+            self._active -= 1
+
+        self._async_adapt(success, time.monotonic() - start)
+        self._async_start_refreshes()
+
+    @callback
+    def _async_adapt(self, success: bool, latency: float) -> None:
+        """Adapt the concurrency to the outcome and latency of a refresh."""
+        slow = (
+            self._latency is not None and latency > self._latency * SLOW_REFRESH_FACTOR
+        )
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += LATENCY_SMOOTHING * (latency - self._latency)
+
+        if not success or slow:
+            self._successes = 0
+            self.concurrency = max(MIN_CONCURRENCY, self.concurrency // 2)
+            _LOGGER.debug(
+                "Refresh %s, lowering concurrency to %s",
+                "slow" if success else "failed",
+                self.concurrency,
+            )
+            return
+
+        self._successes += 1
+        if self._successes >= self.concurrency:
+            self._successes = 0
+            self.concurrency = min(MAX_CONCURRENCY, self.concurrency + 1)
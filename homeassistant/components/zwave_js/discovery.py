@@ -769,6 +769,63 @@ DISCOVERY_SCHEMAS = [
 ]
 
 
+class DiscoverySchemaIndex:
+    """Lookup tables to find the discovery schemas a value can match.
+
+    Schemas are indexed by the command class of their primary value and, for
+    device specific schemas, by (manufacturer_id, product_id). Candidates are
+    returned in their original order since the first match wins.
+    """
+
+    def __init__(self, schemas: list[ZWaveDiscoverySchema]) -> None:
+        """Compile the lookup tables."""
+        self._schemas = schemas
+        any_command_class: list[int] = []
+        by_command_class: dict[int, list[int]] = {}
+        self._device_specific: set[int] = set()
+        self._by_device: dict[tuple[int, int | None], set[int]] = {}
+        for idx, schema in enumerate(schemas):
+            if (command_classes := schema.primary_value.command_class) is None:
+                any_command_class.append(idx)
+            else:
+                for command_class in command_classes:
+                    by_command_class.setdefault(command_class, []).append(idx)
+
+            if schema.manufacturer_id is None:
+                continue
+            self._device_specific.add(idx)
+            for manufacturer_id in schema.manufacturer_id:
+                for product_id in schema.product_id or (None,):
+                    self._by_device.setdefault(
+                        (manufacturer_id, product_id), set()
+                    ).add(idx)
+
+        self._any_command_class = any_command_class
+        self._by_command_class = {
+            command_class: sorted({*indices, *any_command_class})
+            for command_class, indices in by_command_class.items()
+        }
+
+    @callback
+    def async_candidates(self, value: ZwaveValue) -> list[ZWaveDiscoverySchema]:
+        """Return the schemas that may match a value, in discovery order."""
+        indices = self._by_command_class.get(
+            value.command_class, self._any_command_class
+        )
+        node = value.node
+        device_schemas = self._by_device.get(
+            (node.manufacturer_id, node.product_id), set()
+        ) | self._by_device.get((node.manufacturer_id, None), set())
+        return [
+            self._schemas[idx]
+            for idx in indices
+            if idx not in self._device_specific or idx in device_schemas
+        ]
+
+
+DISCOVERY_SCHEMA_INDEX = DiscoverySchemaIndex(DISCOVERY_SCHEMAS)
+
+
 @callback
 def async_discover_node_values(
     node: ZwaveNode, device: DeviceEntry, discovered_value_ids: dict[str, set[str]]
@@ -787,7 +844,7 @@ def async_discover_single_value(
 ) -> Generator[ZwaveDiscoveryInfo, None, None]:
     """Run discovery on a single ZWave value and return matching schema info."""
     discovered_value_ids[device.id].add(value.value_id)
-    for schema in DISCOVERY_SCHEMAS:
+    for schema in DISCOVERY_SCHEMA_INDEX.async_candidates(value):
         # check manufacturer_id
         if (
             schema.manufacturer_id is not None
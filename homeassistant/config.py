@@ -58,6 +58,7 @@ from .helpers import (
 )
 from .helpers.entity_values import EntityValues
 from .helpers.typing import ConfigType
+from .helpers.validation_cache import async_get_validation_cache, schema_key
 from .loader import Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
@@ -350,6 +351,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
     )
+    if secrets is not None:
+        cache = await async_get_validation_cache(hass)
+        cache.async_add_secrets(secrets.used_values)
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
@@ -826,10 +830,24 @@ async def async_process_component_config(  # noqa: C901
             _LOGGER.exception("Unknown error calling %s config validator", domain)
             return None
 
+    cache = await async_get_validation_cache(hass)
+
     # No custom config validator, proceed with schema validation
     if hasattr(component, "CONFIG_SCHEMA"):
         try:
-            return component.CONFIG_SCHEMA(config)  # type: ignore
+            # Only the config of the domain is validated, so the result can be
+            # reused while the config of other domains changes
+            domain_config = {
+                key: config[key] for key in extract_domain_configs(config, domain)
+            }
+            return {
+                **config_without_domain(config, domain),
+                **cache.async_validate(
+                    schema_key(integration, "CONFIG_SCHEMA"),
+                    component.CONFIG_SCHEMA,  # type: ignore
+                    domain_config,
+                ),
+            }
         except vol.Invalid as ex:
             async_log_exception(ex, domain, config, hass, integration.documentation)
             return None
@@ -848,7 +866,11 @@ async def async_process_component_config(  # noqa: C901
     for p_name, p_config in config_per_platform(config, domain):
         # Validate component specific platform schema
         try:
-            p_validated = component_platform_schema(p_config)
+            p_validated = cache.async_validate(
+                schema_key(integration, "PLATFORM_SCHEMA"),
+                component_platform_schema,
+                p_config,
+            )
         except vol.Invalid as ex:
             async_log_exception(ex, domain, p_config, hass, integration.documentation)
             continue
@@ -882,7 +904,11 @@ async def async_process_component_config(  # noqa: C901
         # Validate platform specific schema
         if hasattr(platform, "PLATFORM_SCHEMA"):
             try:
-                p_validated = platform.PLATFORM_SCHEMA(p_config)
+                p_validated = cache.async_validate(
+                    schema_key(p_integration, f"{domain}.PLATFORM_SCHEMA"),
+                    platform.PLATFORM_SCHEMA,
+                    p_config,
+                )
             except vol.Invalid as ex:
                 async_log_exception(
                     ex,
@@ -23,6 +23,7 @@ import os
 import pathlib
 import re
 import threading
+import time
 from time import monotonic
 from types import MappingProxyType
 from typing import (
@@ -121,6 +122,9 @@ BLOCK_LOG_TIMEOUT = 60
 # How long we wait for the result of a service call
 SERVICE_CALL_LIMIT = 10  # seconds
 
+# How many removed entities the state machine remembers for changed_since
+MAX_REMOVED_STATES = 4096
+
 
 class ConfigSource(StrEnum):
     """Source of core configuration."""
@@ -774,11 +778,22 @@ class Event:
         )
 
 
+class EventDataFilter(NamedTuple):
+    """Event filter that matches if event.data[key] is one of the values.
+
+    Unlike a callable event filter, the event bus indexes these filters so
+    firing an event only considers the listeners that match.
+    """
+
+    key: str
+    values: Collection[Any]
+
+
 class _FilterableJob(NamedTuple):
     """Event listener job to be executed with optional filter."""
 
     job: HassJob[None | Awaitable[None]]
-    event_filter: Callable[[Event], bool] | None
+    event_filter: Callable[[Event], bool] | EventDataFilter | None
 
 
 class EventBus:
@@ -787,6 +802,12 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        # Listeners with an EventDataFilter by event type, key and value
+        self._indexed_listeners: dict[
+            str, dict[str, dict[Any, list[_FilterableJob]]]
+        ] = {}
+        # Listeners that receive the events fired together as one list
+        self._batch_listeners: dict[str, list[HassJob]] = {}
         self._hass = hass
 
     @callback
@@ -795,7 +816,18 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, key_listeners in self._indexed_listeners.items():
+            indexed_jobs = {
+                id(filterable_job)
+                for value_listeners in key_listeners.values()
+                for filterable_jobs in value_listeners.values()
+                for filterable_job in filterable_jobs
+            }
+            listeners[event_type] = listeners.get(event_type, 0) + len(indexed_jobs)
+        for event_type, batch_jobs in self._batch_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(batch_jobs)
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -832,25 +864,99 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-
-        # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
-
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
+        self._async_dispatch(event)
+        if batch_listeners := self._batch_listeners.get(event_type):
+            events = [event]
+            for job in batch_listeners:
+                self._hass.async_add_hass_job(job, events)
+
+    @callback
+    def async_fire_many(
+        self,
+        event_type: str,
+        events_data: Iterable[dict[str, Any]],
+        origin: EventOrigin = EventOrigin.local,
+        context: Context | None = None,
+        time_fired: datetime.datetime | None = None,
+    ) -> list[Event]:
+        """Fire a burst of events of the same type.
+
+        Regular listeners receive every event on its own, listeners added
+        with async_listen_batch receive all of them in a single call.
+
+        This method must be run in the event loop.
+        """
+        if len(event_type) > MAX_LENGTH_EVENT_EVENT_TYPE:
+            raise MaxLengthExceeded(
+                event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
+            )
+
+        if time_fired is None:
+            time_fired = dt_util.utcnow()
+
+        events = [
+            Event(event_type, event_data, origin, time_fired, context)
+            for event_data in events_data
+        ]
+        if not events:
+            return events
+
+        if event_type != EVENT_TIME_CHANGED:
+            _LOGGER.debug("Bus:Handling %s %s events", len(events), event_type)
+
+        for event in events:
+            self._async_dispatch(event)
+        if batch_listeners := self._batch_listeners.get(event_type):
+            for job in batch_listeners:
+                self._hass.async_add_hass_job(job, events)
+        return events
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        """Schedule the listeners of a single event."""
+        event_type = event.event_type
+        event_data = event.data
+        listeners = self._listeners.get(event_type)
+        indexed_listeners = self._indexed_listeners.get(event_type)
+
+        # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
+        match_all_listeners = (
+            self._listeners.get(MATCH_ALL)
+            if event_type != EVENT_HOMEASSISTANT_CLOSE
+            else None
+        )
+
+        if match_all_listeners:
+            self._async_run_listeners(match_all_listeners, event)
+        if listeners:
+            self._async_run_listeners(listeners, event)
+        if indexed_listeners and event_data:
+            for key, value_listeners in indexed_listeners.items():
+                if key not in event_data:
+                    continue
+                try:
+                    matching_listeners = value_listeners.get(event_data[key])
+                except TypeError:
+                    # Unhashable values never match
+                    continue
+                if matching_listeners:
+                    for filterable_job in matching_listeners:
+                        self._hass.async_add_hass_job(filterable_job.job, event)
 
+    @callback
+    def _async_run_listeners(
+        self, listeners: list[_FilterableJob], event: Event
+    ) -> None:
+        """Run listeners whose filter, if any, matches the event."""
         for job, event_filter in listeners:
             if event_filter is not None:
                 try:
-                    if not event_filter(event):
+                    if not event_filter(event):  # type: ignore[operator]
                         continue
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception("Error in event filter")
@@ -882,7 +988,7 @@ class EventBus:
         self,
         event_type: str,
         listener: Callable[[Event], None | Awaitable[None]],
-        event_filter: Callable[[Event], bool] | None = None,
+        event_filter: Callable[[Event], bool] | EventDataFilter | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -891,21 +997,64 @@ class EventBus:
 
         An optional event_filter, which must be a callable decorated with
         @callback that returns a boolean value, determines if the
-        listener callable should run.
+        listener callable should run. Passing an EventDataFilter instead
+        matches on a single key of the event data, which the event bus
+        can look up without running a filter for every listener.
 
         This method must be run in the event loop.
         """
-        if event_filter is not None and not is_callback(event_filter):
+        if isinstance(event_filter, EventDataFilter):
+            if event_type == MATCH_ALL:
+                raise HomeAssistantError(
+                    "Event data filters require a specific event type"
+                )
+        elif event_filter is not None and not is_callback(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         return self._async_listen_filterable_job(
             event_type, _FilterableJob(HassJob(listener), event_filter)
         )
 
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: str,
+        listener: Callable[[list[Event]], None | Awaitable[None]],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type, delivered as a list.
+
+        Events fired together with async_fire_many are passed in a single
+        call; events fired with async_fire are passed as a list of one.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Batch listeners require a specific event type")
+        job = HassJob(listener)
+        self._batch_listeners.setdefault(event_type, []).append(job)
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            try:
+                self._batch_listeners[event_type].remove(job)
+                if not self._batch_listeners[event_type]:
+                    self._batch_listeners.pop(event_type)
+            except (KeyError, ValueError):
+                _LOGGER.exception("Unable to remove unknown batch listener %s", job)
+
+        return remove_listener
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJob
     ) -> CALLBACK_TYPE:
-        self._listeners.setdefault(event_type, []).append(filterable_job)
+        if isinstance(event_filter := filterable_job.event_filter, EventDataFilter):
+            value_listeners = self._indexed_listeners.setdefault(
+                event_type, {}
+            ).setdefault(event_filter.key, {})
+            for value in event_filter.values:
+                value_listeners.setdefault(value, []).append(filterable_job)
+        else:
+            self._listeners.setdefault(event_type, []).append(filterable_job)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -980,6 +1129,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        if isinstance(event_filter := filterable_job.event_filter, EventDataFilter):
+            self._async_remove_indexed_listener(
+                event_type, event_filter, filterable_job
+            )
+            return
+
         try:
             self._listeners[event_type].remove(filterable_job)
 
@@ -993,6 +1148,35 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        event_type: str,
+        event_filter: EventDataFilter,
+        filterable_job: _FilterableJob,
+    ) -> None:
+        """Remove a listener with an EventDataFilter of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            key_listeners = self._indexed_listeners[event_type]
+            value_listeners = key_listeners[event_filter.key]
+            for value in event_filter.values:
+                value_listeners[value].remove(filterable_job)
+                if not value_listeners[value]:
+                    del value_listeners[value]
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+
+        if not value_listeners:
+            del key_listeners[event_filter.key]
+            if not key_listeners:
+                del self._indexed_listeners[event_type]
+
 
 _StateT = TypeVar("_StateT", bound="State")
 
@@ -1149,6 +1333,43 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Versions start at the current time in microseconds, so they keep
+        # increasing across restarts
+        self._version = self._removed_floor = int(time.time() * 1_000_000)
+        # Version of the last change of each entity, in order of the changes
+        self._versions: dict[str, int] = {}
+        # Version of the removal of removed entities, in order of removal
+        self._removed: dict[str, int] = {}
+
+    @property
+    def version(self) -> int:
+        """Return the version of the last change to the state machine."""
+        return self._version
+
+    @callback
+    def async_changed_since(self, version: int) -> tuple[list[State], list[str]] | None:
+        """Return the states changed and the entity ids removed since a version.
+
+        Returns None if the changes since the version are not known.
+
+        This method must be run in the event loop.
+        """
+        if version < self._removed_floor or version > self._version:
+            return None
+
+        changed = []
+        for entity_id, changed_version in reversed(self._versions.items()):
+            if changed_version <= version:
+                break
+            changed.append(self._states[entity_id])
+
+        removed = []
+        for entity_id, removed_version in reversed(self._removed.items()):
+            if removed_version <= version:
+                break
+            removed.append(entity_id)
+
+        return changed, removed
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -1260,6 +1481,14 @@ class StateMachine:
         if old_state is None:
             return False
 
+        self._version += 1
+        del self._versions[entity_id]
+        self._removed[entity_id] = self._version
+        if len(self._removed) > MAX_REMOVED_STATES:
+            # Changes since before the oldest remembered removal are unknown
+            oldest = next(iter(self._removed))
+            self._removed_floor = self._removed.pop(oldest)
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1335,9 +1564,98 @@ class StateMachine:
         This method must be run in the event loop.
         """
         entity_id = entity_id.lower()
+        old_state = self._states.get(entity_id)
+        if (
+            state := self._async_new_state(
+                entity_id, new_state, attributes, force_update, context, None, old_state
+            )
+        ) is None:
+            return
+
+        self._async_store(old_state, state)
+        self._bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
+            EventOrigin.local,
+            state.context,
+            time_fired=state.last_updated,
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the states of many entities at once.
+
+        States is an iterable of (entity_id, state, attributes) tuples. All
+        states are written before any listener runs and share the same
+        context and last updated time. A state_changed event is fired for
+        each changed entity; listeners added with async_listen_batch
+        receive them as a single list.
+
+        This method must be run in the event loop.
+        """
+        if context is None:
+            context = Context()
+
+        now = dt_util.utcnow()
+
+        # All states are created first, so an invalid state leaves the
+        # state machine unchanged
+        staged: dict[str, State] = {}
+        changes: list[dict[str, Any]] = []
+        for entity_id, new_state, attributes in states:
+            entity_id = entity_id.lower()
+            old_state = staged.get(entity_id) or self._states.get(entity_id)
+            if (
+                state := self._async_new_state(
+                    entity_id,
+                    new_state,
+                    attributes,
+                    force_update,
+                    context,
+                    now,
+                    old_state,
+                )
+            ) is None:
+                continue
+            staged[entity_id] = state
+            changes.append(
+                {"entity_id": entity_id, "old_state": old_state, "new_state": state}
+            )
+
+        for change in changes:
+            self._async_store(change["old_state"], change["new_state"])
+
+        self._bus.async_fire_many(
+            EVENT_STATE_CHANGED,
+            changes,
+            EventOrigin.local,
+            context,
+            time_fired=now,
+        )
+
+    @callback
+    def _async_new_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        now: datetime.datetime | None,
+        old_state: State | None,
+    ) -> State | None:
+        """Return the new state of an entity without storing it.
+
+        Returns None if neither the state nor the attributes changed.
+        """
         new_state = str(new_state)
         attributes = attributes or {}
-        if (old_state := self._states.get(entity_id)) is None:
+        if old_state is None:
             same_state = False
             same_attr = False
             last_changed = None
@@ -1347,14 +1665,15 @@ class StateMachine:
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
-            return
+            return None
 
         if context is None:
             context = Context()
 
-        now = dt_util.utcnow()
+        if now is None:
+            now = dt_util.utcnow()
 
-        state = State(
+        return State(
             entity_id,
             new_state,
             attributes,
@@ -1363,14 +1682,18 @@ class StateMachine:
             context,
             old_state is None,
         )
+
+    @callback
+    def _async_store(self, old_state: State | None, state: State) -> None:
+        """Store a new state and track its version."""
+        entity_id = state.entity_id
         self._states[entity_id] = state
-        self._bus.async_fire(
-            EVENT_STATE_CHANGED,
-            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
-            EventOrigin.local,
-            context,
-            time_fired=now,
-        )
+        self._version += 1
+        if old_state is None:
+            self._removed.pop(entity_id, None)
+        else:
+            del self._versions[entity_id]
+        self._versions[entity_id] = self._version
 
 
 class Service:
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable
 import contextlib
+from contextvars import ContextVar
 from datetime import (
     date as date_sys,
     datetime as datetime_sys,
@@ -102,6 +103,10 @@ port = vol.All(vol.Coerce(int), vol.Range(min=1, max=65535))
 # typing typevar
 T = TypeVar("T")
 
+# Set by validators with a result depending on the environment, like the file
+# system, so the result is not cached
+environment_cv: ContextVar[bool] = ContextVar("environment_cv", default=False)
+
 
 def path(value: Any) -> str:
     """Validate it's a safe path."""
@@ -180,6 +185,7 @@ def whitespace(value: Any) -> str:
 
 def isdevice(value: Any) -> str:
     """Validate that value is a real device."""
+    environment_cv.set(True)
     try:
         os.stat(value)
         return str(value)
@@ -221,6 +227,7 @@ def is_regex(value: Any) -> re.Pattern[Any]:
 
 def isfile(value: Any) -> str:
     """Validate that the value is an existing file."""
+    environment_cv.set(True)
     if value is None:
         raise vol.Invalid("None is not file")
     file_in = os.path.expanduser(str(value))
@@ -234,6 +241,7 @@ def isfile(value: Any) -> str:
 
 def isdir(value: Any) -> str:
     """Validate that the value is an existing dir."""
+    environment_cv.set(True)
     if value is None:
         raise vol.Invalid("not a directory")
     dir_in = os.path.expanduser(str(value))
@@ -32,6 +32,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     Event,
+    EventDataFilter,
     HomeAssistant,
     callback,
     split_entity_id,
@@ -830,11 +831,6 @@ async def _async_migrate_yaml_to_json(
 def async_setup_entity_restore(hass: HomeAssistant, registry: EntityRegistry) -> None:
     """Set up the entity restore mechanism."""
 
-    @callback
-    def cleanup_restored_states_filter(event: Event) -> bool:
-        """Clean up restored states filter."""
-        return bool(event.data["action"] == "remove")
-
     @callback
     def cleanup_restored_states(event: Event) -> None:
         """Clean up restored states."""
@@ -848,7 +844,7 @@ def async_setup_entity_restore(hass: HomeAssistant, registry: EntityRegistry) ->
     hass.bus.async_listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
         cleanup_restored_states,
-        event_filter=cleanup_restored_states_filter,
+        event_filter=EventDataFilter("action", ("remove",)),
     )
 
     if hass.is_running:
@@ -7,6 +7,7 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
 import logging
 import time
 from typing import Any, Union, cast
@@ -56,6 +57,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TIMER_WHEEL = "track_timer_wheel"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1256,42 +1259,149 @@ def async_track_point_in_utc_time(
 
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    job = action if isinstance(action, HassJob) else HassJob(action)
+    timer = _Timer(job, utc_point_in_time)
+
+    if (wheel := hass.data.get(TRACK_TIMER_WHEEL)) is None:
+        wheel = hass.data[TRACK_TIMER_WHEEL] = _TimerWheel(hass)
+    wheel.async_schedule(timer)
 
     @callback
-    def run_action(job: HassJob[Awaitable[None] | None]) -> None:
-        """Call the action."""
-        nonlocal cancel_callback
+    def unsub_point_in_time_listener() -> None:
+        """Cancel the timer."""
+        wheel.async_cancel(timer)
 
-        now = time_tracker_utcnow()
+    return unsub_point_in_time_listener
 
-        # Depending on the available clock support (including timer hardware
-        # and the OS kernel) it can happen that we fire a little bit too early
-        # as measured by utcnow(). That is bad when callbacks have assumptions
-        # about the current time. Thus, we rearm the timer for the remaining
-        # time.
-        if (delta := (utc_point_in_time - now).total_seconds()) > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
 
-            cancel_callback = hass.loop.call_later(delta, run_action, job)
+track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
+
+
+class _Timer:
+    """A job scheduled to run at a point in UTC time."""
+
+    __slots__ = ("job", "point_in_time", "timestamp", "bucket", "cancelled")
+
+    def __init__(
+        self, job: HassJob[Awaitable[None] | None], point_in_time: datetime
+    ) -> None:
+        """Initialize the timer."""
+        self.job = job
+        self.point_in_time = point_in_time
+        self.timestamp = point_in_time.timestamp()
+        self.bucket = int(self.timestamp)
+        self.cancelled = False
+
+
+class _TimerWheel:
+    """Run timers from buckets of one second with a single event loop timer.
+
+    Buckets are keyed by the whole second their timers are due in, the same
+    seconds the core timer ticks on. Timers due at the same time run in the
+    same tick, and cancelling a timer only removes it from its bucket. A heap
+    of bucket keys tracks the next bucket to run, keys of emptied buckets are
+    dropped lazily.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self._buckets: dict[int, dict[_Timer, None]] = {}
+        self._bucket_keys: list[int] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_timestamp = 0.0
+
+    @callback
+    def async_schedule(self, timer: _Timer) -> None:
+        """Schedule a timer."""
+        if (bucket := self._buckets.get(timer.bucket)) is None:
+            bucket = self._buckets[timer.bucket] = {}
+            heapq.heappush(self._bucket_keys, timer.bucket)
+        bucket[timer] = None
+
+        if self._handle is None or timer.timestamp < self._handle_timestamp:
+            self._async_arm(timer.timestamp)
+
+    @callback
+    def async_cancel(self, timer: _Timer) -> None:
+        """Cancel a timer if it did not run yet."""
+        # The timer may be due in the tick that is running
+        timer.cancelled = True
+        if (bucket := self._buckets.get(timer.bucket)) is None:
             return
+        bucket.pop(timer, None)
+        if bucket:
+            return
+        del self._buckets[timer.bucket]
 
-        hass.async_run_hass_job(job, utc_point_in_time)
+        if not self._buckets:
+            self._bucket_keys.clear()
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+        elif len(self._bucket_keys) > 2 * len(self._buckets) + 64:
+            self._bucket_keys = list(self._buckets)
+            heapq.heapify(self._bucket_keys)
 
-    job = action if isinstance(action, HassJob) else HassJob(action)
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action, job)
+    @callback
+    def _async_arm(self, timestamp: float, now: float | None = None) -> None:
+        """Arm the event loop timer to tick at a timestamp."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_timestamp = timestamp
+        self._handle = self.hass.loop.call_later(
+            timestamp - (time.time() if now is None else now), self._async_tick
+        )
 
     @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
+    def _async_arm_next(self, now: float) -> None:
+        """Arm the event loop timer for the first timer left."""
+        bucket_keys = self._bucket_keys
+        while bucket_keys:
+            if (bucket := self._buckets.get(bucket_keys[0])) is not None:
+                self._async_arm(min(timer.timestamp for timer in bucket), now)
+                return
+            heapq.heappop(bucket_keys)
+        self._handle = None
 
-    return unsub_point_in_time_listener
+    @callback
+    def _async_tick(self) -> None:
+        """Run all timers that are due."""
+        self._handle = None
+        now = time_tracker_utcnow().timestamp()
+        bucket_keys = self._bucket_keys
+        due: list[_Timer] = []
+
+        while bucket_keys and bucket_keys[0] <= now:
+            key = bucket_keys[0]
+            if (bucket := self._buckets.get(key)) is None:
+                heapq.heappop(bucket_keys)
+                continue
 
+            if key + 1 <= now:
+                heapq.heappop(bucket_keys)
+                del self._buckets[key]
+                due.extend(bucket)
+                continue
 
-track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
+            # Depending on the available clock support (including timer
+            # hardware and the OS kernel) it can happen that we fire a little
+            # bit too early as measured by utcnow(). That is bad when callbacks
+            # have assumptions about the current time. Thus, timers in the
+            # current second that are not due yet are left for the next tick.
+            for timer in [timer for timer in bucket if timer.timestamp <= now]:
+                del bucket[timer]
+                due.append(timer)
+            if not bucket:
+                heapq.heappop(bucket_keys)
+                del self._buckets[key]
+            break
+
+        self._async_arm_next(now)
+
+        for timer in due:
+            if not timer.cancelled:
+                self.hass.async_run_hass_job(timer.job, timer.point_in_time)
 
 
 @callback
@@ -1589,7 +1699,14 @@ def _event_triggers_rerender(event: Event, info: RenderInfo) -> bool:
     entity_id = cast(str, event.data.get(ATTR_ENTITY_ID))
 
     if info.filter(entity_id):
-        return True
+        if (
+            (parts := info.partial_entities.get(entity_id)) is None
+            or (old_state := event.data.get("old_state")) is None
+            or (new_state := event.data.get("new_state")) is None
+        ):
+            return True
+        # Only re-render if a part of the state the template read changed
+        return _state_parts_changed(parts, old_state, new_state)
 
     if (
         event.data.get("new_state") is not None
@@ -1600,6 +1717,23 @@ def _event_triggers_rerender(event: Event, info: RenderInfo) -> bool:
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _state_parts_changed(
+    parts: Iterable[str | None], old_state: State, new_state: State
+) -> bool:
+    """Determine if the state value (None) or any named attribute changed."""
+    for part in parts:
+        if part is None:
+            if (
+                old_state.state != new_state.state
+                or old_state.last_changed != new_state.last_changed
+            ):
+                return True
+        elif old_state.attributes.get(part) != new_state.attributes.get(part):
+            return True
+    return False
+
+
 @callback
 def _rate_limit_for_event(
     event: Event, info: RenderInfo, track_template_: TrackTemplate
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 import logging
 from typing import Any, TypeVar, cast
@@ -23,11 +24,18 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_JOURNAL_KEY = "core.restore_state_journal"
 STORAGE_VERSION = 1
 
-# How long between periodically saving the current states to disk
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between rewriting all states, which also clears the journal
+STATE_COMPACT_INTERVAL = timedelta(hours=24)
+
+# Rewrite all states early once this share of them is held in the journal
+STATE_COMPACT_RATIO = 0.5
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -67,10 +75,12 @@ class RestoreStateData:
         data = RestoreStateData(hass)
 
         try:
-            stored_states = await data.store.async_load()
+            stored_states, journal = await asyncio.gather(
+                data.store.async_load(), data.journal_store.async_load()
+            )
         except HomeAssistantError as exc:
             _LOGGER.error("Error loading last states", exc_info=exc)
-            stored_states = None
+            stored_states = journal = None
 
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
@@ -81,6 +91,8 @@ class RestoreStateData:
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
+            if journal is not None:
+                data.async_apply_journal(journal)
             _LOGGER.debug("Created cache with %s", list(data.last_states))
 
         async def hass_start(hass: HomeAssistant) -> None:
@@ -103,8 +115,39 @@ class RestoreStateData:
         self.store: Store = Store(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.journal_store: Store = Store(
+            hass, STORAGE_VERSION, STORAGE_JOURNAL_KEY, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entity_ids: set[str] = set()
+        # The states as they were last written, either by a full dump or
+        # by the journal on top of it. Used to detect changes by identity.
+        self._dumped_states: dict[str, State] = {}
+        # Serialized states changed since the last full dump, None if removed
+        self._journal: dict[str, dict[str, Any] | None] = {}
+        self._journal_base: datetime | None = None
+        self._last_compacted: datetime | None = None
+
+    @callback
+    def async_apply_journal(self, journal: dict[str, Any]) -> None:
+        """Apply the journal written since the last full dump to last_states.
+
+        The journal is only applied if it was written on top of the loaded
+        states. A journal left behind by an interrupted full dump is stale.
+        """
+        base = journal["base"]
+        if isinstance(base, str):
+            base = dt_util.parse_datetime(base)
+
+        if base != _async_stored_states_base(self.last_states.values()):
+            _LOGGER.debug("Ignoring stale restore state journal")
+            return
+
+        for entity_id, item in journal["states"].items():
+            if item is None:
+                self.last_states.pop(entity_id, None)
+            elif valid_entity_id(entity_id):
+                self.last_states[entity_id] = StoredState.from_dict(item)
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -151,27 +194,85 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
+        base = _async_stored_states_base(stored_states)
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
+            # Start a new journal on top of the states we just wrote
+            await self.journal_store.async_save({"base": base, "states": {}})
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._dumped_states = {
+            stored_state.state.entity_id: stored_state.state
+            for stored_state in stored_states
+        }
+        self._journal = {}
+        self._journal_base = base
+        self._last_compacted = dt_util.utcnow()
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since the last dump to the journal.
+
+        Falls back to dumping all states when there is no full dump to write
+        the journal on top of, or once the journal has grown too large.
+        """
+        if self._last_compacted is None:
+            await self.async_dump_states()
+            return
+
+        current_states: dict[str, State] = {}
+        changed = False
+        for stored_state in self.async_get_stored_states():
+            entity_id = stored_state.state.entity_id
+            current_states[entity_id] = stored_state.state
+            # States are immutable, so an unchanged state is the same object
+            if self._dumped_states.get(entity_id) is not stored_state.state:
+                self._journal[entity_id] = stored_state.as_dict()
+                changed = True
+
+        for entity_id in self._dumped_states.keys() - current_states.keys():
+            self._journal[entity_id] = None
+            changed = True
+
+        if not changed:
+            return
+
+        if len(self._journal) > len(current_states) * STATE_COMPACT_RATIO:
+            await self.async_dump_states()
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(self._journal))
+        try:
+            await self.journal_store.async_save(
+                {"base": self._journal_base, "states": self._journal}
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+            return
+
+        self._dumped_states = current_states
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
         async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+            if (
+                self._last_compacted is not None
+                and dt_util.utcnow() - self._last_compacted < STATE_COMPACT_INTERVAL
+            ):
+                await self.async_dump_changed_states()
+            else:
+                await self.async_dump_states()
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
-        self.hass.async_create_task(_async_dump_states())
+        self.hass.async_create_task(self.async_dump_states())
 
         # Dump states periodically
         cancel_interval = async_track_time_interval(
@@ -180,7 +281,7 @@ class RestoreStateData:
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_changed_states()
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -209,6 +310,17 @@ class RestoreStateData:
         self.entity_ids.remove(entity_id)
 
 
+def _async_stored_states_base(
+    stored_states: Iterable[StoredState],
+) -> datetime | None:
+    """Return the time a set of stored states was written at.
+
+    All states that were current at the time of a full dump share the most
+    recent last_seen, which identifies that dump.
+    """
+    return max((stored_state.last_seen for stored_state in stored_states), default=None)
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
@@ -2,19 +2,21 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
-from contextlib import suppress
+from collections.abc import Callable, Iterable
+from contextlib import AsyncExitStack, suppress
 from copy import deepcopy
+from datetime import datetime, timedelta
 import inspect
 from json import JSONEncoder
 import logging
 import os
-from typing import Any
+import time
+from typing import Any, NamedTuple
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
-from homeassistant.util import json as json_util
+from homeassistant.util import dt as dt_util, json as json_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -23,6 +25,17 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITER = "storage_writer"
+
+# Delayed writes which are due within this many seconds are written together
+WRITE_COALESCE_WINDOW = 5
+
+
+class StoreWriteStats(NamedTuple):
+    """Size and duration of the last write of a store."""
+
+    size: int
+    duration: float
 
 
 @bind_hass
@@ -65,6 +78,162 @@ async def async_migrator(
     return config
 
 
+class _StorageWriter:
+    """Write the stores of Home Assistant in batches.
+
+    Stores schedule their delayed writes here instead of each running its
+    own timer. When the first delayed write is due, all delayed writes that
+    are due within WRITE_COALESCE_WINDOW are serialized and written in a
+    single executor job. Pending writes of all stores are written in one
+    batch on final write.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        # Stores with a pending write and when it is due, None on final write
+        self._pending: dict[Store, datetime | None] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._timer_due: datetime | None = None
+        self.stats: dict[str, StoreWriteStats] = {}
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_handle_final_write
+        )
+
+    @callback
+    def async_schedule(self, store: Store, delay: float | None) -> None:
+        """Schedule writing a store after a delay or, without delay, on final write."""
+        if delay is None or self.hass.state == CoreState.stopping:
+            self._pending[store] = None
+            return
+
+        due = dt_util.utcnow() + timedelta(seconds=delay)
+        self._pending[store] = due
+        if self._timer_due is None or due < self._timer_due:
+            self._async_schedule_timer(due)
+
+    @callback
+    def async_discard(self, store: Store) -> None:
+        """Discard a scheduled write of a store."""
+        self._pending.pop(store, None)
+
+    @callback
+    def _async_schedule_timer(self, due: datetime) -> None:
+        """Schedule the next batch."""
+        # pylint: disable-next=import-outside-toplevel
+        from .event import async_track_point_in_utc_time
+
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        self._timer_due = due
+        self._unsub_timer = async_track_point_in_utc_time(
+            self.hass, self._async_handle_timer, due
+        )
+
+    @callback
+    def _async_handle_timer(self, _now: datetime) -> None:
+        """Write the stores which are due."""
+        # pylint: disable-next=import-outside-toplevel
+        from .event import time_tracker_utcnow
+
+        self._unsub_timer = None
+        self._timer_due = None
+
+        # Stores are written on final write if we are stopping
+        if self.hass.state == CoreState.stopping:
+            return
+
+        # The timer can fire late, write everything which is due by now
+        window_end = time_tracker_utcnow() + timedelta(seconds=WRITE_COALESCE_WINDOW)
+        due = [
+            store
+            for store, store_due in self._pending.items()
+            if store_due is not None and store_due <= window_end
+        ]
+        for store in due:
+            del self._pending[store]
+
+        if later := [due for due in self._pending.values() if due is not None]:
+            self._async_schedule_timer(min(later))
+
+        if due:
+            self.hass.async_create_task(self.async_write(due))
+
+    async def _async_handle_final_write(self, _event: Event) -> None:
+        """Write all pending stores because Home Assistant is in final write state."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+            self._timer_due = None
+        await self.async_write(list(self._pending))
+
+    async def async_write(self, stores: Iterable[Store]) -> None:
+        """Write the pending data of stores in a single executor job."""
+        async with AsyncExitStack() as stack:
+            batch: list[tuple[Store, dict]] = []
+            # Locks are always taken in the same order so batches can't deadlock
+            for store in sorted(set(stores), key=lambda store: (store.key, id(store))):
+                await stack.enter_async_context(store._write_lock)
+                self._pending.pop(store, None)
+                try:
+                    data = store._async_pop_data()
+                except Exception:  # pylint: disable=broad-except
+                    # Don't let one store keep the others from being written
+                    _LOGGER.exception("Error getting the data of %s", store.key)
+                    continue
+                if data is not None:
+                    batch.append((store, data))
+
+            if batch:
+                await self.hass.async_add_executor_job(self._write_batch, batch)
+
+    def _write_batch(self, batch: list[tuple[Store, dict]]) -> None:
+        """Write a batch of stores."""
+        start = time.monotonic()
+        for store, data in batch:
+            store_start = time.monotonic()
+            path = store.path
+            try:
+                store._write_data(path, data)
+            except (json_util.SerializationError, json_util.WriteError) as err:
+                _LOGGER.error("Error writing config for %s: %s", store.key, err)
+                continue
+
+            size = 0
+            with suppress(OSError):
+                size = os.path.getsize(path)
+            stats = self.stats[store.key] = StoreWriteStats(
+                size, time.monotonic() - store_start
+            )
+            _LOGGER.debug(
+                "Wrote %s bytes for %s in %.3f seconds",
+                stats.size,
+                store.key,
+                stats.duration,
+            )
+
+        if len(batch) > 1:
+            _LOGGER.debug(
+                "Wrote %s stores in %.3f seconds", len(batch), time.monotonic() - start
+            )
+
+
+@callback
+def async_get_write_stats(hass: HomeAssistant) -> dict[str, StoreWriteStats]:
+    """Return the size and duration of the last write of each store."""
+    if (writer := hass.data.get(STORAGE_WRITER)) is None:
+        return {}
+    return dict(writer.stats)
+
+
+@callback
+def _async_get_writer(hass: HomeAssistant) -> _StorageWriter:
+    """Return the storage writer."""
+    if (writer := hass.data.get(STORAGE_WRITER)) is None:
+        writer = hass.data[STORAGE_WRITER] = _StorageWriter(hass)
+    return writer
+
+
 @bind_hass
 class Store:
     """Class to help storing data."""
@@ -87,8 +256,6 @@ class Store:
         self.hass = hass
         self._private = private
         self._data: dict[str, Any] | None = None
-        self._unsub_delay_listener: CALLBACK_TYPE | None = None
-        self._unsub_final_write_listener: CALLBACK_TYPE | None = None
         self._write_lock = asyncio.Lock()
         self._load_task: asyncio.Future | None = None
         self._encoder = encoder
@@ -188,7 +355,7 @@ class Store:
         }
 
         if self.hass.state == CoreState.stopping:
-            self._async_ensure_final_write_listener()
+            _async_get_writer(self.hass).async_schedule(self, None)
             return
 
         await self._async_handle_write_data()
@@ -196,9 +363,6 @@ class Store:
     @callback
     def async_delay_save(self, data_func: Callable[[], dict], delay: float = 0) -> None:
         """Save data with an optional delay."""
-        # pylint: disable-next=import-outside-toplevel
-        from .event import async_call_later
-
         self._data = {
             "version": self.version,
             "minor_version": self.minor_version,
@@ -206,74 +370,24 @@ class Store:
             "data_func": data_func,
         }
 
-        self._async_cleanup_delay_listener()
-        self._async_ensure_final_write_listener()
-
-        if self.hass.state == CoreState.stopping:
-            return
-
-        self._unsub_delay_listener = async_call_later(
-            self.hass, delay, self._async_callback_delayed_write
-        )
-
-    @callback
-    def _async_ensure_final_write_listener(self) -> None:
-        """Ensure that we write if we quit before delay has passed."""
-        if self._unsub_final_write_listener is None:
-            self._unsub_final_write_listener = self.hass.bus.async_listen_once(
-                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_callback_final_write
-            )
-
-    @callback
-    def _async_cleanup_final_write_listener(self) -> None:
-        """Clean up a stop listener."""
-        if self._unsub_final_write_listener is not None:
-            self._unsub_final_write_listener()
-            self._unsub_final_write_listener = None
-
-    @callback
-    def _async_cleanup_delay_listener(self) -> None:
-        """Clean up a delay listener."""
-        if self._unsub_delay_listener is not None:
-            self._unsub_delay_listener()
-            self._unsub_delay_listener = None
-
-    async def _async_callback_delayed_write(self, _now):
-        """Handle a delayed write callback."""
-        # catch the case where a call is scheduled and then we stop Home Assistant
-        if self.hass.state == CoreState.stopping:
-            self._async_ensure_final_write_listener()
-            return
-        await self._async_handle_write_data()
-
-    async def _async_callback_final_write(self, _event: Event) -> None:
-        """Handle a write because Home Assistant is in final write state."""
-        self._unsub_final_write_listener = None
-        await self._async_handle_write_data()
+        _async_get_writer(self.hass).async_schedule(self, delay)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
-        async with self._write_lock:
-            self._async_cleanup_delay_listener()
-            self._async_cleanup_final_write_listener()
-
-            if self._data is None:
-                # Another write already consumed the data
-                return
+        await _async_get_writer(self.hass).async_write([self])
 
-            data = self._data
-
-            if "data_func" in data:
-                data["data"] = data.pop("data_func")()
+    @callback
+    def _async_pop_data(self) -> dict | None:
+        """Return the data to write, generating it if needed."""
+        if (data := self._data) is None:
+            # Another write already consumed the data
+            return None
 
-            self._data = None
+        self._data = None
+        if "data_func" in data:
+            data["data"] = data.pop("data_func")()
 
-            try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
-                )
-            except (json_util.SerializationError, json_util.WriteError) as err:
-                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+        return data
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
@@ -294,8 +408,7 @@ class Store:
 
     async def async_remove(self) -> None:
         """Remove all data."""
-        self._async_cleanup_delay_listener()
-        self._async_cleanup_final_write_listener()
+        _async_get_writer(self.hass).async_discard(self)
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
@@ -88,6 +88,9 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "name",
 }
 
+# Parts of the state that can be read without reading the attributes
+_STATE_VALUE_ATTRIBUTES = {"state", "last_changed"}
+
 ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
 DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
 
@@ -236,6 +239,10 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities of which only the state and/or named attributes were read,
+        # mapped to the attribute names read. None stands for the state value.
+        # All other entities in self.entities were read in full.
+        self.partial_entities: dict[str, set[str | None]] = {}
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -267,6 +274,7 @@ class RenderInfo:
         self.is_static = True
         self._freeze_sets()
         self.all_states = False
+        self.partial_entities = {}
 
     def _freeze_sets(self) -> None:
         self.entities = frozenset(self.entities)
@@ -276,6 +284,16 @@ class RenderInfo:
     def _freeze(self) -> None:
         self._freeze_sets()
 
+        # Any change to an entity matched by domain or all states re-renders
+        if self.all_states or self.exception:
+            self.partial_entities = {}
+        elif self.domains and self.partial_entities:
+            self.partial_entities = {
+                entity_id: parts
+                for entity_id, parts in self.partial_entities.items()
+                if split_entity_id(entity_id)[0] not in self.domains
+            }
+
         if self.rate_limit is None:
             if self.all_states or self.exception:
                 self.rate_limit = ALL_STATES_RATE_LIMIT
@@ -732,16 +750,21 @@ class TemplateState(State):
 
     def _collect_state(self) -> None:
         if self._collect and _RENDER_INFO in self._hass.data:
-            self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+            _collect_state(self._hass, self._state.entity_id)
+
+    def _collect_state_part(self, part: str | None) -> None:
+        if self._collect and _RENDER_INFO in self._hass.data:
+            _collect_state_part(self._hass, self._state.entity_id, part)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item):
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and _RENDER_INFO in self._hass.data:
-                self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+            if item in _STATE_VALUE_ATTRIBUTES:
+                self._collect_state_part(None)
+            else:
+                self._collect_state()
             return getattr(self._state, item)
         if item == "entity_id":
             return self._state.entity_id
@@ -760,7 +783,7 @@ class TemplateState(State):
     @property
     def state(self):
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_part(None)
         return self._state.state
 
     @property
@@ -772,7 +795,7 @@ class TemplateState(State):
     @property
     def last_changed(self):
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state_part(None)
         return self._state.last_changed
 
     @property
@@ -808,7 +831,8 @@ class TemplateState(State):
     @property
     def state_with_unit(self) -> str:
         """Return the state concatenated with the unit if available."""
-        self._collect_state()
+        self._collect_state_part(None)
+        self._collect_state_part(ATTR_UNIT_OF_MEASUREMENT)
         unit = self._state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return f"{self._state.state} {unit}" if unit else self._state.state
 
@@ -825,6 +849,18 @@ class TemplateState(State):
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := hass.data.get(_RENDER_INFO)) is not None:
         entity_collect.entities.add(entity_id)
+        entity_collect.partial_entities.pop(entity_id, None)
+
+
+def _collect_state_part(hass: HomeAssistant, entity_id: str, part: str | None) -> None:
+    """Collect reading the state value (None) or a named attribute of an entity."""
+    if (entity_collect := hass.data.get(_RENDER_INFO)) is None:
+        return
+    if entity_id not in entity_collect.entities:
+        entity_collect.entities.add(entity_id)
+        entity_collect.partial_entities[entity_id] = {part}
+    elif (parts := entity_collect.partial_entities.get(entity_id)) is not None:
+        parts.add(part)
 
 
 def _state_generator(hass: HomeAssistant, domain: str | None) -> Generator:
@@ -1259,9 +1295,11 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
-    if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
-    return None
+    if (state_obj := hass.states.get(entity_id)) is None:
+        _collect_state(hass, entity_id)
+        return None
+    _collect_state_part(hass, entity_id, name)
+    return state_obj.attributes.get(name)
 
 
 def now(hass: HomeAssistant) -> datetime:
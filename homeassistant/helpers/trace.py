@@ -25,17 +25,21 @@ class TraceElement:
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
+        self._variables: dict[str, Any] | None = None
+        self._last_variables: dict[str, Any] | None = None
+        self._changed_variables: dict[str, Any] | None = None
 
+        if not trace_variables_cv.get():
+            return
         if variables is None:
             variables = {}
-        last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
-        changed_variables = {
-            key: value
-            for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
-        }
-        self._variables = changed_variables
+        # Changed variables are only compared when the trace is shown, the
+        # copy of the last variables is shared while they are unchanged
+        last_variables = variables_cv.get()
+        if last_variables is None or not _same_variables(last_variables, variables):
+            variables_cv.set(dict(variables))
+        self._variables = variables_cv.get()
+        self._last_variables = last_variables or {}
 
     def __repr__(self) -> str:
         """Container for trace data."""
@@ -59,6 +63,28 @@ class TraceElement:
         old_result = self._result or {}
         self._result = {**old_result, **kwargs}
 
+    @property
+    def changed_variables(self) -> dict[str, Any]:
+        """Return variables which changed since the previous TraceElement."""
+        if self._changed_variables is None:
+            variables = self._variables or {}
+            last_variables = self._last_variables or {}
+            if variables is last_variables:
+                self._changed_variables = {}
+            else:
+                self._changed_variables = {
+                    key: value
+                    for key, value in variables.items()
+                    if key not in last_variables
+                    or (
+                        last_variables[key] is not value
+                        and last_variables[key] != value
+                    )
+                }
+            # The variables are not needed anymore
+            self._variables = self._last_variables = None
+        return self._changed_variables
+
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
         result: dict[str, Any] = {"path": self.path, "timestamp": self._timestamp}
@@ -69,8 +95,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
-        if self._variables:
-            result["changed_variables"] = self._variables
+        if changed_variables := self.changed_variables:
+            result["changed_variables"] = changed_variables
         if self._error is not None:
             result["error"] = str(self._error)
         if self._result is not None:
@@ -78,6 +104,16 @@ class TraceElement:
         return result
 
 
+def _same_variables(last_variables: dict[str, Any], variables: Any) -> bool:
+    """Return if the variables hold the same objects as the last variables."""
+    if len(last_variables) != len(variables):
+        return False
+    return all(
+        key in last_variables and last_variables[key] is value
+        for key, value in variables.items()
+    )
+
+
 # Context variables for tracing
 # Current trace
 trace_cv: ContextVar[dict[str, deque[TraceElement]] | None] = ContextVar(
@@ -93,6 +129,8 @@ trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
 )
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
+# Record changed variables in trace elements
+trace_variables_cv: ContextVar[bool] = ContextVar("trace_variables_cv", default=True)
 # (domain.item_id, Run ID)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
@@ -113,6 +151,11 @@ def trace_id_get() -> tuple[str, str] | None:
     return trace_id_cv.get()
 
 
+def trace_variables_set(enabled: bool) -> None:
+    """Set if changed variables are recorded in the current trace."""
+    trace_variables_cv.set(enabled)
+
+
 def trace_stack_push(trace_stack_var: ContextVar, node: Any) -> None:
     """Push an element to the top of a trace stack."""
     if (trace_stack := trace_stack_var.get()) is None:
@@ -4,9 +4,12 @@ from __future__ import annotations
 import asyncio
 from collections import ChainMap
 import logging
+import re
 from typing import Any
 
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import (
     MAX_LOAD_CONCURRENTLY,
     Integration,
@@ -17,12 +20,20 @@ from homeassistant.loader import (
 from homeassistant.util.async_ import gather_with_concurrency
 from homeassistant.util.json import load_json
 
+from .storage import Store
+
 _LOGGER = logging.getLogger(__name__)
 
-TRANSLATION_LOAD_LOCK = "translation_load_lock"
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
 
+STORAGE_KEY_TEMPLATE = "core.translations.{}"
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+# Compiled translations are only stored for languages which are safe to use
+# in a file name
+COMPILED_LANGUAGE = re.compile(r"^[A-Za-z]{2,3}([-_][A-Za-z0-9]{1,8})*$")
+
 
 def recursive_flatten(prefix: Any, data: dict[str, Any]) -> dict[str, Any]:
     """Return a flattened representation of dict data."""
@@ -199,14 +210,102 @@ async def async_get_component_strings(
     return translations
 
 
+def _compiled_key(integration: Integration) -> str | None:
+    """Return the key compiled strings of an integration are valid for.
+
+    The strings of built-in integrations can change without a version change
+    in development versions, and the translation files of custom integrations
+    can change without a version change, so they are not compiled.
+    """
+    if not integration.is_built_in or "dev" in __version__:
+        return None
+    return __version__
+
+
+class _CompiledTranslations:
+    """Strings of all components in one language, stored in a single file."""
+
+    def __init__(self, hass: HomeAssistant, language: str) -> None:
+        """Initialize the compiled translations."""
+        self.hass = hass
+        self._store: Store | None = None
+        if COMPILED_LANGUAGE.match(language):
+            self._store = Store(
+                hass, STORAGE_VERSION, STORAGE_KEY_TEMPLATE.format(language)
+            )
+        self._components: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+
+    async def async_get(
+        self, components: set[str], integrations: dict[str, Integration]
+    ) -> dict[str, dict[str, Any]]:
+        """Return the compiled strings of components which are up to date."""
+        if not self._loaded:
+            await self._async_load()
+
+        compiled = {}
+        for component in components:
+            key = _compiled_key(integrations[component.split(".")[-1]])
+            if (
+                key is not None
+                and (entry := self._components.get(component)) is not None
+                and entry["key"] == key
+            ):
+                compiled[component] = entry["strings"]
+        return compiled
+
+    @callback
+    def async_add(
+        self, strings: dict[str, dict[str, Any]], integrations: dict[str, Integration]
+    ) -> None:
+        """Add strings loaded from the translation files."""
+        changed = False
+        for component, component_strings in strings.items():
+            key = _compiled_key(integrations[component.split(".")[-1]])
+            if key is not None:
+                self._components[component] = {"key": key, "strings": component_strings}
+                changed = True
+        if changed and self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def _async_load(self) -> None:
+        """Load the compiled strings."""
+        self._loaded = True
+        if self._store is None:
+            return
+        try:
+            data = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load compiled translations: %s", err)
+            return
+        if isinstance(data, dict):
+            self._components.update(data.get("components", {}))
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"components": self._components}
+
+
 class _TranslationCache:
-    """Cache for flattened translations."""
+    """Cache for flattened translations.
+
+    The strings of each language are loaded once and shared, also when they
+    are the English fallback for another language. They are compiled into a
+    file per language, so they are loaded from a single file after a restart
+    instead of from the translation file of each integration. Languages are
+    loaded in parallel.
+    """
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the cache."""
         self.hass = hass
         self.loaded: dict[str, set[str]] = {}
         self.cache: dict[str, dict[str, dict[str, Any]]] = {}
+        self.strings: dict[str, dict[str, dict[str, Any]]] = {}
+        self._compiled: dict[str, _CompiledTranslations] = {}
+        self._fetch_locks: dict[str, asyncio.Lock] = {}
+        self._strings_locks: dict[str, asyncio.Lock] = {}
 
     async def async_fetch(
         self,
@@ -215,10 +314,11 @@ class _TranslationCache:
         components: set[str],
     ) -> list[dict[str, dict[str, Any]]]:
         """Load resources into the cache."""
-        components_to_load = components - self.loaded.setdefault(language, set())
+        async with self._fetch_locks.setdefault(language, asyncio.Lock()):
+            components_to_load = components - self.loaded.setdefault(language, set())
 
-        if components_to_load:
-            await self._async_load(language, components_to_load)
+            if components_to_load:
+                await self._async_load(language, components_to_load)
 
         cached = self.cache.get(language, {})
 
@@ -234,15 +334,48 @@ class _TranslationCache:
         # Fetch the English resources, as a fallback for missing keys
         languages = [LOCALE_EN] if language == LOCALE_EN else [LOCALE_EN, language]
         for translation_strings in await asyncio.gather(
-            *(
-                async_get_component_strings(self.hass, lang, components)
-                for lang in languages
-            )
+            *(self._async_get_strings(lang, components) for lang in languages)
         ):
             self._build_category_cache(language, components, translation_strings)
 
         self.loaded[language].update(components)
 
+    async def _async_get_strings(
+        self, language: str, components: set[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Return the strings of components, loading them on first use."""
+        async with self._strings_locks.setdefault(language, asyncio.Lock()):
+            strings = self.strings.setdefault(language, {})
+            if missing := components - strings.keys():
+                strings.update(await self._async_load_strings(language, missing))
+        return {component: strings[component] for component in components}
+
+    async def _async_load_strings(
+        self, language: str, components: set[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Load strings from the compiled file or the translation files."""
+        domains = list({component.split(".")[-1] for component in components})
+        integrations = dict(
+            zip(
+                domains,
+                await gather_with_concurrency(
+                    MAX_LOAD_CONCURRENTLY,
+                    *(async_get_integration(self.hass, domain) for domain in domains),
+                ),
+            )
+        )
+        if (compiled := self._compiled.get(language)) is None:
+            compiled = self._compiled[language] = _CompiledTranslations(
+                self.hass, language
+            )
+
+        strings = await compiled.async_get(components, integrations)
+        if missing := components - strings.keys():
+            loaded = await async_get_component_strings(self.hass, language, missing)
+            compiled.async_add(loaded, integrations)
+            strings.update(loaded)
+        return strings
+
     @callback
     def _build_category_cache(
         self,
@@ -292,8 +425,6 @@ async def async_get_translations(
     Otherwise default to loaded intgrations combined with config flow
     integrations if config_flow is true.
     """
-    lock = hass.data.setdefault(TRANSLATION_LOAD_LOCK, asyncio.Lock())
-
     if integration is not None:
         components = {integration}
     elif config_flow:
@@ -306,8 +437,8 @@ async def async_get_translations(
             component for component in hass.config.components if "." not in component
         }
 
-    async with lock:
-        cache = hass.data.setdefault(TRANSLATION_FLATTEN_CACHE, _TranslationCache(hass))
-        cached = await cache.async_fetch(language, category, components)
+    if (cache := hass.data.get(TRANSLATION_FLATTEN_CACHE)) is None:
+        cache = hass.data[TRANSLATION_FLATTEN_CACHE] = _TranslationCache(hass)
+    cached = await cache.async_fetch(language, category, components)
 
     return dict(ChainMap(*cached))
@@ -0,0 +1,194 @@
+"""Cache the results of config validation across restarts.
+
+Validating an unchanged config block with an unchanged schema gives the
+same result, so the result is stored in .storage keyed by a fingerprint of
+the config block and the integration version. Only results which are plain
+JSON are cached, validators which return objects like templates are run
+every time. Validation which logs warnings, like deprecated options, or which
+depends on the environment, like validators checking that a file exists, is
+not cached so it is repeated on every start. Config blocks which contain
+secrets are not cached, so the secrets are not copied out of secrets.yaml.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from enum import Enum
+import hashlib
+import json
+import logging
+from typing import Any, cast
+
+from homeassistant.const import __version__
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.loader import Integration
+from homeassistant.util.yaml.objects import NodeListClass
+
+from . import config_validation as cv
+from .storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_VALIDATION_CACHE = "config_validation_cache"
+STORAGE_KEY = "core.config_validation"
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+_DICT_TYPES = (dict, OrderedDict)
+_LIST_TYPES = (list, NodeListClass)
+_SCALAR_TYPES = (int, float, bool, type(None))
+
+
+class _WarningRecorder(logging.Handler):
+    """Record if a warning was logged."""
+
+    def __init__(self) -> None:
+        """Initialize the recorder."""
+        super().__init__(logging.WARNING)
+        self.warned = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Record a warning."""
+        self.warned = True
+
+
+def _is_plain(value: Any) -> bool:
+    """Return if a value is the same after a round trip through JSON."""
+    if type(value) in _SCALAR_TYPES:
+        return True
+    if isinstance(value, str):
+        return not isinstance(value, Enum)
+    if type(value) in _DICT_TYPES:
+        return all(
+            isinstance(key, str) and not isinstance(key, Enum) and _is_plain(item)
+            for key, item in value.items()
+        )
+    if type(value) in _LIST_TYPES:
+        return all(_is_plain(item) for item in value)
+    return False
+
+
+def _leaves(value: Any) -> Iterator[Any]:
+    """Return the scalar values of plain config."""
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _leaves(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _leaves(item)
+    else:
+        yield value
+
+
+def schema_key(integration: Integration, schema: str) -> str | None:
+    """Return the key of a schema of an integration, None if not cacheable.
+
+    The code of built-in integrations can change without a version change in
+    development versions.
+    """
+    if integration.is_built_in:
+        if "dev" in __version__:
+            return None
+        version = __version__
+    elif (version := integration.version) is None:
+        return None
+    return f"{integration.domain}@{version}:{schema}"
+
+
+class ValidationCache:
+    """Cache of config validation results."""
+
+    def __init__(self, data: dict[str, str] | None, store: Store | None = None) -> None:
+        """Initialize the cache."""
+        self._data = data or {}
+        self._store = store
+        self._used: set[str] = set()
+        self._secrets: set[Any] = set()
+
+    @callback
+    def async_add_secrets(self, values: list[Any]) -> None:
+        """Add the values of secrets, config containing them is not cached."""
+        for value in values:
+            self._secrets.update(_leaves(value))
+
+    @callback
+    def async_validate(
+        self, key: str | None, validator: Callable[[Any], Any], config: Any
+    ) -> Any:
+        """Validate config, reusing the result of an earlier validation.
+
+        Errors are raised by the validator and are not cached.
+        """
+        if (
+            key is None
+            or not _is_plain(config)
+            or any(leaf in self._secrets for leaf in _leaves(config))
+        ):
+            return validator(config)
+
+        text = json.dumps([key, config])
+        fingerprint = hashlib.sha256(text.encode()).hexdigest()
+
+        if (cached := self._data.get(fingerprint)) is not None:
+            self._used.add(fingerprint)
+            # Every caller gets its own copy
+            return json.loads(cached)
+
+        recorder = _WarningRecorder()
+        root_logger = logging.getLogger()
+        root_logger.addHandler(recorder)
+        token = cv.environment_cv.set(False)
+        try:
+            validated = validator(config)
+        finally:
+            environment = cv.environment_cv.get()
+            cv.environment_cv.reset(token)
+            root_logger.removeHandler(recorder)
+
+        if not recorder.warned and not environment and _is_plain(validated):
+            self._data[fingerprint] = json.dumps(validated)
+            self._used.add(fingerprint)
+            self._async_schedule_save()
+        return validated
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, str]:
+        """Return the results used since the start, others are stale."""
+        return {
+            fingerprint: text
+            for fingerprint, text in self._data.items()
+            if fingerprint in self._used
+        }
+
+
+async def async_get_validation_cache(hass: HomeAssistant) -> ValidationCache:
+    """Return the validation cache, loading it on first use."""
+    if (cache_or_evt := hass.data.get(DATA_VALIDATION_CACHE)) is None:
+        evt = hass.data[DATA_VALIDATION_CACHE] = asyncio.Event()
+
+        store = Store(hass, STORAGE_VERSION, STORAGE_KEY, private=True)
+        try:
+            data = await store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load the config validation cache: %s", err)
+            data = None
+
+        cache = hass.data[DATA_VALIDATION_CACHE] = ValidationCache(
+            cast("dict[str, str] | None", data), store
+        )
+        evt.set()
+        return cache
+
+    if isinstance(cache_or_evt, asyncio.Event):
+        await cache_or_evt.wait()
+        return cast(ValidationCache, hass.data[DATA_VALIDATION_CACHE])
+
+    return cast(ValidationCache, cache_or_evt)
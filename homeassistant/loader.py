@@ -24,6 +24,8 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from .const import __version__
+from .exceptions import HomeAssistantError
 from .generated.dhcp import DHCP
 from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
@@ -34,6 +36,7 @@ from .util.async_ import gather_with_concurrency
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
     from .core import HomeAssistant
+    from .helpers.storage import Store
 
 CALLABLE_T = TypeVar(  # pylint: disable=invalid-name
     "CALLABLE_T", bound=Callable[..., Any]
@@ -44,6 +47,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -59,6 +63,10 @@ MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 30
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -101,6 +109,139 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class ManifestIndex:
+    """Parsed manifests kept between runs.
+
+    Built-in manifests are reused as long as the Home Assistant version and
+    the modification time of the components directory are unchanged, so they
+    are not read at all. Development versions don't index built-in manifests
+    as those are edited in place. Custom manifests are reused as long as
+    their modification time is unchanged.
+
+    Manifests are looked up and added from executor threads.
+    """
+
+    def __init__(
+        self,
+        builtin_key: list[Any] | None,
+        data: dict[str, Any] | None,
+        store: Store | None = None,
+    ) -> None:
+        """Initialize the index from stored data."""
+        data = data or {}
+        self._store = store
+        self._builtin_key = builtin_key
+        self._builtin: dict[str, Manifest] = (
+            data.get("builtin", {})
+            if builtin_key is not None and data.get("builtin_key") == builtin_key
+            else {}
+        )
+        self._custom: dict[str, dict[str, Any]] = data.get("custom", {})
+        self.changed = False
+
+    def get(self, manifest_path: pathlib.Path, built_in: bool) -> Manifest | None:
+        """Return an indexed manifest if it is still up to date."""
+        if built_in:
+            manifest = self._builtin.get(manifest_path.parent.name)
+        elif (entry := self._custom.get(str(manifest_path))) is None:
+            return None
+        else:
+            try:
+                mtime = manifest_path.stat().st_mtime_ns
+            except OSError:
+                return None
+            manifest = entry["manifest"] if entry["mtime"] == mtime else None
+
+        return None if manifest is None else cast(Manifest, dict(manifest))
+
+    def add(
+        self, manifest_path: pathlib.Path, built_in: bool, manifest: Manifest
+    ) -> None:
+        """Add a manifest read from disk."""
+        manifest = cast(Manifest, dict(manifest))
+        if built_in:
+            if self._builtin_key is None:
+                return
+            self._builtin[manifest_path.parent.name] = manifest
+        else:
+            try:
+                mtime = manifest_path.stat().st_mtime_ns
+            except OSError:
+                return
+            self._custom[str(manifest_path)] = {"mtime": mtime, "manifest": manifest}
+        self.changed = True
+
+    def retain_custom(self, manifest_paths: set[str]) -> None:
+        """Drop the custom manifests which no longer exist."""
+        for manifest_path in set(self._custom) - manifest_paths:
+            del self._custom[manifest_path]
+            self.changed = True
+
+    def async_schedule_save(self) -> None:
+        """Save the index if manifests were added or dropped."""
+        if self._store is not None and self.changed:
+            self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self.changed = False
+        return {
+            "builtin_key": self._builtin_key,
+            "builtin": dict(self._builtin),
+            "custom": dict(self._custom),
+        }
+
+
+def _builtin_index_key(components_path: list[str]) -> list[Any] | None:
+    """Return the key built-in manifests are indexed under."""
+    if "dev" in __version__:
+        return None
+    try:
+        return [
+            __version__,
+            *(pathlib.Path(path).stat().st_mtime_ns for path in components_path),
+        ]
+    except OSError:
+        return None
+
+
+async def async_get_manifest_index(hass: HomeAssistant) -> ManifestIndex:
+    """Return the manifest index, loading it on first use."""
+    if (index_or_evt := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        evt = hass.data[DATA_MANIFEST_INDEX] = asyncio.Event()
+
+        # pylint: disable=import-outside-toplevel
+        from . import components
+        from .helpers.storage import Store
+
+        store = Store(
+            hass,
+            MANIFEST_INDEX_STORAGE_VERSION,
+            MANIFEST_INDEX_STORAGE_KEY,
+            private=True,
+        )
+        builtin_key = await hass.async_add_executor_job(
+            _builtin_index_key, components.__path__
+        )
+        try:
+            data = await store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load the manifest index: %s", err)
+            data = None
+
+        index = hass.data[DATA_MANIFEST_INDEX] = ManifestIndex(
+            builtin_key, cast("dict[str, Any] | None", data), store
+        )
+        evt.set()
+        return index
+
+    if isinstance(index_or_evt, asyncio.Event):
+        await index_or_evt.wait()
+        return cast(ManifestIndex, hass.data[DATA_MANIFEST_INDEX])
+
+    return cast(ManifestIndex, index_or_evt)
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -125,16 +266,23 @@ async def _async_get_custom_components(
     dirs = await hass.async_add_executor_job(
         get_sub_directories, custom_components.__path__
     )
+    index = await async_get_manifest_index(hass)
 
     integrations = await gather_with_concurrency(
         MAX_LOAD_CONCURRENTLY,
         *(
             hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
+                Integration.resolve_from_root,
+                hass,
+                custom_components,
+                comp.name,
+                index,
             )
             for comp in dirs
         ),
     )
+    index.retain_custom({str(comp / "manifest.json") for comp in dirs})
+    index.async_schedule_save()
 
     return {
         integration.domain: integration
@@ -314,22 +462,34 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        index: ManifestIndex | None = None,
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        built_in = root_module.__name__ == PACKAGE_BUILTIN
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
+            if (
+                index is None
+                or (manifest := index.get(manifest_path, built_in)) is None
+            ):
+                if not manifest_path.is_file():
+                    continue
 
-            try:
-                manifest = json.loads(manifest_path.read_text())
-            except ValueError as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                if index is not None:
+                    index.add(manifest_path, built_in, manifest)
 
             integration = cls(
                 hass,
@@ -608,9 +768,12 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from . import components  # pylint: disable=import-outside-toplevel
 
-    if integration := await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    ):
+    index = await async_get_manifest_index(hass)
+    integration = await hass.async_add_executor_job(
+        Integration.resolve_from_root, hass, components, domain, index
+    )
+    index.async_schedule_save()
+    if integration:
         return integration
 
     raise IntegrationNotFound(domain)
@@ -46,6 +46,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    startup_trace: bool = False
 
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):  # type: ignore[valid-type,misc]
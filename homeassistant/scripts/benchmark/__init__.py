@@ -6,6 +6,7 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+import copy
 from datetime import datetime
 import json
 import logging
@@ -35,21 +36,28 @@ def run(args):
     parser = argparse.ArgumentParser(description=("Run a Home Assistant benchmark."))
     parser.add_argument("name", choices=BENCHMARKS)
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--node-dump",
+        help="JSON file with the state of a Z-Wave JS node or a list of them",
+    )
 
     args = parser.parse_args()
 
     bench = BENCHMARKS[args.name]
+    kwargs = {}
+    if args.node_dump:
+        kwargs["node_dump"] = args.node_dump
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
 
     with suppress(KeyboardInterrupt):
         while True:
-            asyncio.run(run_benchmark(bench))
+            asyncio.run(run_benchmark(bench, **kwargs))
 
 
-async def run_benchmark(bench):
+async def run_benchmark(bench, **kwargs):
     """Run a benchmark."""
     hass = core.HomeAssistant()
-    runtime = await bench(hass)
+    runtime = await bench(hass, **kwargs)
     print(f"Benchmark {bench.__name__} done in {runtime}s")
     await hass.async_stop()
 
@@ -391,6 +399,50 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def zwave_js_discovery(hass, node_dump=None):
+    """Run Z-Wave JS discovery on a 250 node network built from a node dump."""
+    # pylint: disable=import-outside-toplevel
+    from zwave_js_server.model.node import Node
+
+    from homeassistant.components.zwave_js.discovery import async_discover_node_values
+    from homeassistant.helpers.device_registry import DeviceEntry
+
+    if node_dump is None:
+        raise ValueError("The zwave_js_discovery benchmark requires --node-dump")
+
+    # Recorded dumps may contain values that fail discovery
+    logging.getLogger("homeassistant.components.zwave_js").setLevel(logging.CRITICAL)
+
+    with open(node_dump, encoding="utf8") as fil:
+        node_states = json.load(fil)
+    if isinstance(node_states, dict):
+        node_states = [node_states]
+
+    nodes = []
+    for node_id in range(1, 251):
+        state = copy.deepcopy(node_states[node_id % len(node_states)])
+        state["nodeId"] = node_id
+        for value in state["values"]:
+            value["nodeId"] = node_id
+        nodes.append(Node(None, state))
+
+    devices = [DeviceEntry() for _ in nodes]
+    discovered_value_ids = collections.defaultdict(set)
+    count = 0
+
+    start = timer()
+
+    for node, device in zip(nodes, devices):
+        for _ in async_discover_node_values(node, device, discovered_value_ids):
+            count += 1
+
+    runtime = timer() - start
+    values = sum(len(node.values) for node in nodes)
+    print(f"Discovered {count} entities from {values} values")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -31,6 +31,7 @@ BASE_PLATFORMS = {platform.value for platform in Platform}
 DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP_TIME = "setup_time"
+DATA_SETUP_TIMELINE = "setup_timeline"
 
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
@@ -48,6 +49,68 @@ def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: set[str])
     hass.data[DATA_SETUP_DONE] = {domain: asyncio.Event() for domain in domains}
 
 
+@core.callback
+def async_enable_setup_timeline(hass: core.HomeAssistant) -> None:
+    """Record the phases of setting up integrations from now on."""
+    hass.data[DATA_SETUP_TIMELINE] = []
+
+
+@contextlib.contextmanager
+def async_setup_phase(
+    hass: core.HomeAssistant, integration: str, phase: str, **args: Any
+) -> Generator[None, None, None]:
+    """Record a phase of setting up an integration on the setup timeline."""
+    if (timeline := hass.data.get(DATA_SETUP_TIMELINE)) is None:
+        yield
+        return
+
+    start = timer()
+    try:
+        yield
+    finally:
+        timeline.append((integration, phase, start, timer(), args))
+
+
+@core.callback
+def async_setup_timeline_trace(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Return the setup timeline in the trace event format.
+
+    Each integration is shown as a thread, which can be loaded in trace
+    viewers like chrome://tracing or Perfetto.
+    """
+    timeline = hass.data.get(DATA_SETUP_TIMELINE, [])
+    origin = min((start for _, _, start, _, _ in timeline), default=0)
+    threads: dict[str, int] = {}
+    events: list[dict[str, Any]] = []
+
+    for integration, phase, start, end, args in timeline:
+        if (tid := threads.get(integration)) is None:
+            tid = threads[integration] = len(threads) + 1
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": integration},
+                }
+            )
+        events.append(
+            {
+                "name": phase,
+                "cat": "setup",
+                "ph": "X",
+                "pid": 1,
+                "tid": tid,
+                "ts": round((start - origin) * 1_000_000),
+                "dur": round((end - start) * 1_000_000),
+                "args": args,
+            }
+        )
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
 def setup_component(hass: core.HomeAssistant, domain: str, config: ConfigType) -> bool:
     """Set up a component and all its dependencies."""
     return asyncio.run_coroutine_threadsafe(
@@ -120,9 +183,15 @@ async def _async_process_dependencies(
         )
 
     async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+        with async_setup_phase(
+            hass,
+            integration.domain,
+            "dependencies",
+            waiting_on=[*dependencies_tasks, *after_dependencies_tasks],
+        ):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -177,7 +246,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_setup_phase(hass, domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -185,9 +255,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with async_setup_phase(hass, domain, "config"):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -258,12 +329,13 @@ async def _async_setup_component(
         await asyncio.sleep(0)
         await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-        await asyncio.gather(
-            *(
-                entry.async_setup(hass, integration=integration)
-                for entry in hass.config_entries.async_entries(domain)
+        with async_setup_phase(hass, domain, "config_entries"):
+            await asyncio.gather(
+                *(
+                    entry.async_setup(hass, integration=integration)
+                    for entry in hass.config_entries.async_entries(domain)
+                )
             )
-        )
 
         hass.config.components.add(domain)
 
@@ -349,9 +421,10 @@ async def async_process_deps_reqs(
 
     if not hass.config.skip_pip and integration.requirements:
         async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+            with async_setup_phase(hass, integration.domain, "requirements"):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
@@ -437,6 +510,7 @@ def async_start_setup(
     """Keep track of when setup starts and finishes."""
     setup_started = hass.data.setdefault(DATA_SETUP_STARTED, {})
     started = dt_util.utcnow()
+    start = timer()
     unique_components = {}
     for domain in components:
         unique = ensure_unique_string(domain, setup_started)
@@ -447,13 +521,18 @@ def async_start_setup(
 
     setup_time = hass.data.setdefault(DATA_SETUP_TIME, {})
     time_taken = dt_util.utcnow() - started
+    timeline = hass.data.get(DATA_SETUP_TIMELINE)
     for unique, domain in unique_components.items():
         del setup_started[unique]
         if "." in domain:
-            _, integration = domain.split(".", 1)
+            platform, integration = domain.split(".", 1)
+            phase, args = "platform", {"platform": platform}
         else:
             integration = domain
+            phase, args = "setup", {}
         if integration in setup_time:
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+        if timeline is not None:
+            timeline.append((integration, phase, start, timer(), args))
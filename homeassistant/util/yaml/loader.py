@@ -31,6 +31,8 @@ class Secrets:
         """Initialize secrets."""
         self.config_dir = config_dir
         self._cache: dict[Path, dict[str, str]] = {}
+        # Values of the secrets used in the loaded YAML
+        self.used_values: list[Any] = []
 
     def get(self, requester_path: str, secret: str) -> str:
         """Return the value of a secret."""
@@ -54,6 +56,7 @@ class Secrets:
                     secret,
                     secret_dir,
                 )
+                self.used_values.append(secrets[secret])
                 return secrets[secret]
 
         raise HomeAssistantError(f"Secret {secret} not defined")
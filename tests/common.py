@@ -1091,8 +1091,6 @@ async def flush_store(store):
     if store._data is None:
         return
 
-    store._async_cleanup_final_write_listener()
-    store._async_cleanup_delay_listener()
     await store._async_handle_write_data()
 
 
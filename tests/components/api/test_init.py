@@ -489,6 +489,63 @@ async def test_states_view_filters(hass, mock_api_client, hass_admin_user):
     assert json[0]["entity_id"] == "test.entity"
 
 
+async def test_api_get_states_etag(hass, mock_api_client):
+    """Test unchanged states are not sent again."""
+    hass.states.async_set("test.entity", "hello")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    hass.states.async_set("test.entity", "world")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+
+
+async def test_api_get_states_since(hass, mock_api_client, hass_admin_user):
+    """Test getting the states changed since a version."""
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"test.entity": True, "test.removed": True}}}
+    )
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.removed", "hello")
+    hass.states.async_set("test.not_visible_entity", "invisible")
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": 0})
+    assert resp.status == HTTPStatus.OK
+    data = await resp.json()
+    assert data["full"] is True
+    assert data["removed"] == []
+    assert {state["entity_id"] for state in data["changed"]} == {
+        "test.entity",
+        "test.removed",
+    }
+    version = data["version"]
+
+    hass.states.async_set("test.entity", "world")
+    hass.states.async_set("test.not_visible_entity", "still invisible")
+    hass.states.async_remove("test.removed")
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": version})
+    assert resp.status == HTTPStatus.OK
+    data = await resp.json()
+    assert data["full"] is False
+    assert data["version"] == hass.states.version
+    assert [state["entity_id"] for state in data["changed"]] == ["test.entity"]
+    assert data["changed"][0]["state"] == "world"
+    assert data["removed"] == ["test.removed"]
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": "abc"})
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_get_entity_state_read_perm(hass, mock_api_client, hass_admin_user):
     """Test getting a state requires read permission."""
     hass_admin_user.mock_policy({})
@@ -579,6 +579,60 @@ async def test_reload_config_service(hass, calls, hass_admin_user, hass_read_onl
     assert calls[1].data.get("event") == "test_event2"
 
 
+async def test_reload_only_changed_automations(hass, calls):
+    """Test reloading only rebuilds the automations which changed."""
+    unchanged = {
+        "id": "unchanged",
+        "alias": "unchanged",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    changed = {
+        "id": "changed",
+        "alias": "changed",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    removed = {
+        "alias": "removed",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: [unchanged, changed, removed]}
+    )
+    component = hass.data[automation.DOMAIN]
+    unchanged_entity = component.get_entity("automation.unchanged")
+    changed_entity = component.get_entity("automation.changed")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            automation.DOMAIN: [
+                unchanged,
+                {**changed, "trigger": {"platform": "event", "event_type": "other"}},
+            ]
+        },
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    assert component.get_entity("automation.unchanged") is unchanged_entity
+    assert component.get_entity("automation.changed") is not changed_entity
+    assert hass.states.get("automation.changed") is not None
+    assert hass.states.get("automation.removed") is None
+    assert len(list(component.entities)) == 2
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    hass.bus.async_fire("other")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
 async def test_reload_config_when_invalid_config(hass, calls):
     """Test the reload config service handling invalid config."""
     with assert_setup_component(1, automation.DOMAIN):
@@ -655,7 +709,9 @@ async def test_reload_config_handles_load_fails(hass, calls):
     assert len(calls) == 2
 
 
-@pytest.mark.parametrize("service", ["turn_off_stop", "turn_off_no_stop", "reload"])
+@pytest.mark.parametrize(
+    "service", ["turn_off_stop", "turn_off_no_stop", "reload", "reload_unchanged"]
+)
 async def test_automation_stops(hass, calls, service):
     """Test that turning off / reloading stops any running actions as appropriate."""
     entity_id = "automation.hello"
@@ -701,6 +757,13 @@ async def test_automation_stops(hass, calls, service):
             blocking=True,
         )
     else:
+        if service == "reload":
+            config = {
+                automation.DOMAIN: {
+                    **config[automation.DOMAIN],
+                    "description": "changed",
+                }
+            }
         with patch(
             "homeassistant.config.load_yaml_config_file",
             autospec=True,
@@ -713,7 +776,9 @@ async def test_automation_stops(hass, calls, service):
     hass.states.async_set(test_entity, "goodbye")
     await hass.async_block_till_done()
 
-    assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
+    assert len(calls) == (
+        1 if service in ("turn_off_no_stop", "reload_unchanged") else 0
+    )
 
 
 async def test_automation_restore_state(hass):
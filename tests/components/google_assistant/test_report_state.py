@@ -1,12 +1,13 @@
 """Test Google report state."""
 from datetime import timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from homeassistant.components.google_assistant import error, report_state
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
-from . import BASIC_CONFIG
+from . import BASIC_CONFIG, MockConfig
 
 from tests.common import async_fire_time_changed
 
@@ -123,3 +124,71 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_caches_exposure(hass, legacy_patchable_time):
+    """Test exposure decisions are cached until the configuration changes."""
+    should_expose = Mock(side_effect=lambda state: state.entity_id != "light.hidden")
+    config = MockConfig(hass=hass, should_expose=should_expose)
+    hass.states.async_set("light.ceiling", "off")
+
+    with patch.object(config, "async_report_state_all", AsyncMock()), patch.object(
+        report_state, "INITIAL_REPORT_DELAY", 0
+    ):
+        unsub = report_state.async_enable_report_state(hass, config)
+
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    serialized = []
+    orig_query_serialize = report_state.GoogleEntity.query_serialize
+
+    def query_serialize(entity):
+        serialized.append(entity.entity_id)
+        return orig_query_serialize(entity)
+
+    with patch.object(
+        config, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(
+        report_state.GoogleEntity, "query_serialize", query_serialize
+    ):
+        for state in ("on", "off", "on"):
+            hass.states.async_set("light.hidden", state)
+            hass.states.async_set("light.ceiling", state)
+            await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+    assert [call[1][0].entity_id for call in should_expose.mock_calls] == [
+        "light.ceiling",
+        "light.hidden",
+    ]
+    assert serialized == ["light.ceiling"] * 3
+    assert mock_report.mock_calls[-1][1][0] == {
+        "devices": {"states": {"light.ceiling": {"on": True, "online": True}}}
+    }
+
+    should_expose.reset_mock()
+    config.async_exposure_changed()
+    await hass.async_block_till_done()
+    hass.states.async_set("light.hidden", "off")
+    await hass.async_block_till_done()
+    assert [call[1][0].entity_id for call in should_expose.mock_calls] == [
+        "light.hidden"
+    ]
+
+    should_expose.reset_mock()
+    hass.bus.async_fire(
+        EVENT_ENTITY_REGISTRY_UPDATED,
+        {"action": "update", "entity_id": "light.hidden", "changes": {}},
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.hidden", "on")
+    await hass.async_block_till_done()
+    assert [call[1][0].entity_id for call in should_expose.mock_calls] == [
+        "light.hidden"
+    ]
+
+    unsub()
@@ -170,6 +170,39 @@ async def test_allgroup_turn_on_if_last_turns_on(hass):
     assert group_state.state == STATE_ON
 
 
+async def test_group_follows_member_changes(hass):
+    """Test the state of any and all groups follows changes of single members."""
+    entity_ids = [f"light.light_{idx}" for idx in range(5)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+
+    assert await async_setup_component(hass, "group", {})
+
+    any_group = await group.Group.async_create_group(
+        hass, "any_group", entity_ids, False
+    )
+    all_group = await group.Group.async_create_group(
+        hass, "all_group", entity_ids, False, mode=True
+    )
+    await hass.async_block_till_done()
+
+    for idx, entity_id in enumerate(entity_ids):
+        hass.states.async_set(entity_id, STATE_ON)
+        await hass.async_block_till_done()
+        assert hass.states.get(any_group.entity_id).state == STATE_ON
+        assert hass.states.get(all_group.entity_id).state == (
+            STATE_ON if idx == len(entity_ids) - 1 else STATE_OFF
+        )
+
+    for idx, entity_id in enumerate(entity_ids):
+        hass.states.async_set(entity_id, STATE_OFF)
+        await hass.async_block_till_done()
+        assert hass.states.get(any_group.entity_id).state == (
+            STATE_OFF if idx == len(entity_ids) - 1 else STATE_ON
+        )
+        assert hass.states.get(all_group.entity_id).state == STATE_OFF
+
+
 async def test_expand_entity_ids(hass):
     """Test expand_entity_ids method."""
     hass.states.async_set("light.Bowl", STATE_ON)
@@ -8,8 +8,11 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components.history_stats import DOMAIN
-from homeassistant.components.history_stats.sensor import HistoryStatsSensor
-from homeassistant.const import SERVICE_RELOAD, STATE_UNKNOWN
+from homeassistant.components.history_stats.sensor import (
+    HistoryStatsSensor,
+    HistoryStatsWindow,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, SERVICE_RELOAD, STATE_UNKNOWN
 import homeassistant.core as ha
 from homeassistant.helpers.template import Template
 from homeassistant.setup import async_setup_component, setup_component
@@ -423,3 +426,127 @@ async def async_test_measure(hass):
     assert hass.states.get("sensor.sensor2").state == STATE_UNKNOWN
     assert hass.states.get("sensor.sensor3").state == "2"
     assert hass.states.get("sensor.sensor4").state == "50.0"
+
+
+async def test_measure_incremental(hass):
+    """Test the history is loaded once and then kept up to date from state changes."""
+    await async_init_recorder_component(hass)
+
+    t0 = dt_util.utcnow() - timedelta(minutes=40)
+    t1 = t0 + timedelta(minutes=20)
+    t2 = t1 + timedelta(minutes=10)
+
+    # Start     t0        t1        t2        End
+    # |--20min--|--20min--|--10min--|--10min--|
+    # |---off---|---on----|---off---|---on----|
+
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ha.State("binary_sensor.test_id", "off", last_changed=t1),
+        ]
+    }
+
+    await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "sensor1",
+                    "state": "on",
+                    "start": "{{ as_timestamp(now()) - 3600 }}",
+                    "end": "{{ now() }}",
+                    "type": "count",
+                },
+            ]
+        },
+    )
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_changes, patch(
+        "homeassistant.components.recorder.history.get_state", return_value=None
+    ):
+        await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "1"
+
+        hass.bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "binary_sensor.test_id",
+                "new_state": ha.State("binary_sensor.test_id", "on", last_changed=t2),
+            },
+        )
+        await hass.async_block_till_done()
+
+        # The period moved on, only the state change is added
+        with patch(
+            "homeassistant.util.dt.now",
+            return_value=dt_util.now() + timedelta(seconds=2),
+        ):
+            await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+            await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "2"
+    assert len(mock_changes.mock_calls) == 1
+
+
+async def test_measure_whole_period(hass):
+    """Test an entity which is in a measured state for the whole period."""
+    await async_init_recorder_component(hass)
+
+    t0 = dt_util.utcnow() - timedelta(hours=2)
+
+    await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "sensor1",
+                    "state": "on",
+                    "start": "{{ as_timestamp(now()) - 3600 }}",
+                    "end": "{{ now() }}",
+                    "type": "time",
+                },
+            ]
+        },
+    )
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        return_value={},
+    ), patch(
+        "homeassistant.components.recorder.history.get_state",
+        return_value=ha.State("binary_sensor.test_id", "on", last_changed=t0),
+    ):
+        await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "1.0"
+
+
+def test_window_changes_slid_out():
+    """Test the period is measured once the last change slid out of it."""
+    window = HistoryStatsWindow(1000.0, True)
+    assert window.measure(1000.0, 4600.0) == (3600.0, 0)
+
+    window.add(2000.0, False)
+    window.add(3000.0, True)
+    assert window.measure(1000.0, 4600.0) == (2600.0, 1)
+
+    window.prune(3500.0)
+    assert window.measure(3500.0, 7100.0) == (3600.0, 0)
+
+    window = HistoryStatsWindow(1000.0, None)
+    assert window.measure(1000.0, 4600.0) is None
+    window.add(2000.0, False)
+    assert window.measure(1000.0, 4600.0) == (0.0, 0)
@@ -0,0 +1,195 @@
+"""The tests for http static files."""
+import gzip
+from http import HTTPStatus
+import os
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from aiohttp.test_utils import make_mocked_request
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.components.http.static import CACHE_HEADERS, CachingStaticResource
+from homeassistant.setup import async_setup_component
+
+
+@pytest.fixture
+async def static_path(hass, tmp_path):
+    """Register a static path with files and precompressed variants."""
+    (tmp_path / "app.js").write_text("console.log('app');")
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"console.log('app');"))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "style.css").write_text("body {}")
+    (tmp_path / "empty.txt").write_text("")
+    (tmp_path / "folder").mkdir()
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_static_path("/static", str(tmp_path))
+    await hass.async_block_till_done()
+    return tmp_path
+
+
+def _static_resource(hass):
+    """Return the resource of the static path."""
+    return next(
+        resource
+        for resource in hass.http.app.router.resources()
+        if isinstance(resource, CachingStaticResource)
+    )
+
+
+async def test_serve_file(hass, hass_client, static_path):
+    """Test files are served with cache headers and can be revalidated."""
+    client = await hass_client()
+
+    resp = await client.get("/static/style.css", headers={"Accept-Encoding": ""})
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "body {}"
+    assert resp.headers["Content-Type"].startswith("text/css")
+    assert resp.headers["Cache-Control"] == CACHE_HEADERS["Cache-Control"]
+    assert "Vary" not in resp.headers
+    etag = resp.headers["ETag"]
+
+    # Revalidating a file does not open it
+    with patch("pathlib.Path.open", side_effect=OSError):
+        resp = await client.get("/static/style.css", headers={"If-None-Match": etag})
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers["ETag"] == etag
+
+    resp = await client.get("/static/empty.txt")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == ""
+
+    resp = await client.head("/static/style.css")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Length"] == "7"
+
+
+async def test_serve_precompressed(hass, hass_client, static_path):
+    """Test precompressed variants are served to clients accepting them."""
+    client = await hass_client()
+
+    async with ClientSession(auto_decompress=False) as session:
+        resp = await session.get(
+            client.make_url("/static/app.js"), headers={"Accept-Encoding": "gzip, br"}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["Content-Encoding"] == "br"
+        assert resp.headers["Vary"] == "Accept-Encoding"
+        assert await resp.read() == b"brotli"
+
+    resp = await client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip, br;q=0"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert await resp.text() == "console.log('app');"
+
+    resp = await client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert resp.status == HTTPStatus.OK
+    assert "Content-Encoding" not in resp.headers
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert await resp.text() == "console.log('app');"
+
+    resp = await client.get(
+        "/static/app.js", headers={"Range": "bytes=0-6", "Accept-Encoding": ""}
+    )
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert await resp.text() == "console"
+
+
+async def test_index_refresh(hass, hass_client, static_path):
+    """Test files added, changed and removed after indexing."""
+    client = await hass_client()
+
+    (static_path / "new.txt").write_text("new")
+    resp = await client.get("/static/new.txt")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "new"
+
+    (static_path / "style.css").write_text("body { color: red; }")
+    resp = await client.get("/static/style.css")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "body { color: red; }"
+
+    (static_path / "new.txt").unlink()
+    resp = await client.get("/static/new.txt")
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_index_growth(hass, hass_client, static_path):
+    """Test other spellings of paths and files over the limit are not indexed."""
+    resource = _static_resource(hass)
+    client = await hass_client()
+    (static_path / "folder" / "new.txt").write_text("new")
+
+    for path in ("folder//new.txt", "folder///new.txt"):
+        resp = await client.get(f"/static/{path}")
+        assert resp.status == HTTPStatus.OK
+        assert await resp.text() == "new"
+    assert not any("//" in rel_url for rel_url in resource._index)
+
+    resp = await client.get("/static/folder/new.txt")
+    assert resp.status == HTTPStatus.OK
+    assert "folder/new.txt" in resource._index
+
+    (static_path / "other.txt").write_text("other")
+    with patch.object(static, "MAX_INDEXED_FILES", len(resource._index)):
+        resp = await client.get("/static/other.txt")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "other"
+    assert "other.txt" not in resource._index
+
+
+async def test_file_opened_when_sent(hass, static_path):
+    """Test files are not opened for responses which are never sent."""
+    request = make_mocked_request(
+        "GET", "/static/style.css", match_info={"filename": "style.css"}
+    )
+    with patch.object(static, "_open_file", wraps=static._open_file) as open_file:
+        response = await _static_resource(hass)._handle(request)
+    assert isinstance(response, static.IndexedFileResponse)
+    assert not open_file.called
+
+
+async def test_revalidate_changed_file(hass, hass_client, static_path):
+    """Test revalidating a file changed since the client fetched it."""
+    client = await hass_client()
+
+    resp = await client.get("/static/style.css", headers={"Accept-Encoding": ""})
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+    last_modified = resp.headers["Last-Modified"]
+
+    (static_path / "style.css").write_text("body { color: blue; }")
+    stat = (static_path / "style.css").stat()
+    os.utime(static_path / "style.css", (stat.st_atime, stat.st_mtime + 10))
+
+    resp = await client.get("/static/style.css", headers={"If-None-Match": etag})
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "body { color: blue; }"
+    assert resp.headers["ETag"] != etag
+
+    resp = await client.get(
+        "/static/style.css", headers={"If-Modified-Since": last_modified}
+    )
+    assert resp.status == HTTPStatus.OK
+
+    (static_path / "style.css").unlink()
+    resp = await client.get(
+        "/static/style.css", headers={"If-None-Match": resp.headers["ETag"]}
+    )
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_not_found(hass, hass_client, static_path):
+    """Test missing files, directories and paths outside the directory."""
+    client = await hass_client()
+
+    resp = await client.get("/static/missing.js")
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+    resp = await client.get("/static/folder")
+    assert resp.status == HTTPStatus.FORBIDDEN
+
+    resp = await client.get("/static/%2E%2E/secret.txt")
+    assert resp.status in (HTTPStatus.FORBIDDEN, HTTPStatus.NOT_FOUND)
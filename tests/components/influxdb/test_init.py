@@ -245,6 +245,18 @@ async def test_setup_config_full(hass, mock_client, config_ext, get_write_api):
                 "ssl_ca_cert": "fake/path/ca.pem",
             },
         ),
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            {"gzip": True},
+            {"gzip": True},
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            {"api_version": influxdb.API_VERSION_2, "gzip": True},
+            {"enable_gzip": True},
+        ),
     ],
     indirect=["mock_client"],
 )
@@ -0,0 +1,51 @@
+"""Test InfluxDB system health."""
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.influxdb.const import DOMAIN
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_influxdb_system_health(hass):
+    """Test InfluxDB system health."""
+    hass.bus.listen = MagicMock()
+    assert await async_setup_component(hass, "system_health", {})
+    with patch("homeassistant.components.influxdb.InfluxDBClient"), patch(
+        "homeassistant.components.influxdb.InfluxThread.batch_timeout",
+        return_value=0,
+    ):
+        assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"host": "host"}})
+        await hass.async_block_till_done()
+
+        handler_method = hass.bus.listen.call_args_list[0][0][1]
+        state = MagicMock(
+            state=1,
+            domain="fake",
+            entity_id="fake.entity",
+            object_id="entity",
+            attributes={},
+        )
+        handler_method(MagicMock(data={"new_state": state}, time_fired=12345))
+        hass.data[DOMAIN].block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+
+    assert info.pop("write_latency").endswith(" ms")
+    assert info == {
+        "connected": True,
+        "queue_depth": 0,
+        "writes_in_flight": 0,
+        "written_points": 1,
+        "dropped_points": 0,
+    }
+
+
+async def test_influxdb_system_health_not_connected(hass):
+    """Test InfluxDB system health before connecting."""
+    hass.config.components.add(DOMAIN)
+    assert await async_setup_component(hass, "system_health", {})
+
+    info = await get_system_health_info(hass, DOMAIN)
+
+    assert info == {"connected": False}
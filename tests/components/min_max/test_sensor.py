@@ -1,4 +1,5 @@
 """The test for the min/max sensor platform."""
+from datetime import timedelta
 import statistics
 from unittest.mock import patch
 
@@ -14,8 +15,9 @@ from homeassistant.const import (
     TEMP_FAHRENHEIT,
 )
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
-from tests.common import get_fixture_path
+from tests.common import async_fire_time_changed, get_fixture_path
 
 VALUES = [17, 20, 15.3]
 COUNT = len(VALUES)
@@ -343,6 +345,89 @@ async def test_last_sensor(hass):
     assert state.attributes.get("median") == MEDIAN
 
 
+async def test_changing_values(hass):
+    """Test the values follow changes of the sensors."""
+    config = {
+        "sensor": {
+            "platform": "min_max",
+            "name": "test_max",
+            "type": "max",
+            "entity_ids": ["sensor.test_1", "sensor.test_2", "sensor.test_3"],
+        }
+    }
+
+    assert await async_setup_component(hass, "sensor", config)
+    await hass.async_block_till_done()
+
+    entity_ids = config["sensor"]["entity_ids"]
+    values = dict(zip(entity_ids, VALUES))
+
+    for entity_id, value in values.items():
+        hass.states.async_set(entity_id, value)
+    await hass.async_block_till_done()
+
+    for entity_id, value in (
+        ("sensor.test_2", 10),
+        ("sensor.test_3", 17),
+        ("sensor.test_1", 4),
+        ("sensor.test_3", STATE_UNKNOWN),
+        ("sensor.test_2", 4),
+    ):
+        hass.states.async_set(entity_id, value)
+        await hass.async_block_till_done()
+        if value == STATE_UNKNOWN:
+            values.pop(entity_id)
+        else:
+            values[entity_id] = value
+
+        state = hass.states.get("sensor.test_max")
+        max_value = max(values.values())
+        min_value = min(values.values())
+        assert state.state == str(float(max_value))
+        assert state.attributes["max_entity_id"] == next(
+            ent_id for ent_id in entity_ids if values.get(ent_id) == max_value
+        )
+        assert state.attributes["min_value"] == min_value
+        assert state.attributes["min_entity_id"] == next(
+            ent_id for ent_id in entity_ids if values.get(ent_id) == min_value
+        )
+        assert state.attributes["mean"] == round(sum(values.values()) / len(values), 2)
+        assert state.attributes["median"] == round(
+            statistics.median(values.values()), 2
+        )
+
+
+async def test_debounce(hass):
+    """Test state writes are debounced."""
+    config = {
+        "sensor": {
+            "platform": "min_max",
+            "name": "test_last",
+            "type": "last",
+            "entity_ids": ["sensor.test_1", "sensor.test_2"],
+            "debounce": 10,
+        }
+    }
+
+    assert await async_setup_component(hass, "sensor", config)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test_1", 1)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_last").state == "1.0"
+
+    hass.states.async_set("sensor.test_2", 2)
+    hass.states.async_set("sensor.test_1", 3)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_last").state == "1.0"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.test_last")
+    assert state.state == "3.0"
+    assert state.attributes["max_value"] == 3.0
+
+
 async def test_reload(hass):
     """Verify we can reload filter sensors."""
     hass.states.async_set("sensor.test_1", 12345)
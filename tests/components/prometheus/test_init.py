@@ -19,11 +19,13 @@ from homeassistant.const import (
     CONTENT_TYPE_TEXT_PLAIN,
     DEGREE,
     ENERGY_KILO_WATT_HOUR,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import split_entity_id
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
@@ -726,14 +728,109 @@ async def test_counter(hass, hass_client):
     )
 
 
+async def test_state_change_counter(hass, hass_client):
+    """Test state changes are counted and removed entities are dropped."""
+    client = await setup_prometheus_client(hass, hass_client, "")
+
+    hass.states.async_set("automation.alarm", "on", {"friendly_name": "Alarm"})
+    hass.states.async_set("automation.alarm", "off", {"friendly_name": "Alarm"})
+    hass.states.async_set(
+        "automation.alarm", STATE_UNAVAILABLE, {"friendly_name": "Alarm"}
+    )
+    hass.states.async_set("automation.alarm", STATE_UNKNOWN, {"friendly_name": "Alarm"})
+    hass.states.async_set("automation.idle", STATE_UNKNOWN, {"friendly_name": "Idle"})
+    hass.states.async_set("switch.fan", "on")
+    await hass.async_block_till_done()
+
+    body = await generate_latest_metrics(client)
+
+    assert (
+        'state_change_total{domain="automation",'
+        'entity="automation.alarm",'
+        'friendly_name="Alarm"} 4.0' in body
+    )
+    assert (
+        'automation_triggered_count_total{domain="automation",'
+        'entity="automation.alarm",'
+        'friendly_name="Alarm"} 2.0' in body
+    )
+    assert not any(
+        line.startswith("automation_triggered_count_total")
+        and ("switch.fan" in line or "automation.idle" in line)
+        for line in body
+    )
+    assert any(line.startswith("switch_state") for line in body)
+
+    hass.states.async_remove("switch.fan")
+    await hass.async_block_till_done()
+
+    body = await generate_latest_metrics(client)
+    assert not any(line.startswith("switch_state") for line in body)
+
+
+async def test_collect_caches_entity_samples(hass, hass_client):
+    """Test samples are only rebuilt when the state object changes."""
+    await setup_prometheus_client(hass, hass_client, "")
+    metrics = next(
+        collector
+        for collector in prometheus_client.REGISTRY._collector_to_names
+        if isinstance(collector, prometheus.PrometheusMetrics)
+    )
+
+    hass.states.async_set("switch.fan", "on")
+    hass.states.async_set("switch.light", "on")
+
+    with mock.patch.object(
+        metrics, "_state_samples", wraps=metrics._state_samples
+    ) as state_samples:
+        metrics.collect()
+        assert state_samples.call_count == 2
+
+        metrics.collect()
+        assert state_samples.call_count == 2
+
+        hass.states.async_set("switch.fan", "off")
+        metrics.collect()
+        assert state_samples.call_count == 3
+
+
+async def test_unregister_on_stop(hass, hass_client):
+    """Test the collector is unregistered when Home Assistant stops."""
+    await setup_prometheus_client(hass, hass_client, "")
+    assert any(
+        isinstance(collector, prometheus.PrometheusMetrics)
+        for collector in prometheus_client.REGISTRY._collector_to_names
+    )
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert not any(
+        isinstance(collector, prometheus.PrometheusMetrics)
+        for collector in prometheus_client.REGISTRY._collector_to_names
+    )
+
+
+async def test_scrape_cache_time(hass):
+    """Test scrape results are reused while the scrape cache is valid."""
+    metrics = prometheus.PrometheusMetrics(
+        hass, lambda entity_id: True, "", TEMP_CELSIUS, None, None, None, 10
+    )
+    hass.states.async_set("switch.fan", "on")
+
+    with mock.patch(f"{PROMETHEUS_PATH}.time.monotonic", return_value=100):
+        first = metrics.collect()
+        hass.states.async_set("switch.fan", "off")
+        assert metrics.collect() is first
+
+    with mock.patch(f"{PROMETHEUS_PATH}.time.monotonic", return_value=111):
+        assert metrics.collect() is not first
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
     with mock.patch(f"{PROMETHEUS_PATH}.prometheus_client") as client:
-        counter_client = mock.MagicMock()
-        client.Counter = mock.MagicMock(return_value=counter_client)
-        setattr(counter_client, "labels", mock.MagicMock(return_value=mock.MagicMock()))
-        yield counter_client
+        yield client
 
 
 @pytest.fixture
@@ -779,32 +876,29 @@ async def test_full_config(hass, mock_client):
     assert hass.bus.listen.call_args_list[0][0][0] == EVENT_STATE_CHANGED
 
 
-def make_event(entity_id):
-    """Make a mock event for test."""
-    domain = split_entity_id(entity_id)[0]
-    state = mock.MagicMock(
-        state="not blank",
-        domain=domain,
-        entity_id=entity_id,
-        object_id="entity",
-        attributes={},
-    )
-    return mock.MagicMock(data={"new_state": state}, time_fired=12345)
-
-
-async def _setup(hass, filter_config):
+async def _setup(hass, mock_client, filter_config):
     """Shared set up for filtering tests."""
     config = {prometheus.DOMAIN: {"filter": filter_config}}
     assert await async_setup_component(hass, prometheus.DOMAIN, config)
     await hass.async_block_till_done()
-    return hass.bus.listen.call_args_list[0][0][1]
+    return mock_client.REGISTRY.register.call_args[0][0]
+
+
+def _collected_entities(metrics):
+    """Return the entities with samples in a scrape."""
+    return {
+        sample.labels["entity"]
+        for family in metrics.collect()
+        for sample in family.samples
+    }
 
 
 @pytest.mark.usefixtures("mock_bus")
 async def test_allowlist(hass, mock_client):
     """Test an allowlist only config."""
-    handler_method = await _setup(
+    metrics = await _setup(
         hass,
+        mock_client,
         {
             "include_domains": ["fake"],
             "include_entity_globs": ["test.included_*"],
@@ -822,19 +916,19 @@ async def test_allowlist(hass, mock_client):
     ]
 
     for test in tests:
-        event = make_event(test.id)
-        handler_method(event)
+        hass.states.async_set(test.id, "not blank")
 
-        was_called = mock_client.labels.call_count == 1
-        assert test.should_pass == was_called
-        mock_client.labels.reset_mock()
+    entities = _collected_entities(metrics)
+    for test in tests:
+        assert test.should_pass == (test.id in entities)
 
 
 @pytest.mark.usefixtures("mock_bus")
 async def test_denylist(hass, mock_client):
     """Test a denylist only config."""
-    handler_method = await _setup(
+    metrics = await _setup(
         hass,
+        mock_client,
         {
             "exclude_domains": ["fake"],
             "exclude_entity_globs": ["test.excluded_*"],
@@ -852,19 +946,19 @@ async def test_denylist(hass, mock_client):
     ]
 
     for test in tests:
-        event = make_event(test.id)
-        handler_method(event)
+        hass.states.async_set(test.id, "not blank")
 
-        was_called = mock_client.labels.call_count == 1
-        assert test.should_pass == was_called
-        mock_client.labels.reset_mock()
+    entities = _collected_entities(metrics)
+    for test in tests:
+        assert test.should_pass == (test.id in entities)
 
 
 @pytest.mark.usefixtures("mock_bus")
 async def test_filtered_denylist(hass, mock_client):
     """Test a denylist config with a filtering allowlist."""
-    handler_method = await _setup(
+    metrics = await _setup(
         hass,
+        mock_client,
         {
             "include_entities": ["fake.included", "test.excluded_test"],
             "exclude_domains": ["fake"],
@@ -883,9 +977,8 @@ async def test_filtered_denylist(hass, mock_client):
     ]
 
     for test in tests:
-        event = make_event(test.id)
-        handler_method(event)
+        hass.states.async_set(test.id, "not blank")
 
-        was_called = mock_client.labels.call_count == 1
-        assert test.should_pass == was_called
-        mock_client.labels.reset_mock()
+    entities = _collected_entities(metrics)
+    for test in tests:
+        assert test.should_pass == (test.id in entities)
@@ -6,6 +6,7 @@ import json
 from unittest.mock import patch, sentinel
 
 from homeassistant.components.recorder import history
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import process_timestamp
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
@@ -441,3 +442,54 @@ def record_states(hass):
         )
 
     return zero, four, states
+
+
+def test_history_cache(hass_recorder):
+    """Test the recent history cache returns the same states as the database."""
+    hass = hass_recorder({"history_cache_hours": 1})
+    instance = hass.data[DATA_INSTANCE]
+    history_cache = instance.history_cache
+    zero, four, states = record_states(hass)
+    one = zero + timedelta(seconds=1)
+    two = one + timedelta(seconds=1)
+    mp = "media_player.test"
+
+    def query_all():
+        return [
+            history.get_significant_states(hass, zero, four),
+            history.get_significant_states(hass, one, four),
+            history.get_significant_states(hass, two, four, entity_ids=[mp]),
+            history.get_significant_states(
+                hass, zero, four, significant_changes_only=False
+            ),
+            history.get_significant_states(
+                hass, one, four, include_start_time_state=False
+            ),
+            history.get_significant_states(hass, one, minimal_response=True),
+            history.state_changes_during_period(hass, two, four, mp),
+            history.get_last_state_changes(hass, 2, mp),
+        ]
+
+    with patch.object(
+        history, "execute", side_effect=AssertionError("Database queried")
+    ):
+        cached = query_all()
+
+    instance.history_cache = None
+    assert query_all() == cached
+    assert cached[0] == states
+
+    instance.history_cache = history_cache
+    # The state of an entity before its first cached state may be in the database
+    assert (
+        history_cache.states_during_period(zero, four, [mp], lambda *args: True, True)
+        is None
+    )
+
+    # Periods starting before the current run are read from the database
+    before = zero - timedelta(hours=2)
+    assert history.get_significant_states(hass, before, four) == states
+    assert (
+        history_cache.states_during_period(before, four, None, lambda *args: True, True)
+        is None
+    )
@@ -44,6 +44,7 @@ from homeassistant.const import (
     STATE_UNLOCKED,
 )
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.setup import async_setup_component, setup_component
 from homeassistant.util import dt as dt_util
 
@@ -73,7 +74,9 @@ def _default_recorder(hass):
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
-        entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
+        entity_filter=convert_include_exclude_filter(
+            CONFIG_SCHEMA({DOMAIN: {}})[DOMAIN]
+        ),
         exclude_t=[],
     )
 
@@ -175,6 +178,28 @@ async def test_saving_many_states(
         assert db_states[0].event_id > 0
 
 
+async def test_saving_states_set_many(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a burst of states is recorded from a single queue item."""
+    instance = await async_setup_recorder_instance(hass)
+
+    with patch.object(recorder, "EventsTask", wraps=recorder.EventsTask) as task:
+        hass.states.async_set_many(
+            [(f"test.recorder_{idx}", "on", {"idx": idx}) for idx in range(5)]
+        )
+        await hass.async_block_till_done()
+
+    assert task.call_count == 1
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States))
+        assert sorted(db_state.entity_id for db_state in db_states) == [
+            f"test.recorder_{idx}" for idx in range(5)
+        ]
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
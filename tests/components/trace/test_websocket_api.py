@@ -35,7 +35,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_config=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -50,14 +50,15 @@ async def _setup_automation_or_script(
             configs = {**configs, **script_config}
 
     if stored_traces is not None:
+        trace_config = {**(trace_config or {}), "stored_traces": stored_traces}
+
+    if trace_config is not None:
         if domain == "script":
             for config in configs.values():
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
         else:
             for config in configs:
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
 
     assert await async_setup_component(hass, domain, {domain: configs})
 
@@ -752,6 +753,97 @@ async def test_trace_no_traces(hass, hass_ws_client, domain):
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_level_summary(hass, hass_ws_client, domain):
+    """Test changed variables are not recorded with trace level summary."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"variables": {"answer": 42}}, {"event": "some_event"}],
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"level": "summary"}
+    )
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    run_id = _find_run_id(response["result"], domain, "sun")
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    steps = [step for steps in response["result"]["trace"].values() for step in steps]
+    assert len(steps) >= 2
+    assert all("changed_variables" not in step for step in steps)
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_level_sampled(hass, hass_ws_client, domain):
+    """Test only one of sample_rate runs is stored with trace level sampled."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass,
+        domain,
+        [sun_config],
+        trace_config={"level": "sampled", "sample_rate": 3},
+    )
+    client = await hass_ws_client()
+
+    for _ in range(5):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 2
+
+
+async def test_trace_level_errors(hass, hass_ws_client):
+    """Test only failed runs are stored with trace level errors."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "{{ trigger.event.data.service }}"},
+    }
+    await _setup_automation_or_script(
+        hass, "automation", [sun_config], trace_config={"level": "errors"}
+    )
+    hass.services.async_register("test", "automation", lambda _: None)
+    client = await hass_ws_client()
+
+    hass.bus.async_fire("test_event", {"service": "test.automation"})
+    await hass.async_block_till_done()
+    hass.bus.async_fire("test_event", {"service": "test.missing"})
+    await hass.async_block_till_done()
+    hass.bus.async_fire("test_event", {"service": "test.automation"})
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], "automation", "sun")
+    assert len(traces) == 1
+    assert traces[0]["state"] == "stopped"
+    assert "test.missing" in traces[0]["error"]
+
+
 @pytest.mark.parametrize(
     "domain, prefix, trigger, last_step, script_execution",
     [
@@ -13,11 +13,15 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import URL
+from homeassistant.components.websocket_api.subscription import (
+    DATA_SHARED_SUBSCRIPTIONS,
+)
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_template_result
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 
@@ -919,6 +923,82 @@ async def test_render_template_returns_with_match_all(hass, websocket_client):
     assert msg["success"]
 
 
+async def test_render_template_shared(hass, websocket_client, hass_ws_client):
+    """Test identical template subscriptions share one tracker."""
+    hass.states.async_set("light.test", "on")
+    other_client = await hass_ws_client(hass)
+    template_msg = {
+        "type": "render_template",
+        "template": "State is: {{ states('light.test') }}",
+    }
+
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_track_template_result",
+        wraps=async_track_template_result,
+    ) as mock_track:
+        await websocket_client.send_json({"id": 5, **template_msg})
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["result"] == "State is: on"
+
+        # The second subscription gets the last result right away
+        await other_client.send_json({"id": 8, **template_msg})
+        msg = await other_client.receive_json()
+        assert msg["id"] == 8
+        assert msg["success"]
+        msg = await other_client.receive_json()
+        assert msg["id"] == 8
+        assert msg["event"]["result"] == "State is: on"
+
+    assert len(mock_track.mock_calls) == 1
+
+    hass.states.async_set("light.test", "off")
+    for client, iden in ((websocket_client, 5), (other_client, 8)):
+        msg = await client.receive_json()
+        assert msg["id"] == iden
+        assert msg["event"]["result"] == "State is: off"
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    # The other subscriber is still subscribed
+    hass.states.async_set("light.test", "on")
+    msg = await other_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"]["result"] == "State is: on"
+
+    await other_client.send_json(
+        {"id": 9, "type": "unsubscribe_events", "subscription": 8}
+    )
+    msg = await other_client.receive_json()
+    assert msg["success"]
+    assert not hass.data[DATA_SHARED_SUBSCRIPTIONS]
+
+
+async def test_render_template_not_shared_with_other_variables(hass, websocket_client):
+    """Test template subscriptions with other variables are not shared."""
+    for iden, variables in ((5, {"name": "one"}), (6, {"name": "two"})):
+        await websocket_client.send_json(
+            {
+                "id": iden,
+                "type": "render_template",
+                "template": "Name is: {{ name }}",
+                "variables": variables,
+            }
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == iden
+        assert msg["event"]["result"] == f"Name is: {variables['name']}"
+
+    assert len(hass.data[DATA_SHARED_SUBSCRIPTIONS]) == 2
+
+
 async def test_manifest_list(hass, websocket_client):
     """Test loading manifests."""
     http = await async_get_integration(hass, "http")
@@ -1135,6 +1215,47 @@ async def test_subscribe_trigger(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_trigger_shared(hass, websocket_client, hass_ws_client):
+    """Test identical trigger subscriptions share one listener."""
+    other_client = await hass_ws_client(hass)
+    init_count = sum(hass.bus.async_listeners().values())
+    trigger_msg = {
+        "type": "subscribe_trigger",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+    }
+
+    for client, iden in ((websocket_client, 5), (other_client, 8)):
+        await client.send_json({"id": iden, **trigger_msg})
+        msg = await client.receive_json()
+        assert msg["id"] == iden
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.bus.async_fire("test_event")
+    for client, iden in ((websocket_client, 5), (other_client, 8)):
+        async with timeout(3):
+            msg = await client.receive_json()
+        assert msg["id"] == iden
+        assert msg["event"]["variables"]["trigger"]["event"]["event_type"] == (
+            "test_event"
+        )
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    await other_client.send_json(
+        {"id": 9, "type": "unsubscribe_events", "subscription": 8}
+    )
+    msg = await other_client.receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
 async def test_test_condition(hass, websocket_client):
     """Test testing a condition."""
     hass.states.async_set("hello.world", "paulus")
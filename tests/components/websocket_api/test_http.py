@@ -92,3 +92,60 @@ async def test_prepare_fail(hass, hass_ws_client, caplog):
         await hass_ws_client(hass)
 
     assert "Timeout preparing request" in caplog.text
+
+
+async def test_coalesce_messages(hass, websocket_client):
+    """Test queued messages are coalesced when the client supports it."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {"id": 2, "type": "subscribe_events", "event_type": "state_changed"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for state in ("on", "off", "on"):
+        hass.states.async_set("light.kitchen", state)
+
+    msg = await websocket_client.receive_json()
+    assert [event["event"]["data"]["new_state"]["state"] for event in msg] == [
+        "on",
+        "off",
+        "on",
+    ]
+
+    await websocket_client.send_json({"id": 3, "type": "connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    (stats,) = msg["result"]
+    # Including the auth messages
+    assert stats["messages"] == 7
+    assert stats["frames"] == 5
+    assert stats["coalescing_ratio"] == 1.4
+    assert stats["queue_high_water"] == 3
+    assert stats["bytes_sent"] > 0
+
+
+async def test_no_coalescing_by_default(hass, websocket_client):
+    """Test messages are sent one by one unless the client supports coalescing."""
+    await websocket_client.send_json(
+        {"id": 1, "type": "subscribe_events", "event_type": "state_changed"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["data"]["new_state"]["state"] == "on"
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["data"]["new_state"]["state"] == "off"
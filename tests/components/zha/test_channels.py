@@ -456,7 +456,7 @@ async def test_ep_channels_configure(channel):
         ep_channels.claimed_channels, claimed, clear=True
     ), mock.patch.dict(ep_channels.client_channels, client_chans, clear=True):
         await ep_channels.async_configure()
-        await ep_channels.async_initialize(mock.sentinel.from_cache)
+        assert not await ep_channels.async_initialize(mock.sentinel.from_cache)
 
     for ch in [*claimed.values(), *client_chans.values()]:
         assert ch.async_initialize.call_count == 1
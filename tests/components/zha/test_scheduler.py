@@ -0,0 +1,87 @@
+"""Test the ZHA device refresh scheduler."""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.zha.core.scheduler import (
+    INITIAL_CONCURRENCY,
+    MIN_CONCURRENCY,
+    DeviceRefreshScheduler,
+)
+
+
+def _mock_device(ieee, refreshed, release, success=True):
+    """Return a mock device recording its refresh."""
+    device = MagicMock(ieee=ieee)
+
+    async def _initialize(from_cache):
+        assert from_cache is False
+        refreshed.append(ieee)
+        await release.wait()
+        return success
+
+    device.async_initialize = _initialize
+    return device
+
+
+async def test_refresh_priority(hass):
+    """Test devices are refreshed in order and interactive devices first."""
+    refreshed = []
+    release = asyncio.Event()
+    devices = [_mock_device(ieee, refreshed, release) for ieee in range(6)]
+    scheduler = DeviceRefreshScheduler(hass)
+
+    scheduler.async_schedule(devices)
+    await asyncio.sleep(0)
+    assert refreshed == list(range(INITIAL_CONCURRENCY))
+    assert scheduler.pending == len(devices) - INITIAL_CONCURRENCY
+
+    scheduler.async_prioritize(devices[5])
+    # Devices which are being refreshed are not refreshed again
+    scheduler.async_prioritize(devices[0])
+    release.set()
+    await hass.async_block_till_done()
+
+    assert refreshed == [0, 1, 5, 2, 3, 4]
+    assert scheduler.pending == 0
+
+
+async def test_refresh_adaptive_concurrency(hass):
+    """Test concurrency grows on success and is lowered on failures."""
+    refreshed = []
+    release = asyncio.Event()
+    release.set()
+    scheduler = DeviceRefreshScheduler(hass)
+
+    with patch(
+        "homeassistant.components.zha.core.scheduler.time.monotonic", return_value=0
+    ):
+        scheduler.async_schedule(
+            _mock_device(ieee, refreshed, release) for ieee in range(10)
+        )
+        await hass.async_block_till_done()
+    assert len(refreshed) == 10
+    assert scheduler.concurrency > INITIAL_CONCURRENCY
+
+    scheduler.async_schedule(
+        _mock_device(ieee, refreshed, release, success=False) for ieee in range(10, 20)
+    )
+    await hass.async_block_till_done()
+    assert len(refreshed) == 20
+    assert scheduler.concurrency == MIN_CONCURRENCY
+
+
+async def test_refresh_cancel(hass):
+    """Test pending and running refreshes are cancelled."""
+    refreshed = []
+    release = asyncio.Event()
+    scheduler = DeviceRefreshScheduler(hass)
+
+    scheduler.async_schedule(
+        _mock_device(ieee, refreshed, release) for ieee in range(5)
+    )
+    await asyncio.sleep(0)
+    scheduler.async_cancel()
+    await hass.async_block_till_done()
+
+    assert refreshed == list(range(INITIAL_CONCURRENCY))
+    assert scheduler.pending == 0
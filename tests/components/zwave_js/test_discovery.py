@@ -1,15 +1,23 @@
 """Test discovery of entities for device-specific schemas for the Z-Wave JS integration."""
+import json
+
 import pytest
+from zwave_js_server.model.node import Node
 
 from homeassistant.components.zwave_js.discovery import (
+    DISCOVERY_SCHEMA_INDEX,
+    DISCOVERY_SCHEMAS,
     FirmwareVersionRange,
     ZWaveDiscoverySchema,
     ZWaveValueDiscoverySchema,
+    check_value,
 )
 from homeassistant.components.zwave_js.discovery_data_template import (
     DynamicCurrentTempClimateDataTemplate,
 )
 
+from tests.common import get_fixture_path
+
 
 async def test_iblinds_v2(hass, client, iblinds_v2, integration):
     """Test that an iBlinds v2.0 multilevel switch value is discovered as a cover."""
@@ -93,3 +101,26 @@ async def test_dynamic_climate_data_discovery_template_failure(hass, multisensor
         DynamicCurrentTempClimateDataTemplate().resolve_data(
             node.values[f"{node.node_id}-49-0-Ultraviolet"]
         )
+
+
+async def test_discovery_schema_index(client):
+    """Test the schema index only skips schemas that cannot match."""
+    for path in get_fixture_path("", "zwave_js").glob("*_state.json"):
+        if "values" not in (state := json.loads(path.read_text())):
+            continue
+        node = Node(client, state)
+        for value in node.values.values():
+            candidates = DISCOVERY_SCHEMA_INDEX.async_candidates(value)
+            assert candidates == [
+                schema for schema in DISCOVERY_SCHEMAS if schema in candidates
+            ]
+            for schema in DISCOVERY_SCHEMAS:
+                if schema in candidates:
+                    continue
+                assert not check_value(value, schema.primary_value) or (
+                    node.manufacturer_id not in schema.manufacturer_id
+                    or (
+                        schema.product_id is not None
+                        and node.product_id not in schema.product_id
+                    )
+                ), (path.name, value.value_id, schema)
@@ -94,6 +94,29 @@ async def test_track_point_in_time(hass):
     assert len(runs) == 2
 
 
+async def test_track_point_in_time_cancel_in_same_tick(hass):
+    """Test a timer cancelled by a timer due in the same tick does not run."""
+    point_in_time = dt_util.utcnow() + timedelta(seconds=10)
+    runs = []
+    unsubs = []
+
+    @callback
+    def cancel_other(now):
+        runs.append("first")
+        unsubs[1]()
+
+    unsubs.append(async_track_point_in_utc_time(hass, cancel_other, point_in_time))
+    unsubs.append(
+        async_track_point_in_utc_time(
+            hass, callback(lambda x: runs.append("second")), point_in_time
+        )
+    )
+
+    async_fire_time_changed(hass, point_in_time + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+
+
 async def test_track_point_in_time_drift_rearm(hass):
     """Test tasks with the time rolling backwards."""
     specific_runs = []
@@ -126,6 +149,37 @@ async def test_track_point_in_time_drift_rearm(hass):
     assert len(specific_runs) == 1
 
 
+async def test_track_point_in_utc_time_shares_loop_timer(hass):
+    """Test timers share a single event loop timer and can be cancelled."""
+    runs = []
+    now = dt_util.utcnow()
+    point_in_time = datetime(now.year + 1, 5, 24, 21, 59, 55, tzinfo=dt_util.UTC)
+
+    with patch.object(
+        hass.loop, "call_later", wraps=hass.loop.call_later
+    ) as mock_call_later:
+        for idx in range(10):
+            unsub = async_track_point_in_utc_time(
+                hass, callback(lambda x, idx=idx: runs.append(idx)), point_in_time
+            )
+        unsub()
+        unsub_later = async_track_point_in_utc_time(
+            hass,
+            callback(lambda x: runs.append("later")),
+            point_in_time + timedelta(seconds=1),
+        )
+        assert mock_call_later.call_count == 1
+
+    async_fire_time_changed(hass, point_in_time + timedelta(seconds=0.5))
+    await hass.async_block_till_done()
+    assert runs == list(range(9))
+
+    unsub_later()
+    async_fire_time_changed(hass, point_in_time + timedelta(seconds=1.5))
+    await hass.async_block_till_done()
+    assert runs == list(range(9))
+
+
 async def test_track_state_change_from_to_state_match(hass):
     """Test track_state_change with from and to state matchers."""
     from_and_to_state_runs = []
@@ -1987,6 +2041,53 @@ async def test_track_template_result_and_conditional(hass):
     assert specific_runs[2] == "on"
 
 
+async def test_track_template_result_partial_state(hass):
+    """Test tracking a template only re-renders when the read parts change."""
+    specific_runs = []
+    hass.states.async_set("media_player.a", "on", {"volume": 0.5, "position": 1})
+    template = Template(
+        '{{ states("media_player.a") }} {{ state_attr("media_player.a", "volume") }}',
+        hass,
+    )
+
+    orig_render_to_info = Template.async_render_to_info
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=orig_render_to_info,
+    ) as mock_render:
+
+        def specific_run_callback(event, updates):
+            specific_runs.append(updates.pop().result)
+
+        async_track_template_result(
+            hass, [TrackTemplate(template, None)], specific_run_callback
+        )
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 1
+
+        hass.states.async_set("media_player.a", "on", {"volume": 0.5, "position": 2})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 1
+        assert specific_runs == []
+
+        hass.states.async_set("media_player.a", "on", {"volume": 0.7, "position": 2})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 2
+        assert specific_runs == ["on 0.7"]
+
+        hass.states.async_set("media_player.a", "off", {"volume": 0.7, "position": 2})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 3
+        assert specific_runs == ["on 0.7", "off 0.7"]
+
+        hass.states.async_remove("media_player.a")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 4
+        assert specific_runs == ["on 0.7", "off 0.7", "unknown None"]
+
+
 async def test_track_template_result_iterator(hass):
     """Test tracking template."""
     iterator_runs = []
@@ -8,6 +8,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
+    STORAGE_JOURNAL_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -73,6 +74,9 @@ async def test_periodic_write(hass):
 
     assert mock_write_data.called
 
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b1", "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -81,6 +85,8 @@ async def test_periodic_write(hass):
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -137,6 +143,9 @@ async def test_save_persistent_states(hass):
 
     assert mock_write_data.called
 
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b1", "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -145,6 +154,8 @@ async def test_save_persistent_states(hass):
     # Verify still saving
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -376,3 +387,112 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_dump_changed_states(hass, hass_storage):
+    """Test that only changed states are written to the journal."""
+    for entity_id in ("input_boolean.b0", "input_boolean.b1", "input_boolean.b2"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity_id, "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await data.async_dump_states()
+
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 3
+    assert hass_storage[STORAGE_JOURNAL_KEY]["data"]["states"] == {}
+
+    # Nothing changed, nothing is written
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_changed_states()
+    assert not mock_write_data.called
+
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_changed_states()
+
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 3
+    journal = hass_storage[STORAGE_JOURNAL_KEY]["data"]["states"]
+    assert list(journal) == ["input_boolean.b1"]
+    assert journal["input_boolean.b1"]["state"]["state"] == "off"
+
+    # Removing an entity keeps its last state in the journal
+    data.async_restore_entity_removed("input_boolean.b2")
+    hass.states.async_remove("input_boolean.b2")
+    hass.states.async_set("input_boolean.b0", "off")
+    await data.async_dump_changed_states()
+
+    # The journal now holds most states, so everything is rewritten instead
+    states = {
+        item["state"]["entity_id"]: item["state"]["state"]
+        for item in hass_storage[STORAGE_KEY]["data"]
+    }
+    assert states == {
+        "input_boolean.b0": "off",
+        "input_boolean.b1": "off",
+        "input_boolean.b2": "on",
+    }
+    assert hass_storage[STORAGE_JOURNAL_KEY]["data"]["states"] == {}
+
+
+async def test_load_journal(hass, hass_storage):
+    """Test the journal is applied on top of the stored states."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            StoredState(State("input_boolean.b0", "on"), now).as_dict(),
+            StoredState(State("input_boolean.b1", "on"), now).as_dict(),
+            StoredState(State("input_boolean.b2", "on"), now).as_dict(),
+        ],
+    }
+    hass_storage[STORAGE_JOURNAL_KEY] = {
+        "version": 1,
+        "key": STORAGE_JOURNAL_KEY,
+        "data": {
+            "base": now.isoformat(),
+            "states": {
+                "input_boolean.b1": StoredState(
+                    State("input_boolean.b1", "off"), now
+                ).as_dict(),
+                "input_boolean.b2": None,
+            },
+        },
+    }
+    # Round trip through JSON
+    hass_storage[STORAGE_JOURNAL_KEY]["data"]["states"]["input_boolean.b1"][
+        "last_seen"
+    ] = now.isoformat()
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    assert {
+        entity_id: stored_state.state.state
+        for entity_id, stored_state in data.last_states.items()
+    } == {"input_boolean.b0": "on", "input_boolean.b1": "off"}
+
+
+async def test_load_stale_journal(hass, hass_storage):
+    """Test a journal written for older stored states is ignored."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [StoredState(State("input_boolean.b0", "on"), now).as_dict()],
+    }
+    hass_storage[STORAGE_JOURNAL_KEY] = {
+        "version": 1,
+        "key": STORAGE_JOURNAL_KEY,
+        "data": {
+            "base": (now - timedelta(minutes=15)).isoformat(),
+            "states": {"input_boolean.b0": None},
+        },
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    assert data.last_states["input_boolean.b0"].state.state == "on"
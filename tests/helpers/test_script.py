@@ -97,9 +97,9 @@ def assert_element(trace_element, expected_element, path):
         return
 
     if "variables" in expected_element:
-        assert expected_element["variables"] == trace_element._variables
+        assert expected_element["variables"] == trace_element.changed_variables
     else:
-        assert not trace_element._variables
+        assert not trace_element.changed_variables
 
 
 def assert_action_trace(expected, expected_script_execution="finished"):
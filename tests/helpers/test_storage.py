@@ -137,6 +137,84 @@ async def test_saving_on_final_write(hass, hass_storage):
     }
 
 
+async def test_delayed_writes_are_batched(hass, hass_storage):
+    """Test delayed writes which are due together are written in one batch."""
+    stores = [storage.Store(hass, MOCK_VERSION, f"batch-{idx}") for idx in range(3)]
+    stores[0].async_delay_save(lambda: MOCK_DATA, 1)
+    stores[1].async_delay_save(lambda: MOCK_DATA, storage.WRITE_COALESCE_WINDOW)
+    stores[2].async_delay_save(lambda: MOCK_DATA, 20)
+
+    with patch.object(
+        storage._StorageWriter,
+        "_write_batch",
+        autospec=True,
+        side_effect=storage._StorageWriter._write_batch,
+    ) as mock_write_batch, patch.object(storage.os.path, "getsize", return_value=42):
+        async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+        assert mock_write_batch.call_count == 1
+        assert "batch-0" in hass_storage
+        assert "batch-1" in hass_storage
+        assert "batch-2" not in hass_storage
+
+        async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=20))
+        await hass.async_block_till_done()
+
+    assert mock_write_batch.call_count == 2
+    assert "batch-2" in hass_storage
+
+    stats = storage.async_get_write_stats(hass)
+    assert set(stats) == {"batch-0", "batch-1", "batch-2"}
+    assert stats["batch-0"].size == 42
+
+
+async def test_failing_data_func_does_not_block_batch(hass, hass_storage, caplog):
+    """Test a store whose data can't be generated doesn't keep others from writing."""
+
+    def failing_data_func():
+        raise ValueError("Boom")
+
+    stores = [storage.Store(hass, MOCK_VERSION, f"fail-{idx}") for idx in range(3)]
+    stores[0].async_delay_save(lambda: MOCK_DATA, 1)
+    stores[1].async_delay_save(failing_data_func, 1)
+    stores[2].async_delay_save(lambda: MOCK_DATA, 1)
+
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert hass_storage["fail-0"]["data"] == MOCK_DATA
+    assert "fail-1" not in hass_storage
+    assert hass_storage["fail-2"]["data"] == MOCK_DATA
+    assert "Error getting the data of fail-1" in caplog.text
+
+
+async def test_final_write_is_batched(hass, hass_storage):
+    """Test all pending writes are written in one batch on final write."""
+    stores = [storage.Store(hass, MOCK_VERSION, f"final-{idx}") for idx in range(3)]
+    for store in stores:
+        store.async_delay_save(lambda: MOCK_DATA, 10)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    hass.state = CoreState.stopping
+    await hass.async_block_till_done()
+    await stores[0].async_save(MOCK_DATA2)
+    assert "final-0" not in hass_storage
+
+    with patch.object(
+        storage._StorageWriter,
+        "_write_batch",
+        autospec=True,
+        side_effect=storage._StorageWriter._write_batch,
+    ) as mock_write_batch:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    assert mock_write_batch.call_count == 1
+    assert hass_storage["final-0"]["data"] == MOCK_DATA2
+    assert hass_storage["final-2"]["data"] == MOCK_DATA
+
+
 async def test_not_delayed_saving_while_stopping(hass, hass_storage):
     """Test delayed saves don't write after the stop event has fired."""
     store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
@@ -1222,6 +1222,34 @@ def test_state_attr(hass):
     assert tpl.async_render() is True
 
 
+def test_render_info_partial_entities(hass):
+    """Test render info records which parts of a state were read."""
+    hass.states.async_set("sensor.a", "on", {"battery": 50, "other": 1})
+    hass.states.async_set("sensor.b", "on", {"battery": 50})
+    hass.states.async_set("sensor.c", "on")
+
+    info = template.Template(
+        '{{ state_attr("sensor.a", "battery") }}'
+        '{{ states("sensor.b") }}{{ states.sensor.b.last_changed }}'
+        "{{ states.sensor.c.state }}{{ states.sensor.c.attributes }}",
+        hass,
+    ).async_render_to_info()
+    assert info.entities == {"sensor.a", "sensor.b", "sensor.c"}
+    assert info.partial_entities == {"sensor.a": {"battery"}, "sensor.b": {None}}
+
+    info = template.Template(
+        '{{ state_attr("sensor.a", "battery") }}{{ states.sensor | list }}',
+        hass,
+    ).async_render_to_info()
+    assert info.partial_entities == {}
+
+    info = template.Template(
+        '{{ state_attr("sensor.missing", "battery") }}', hass
+    ).async_render_to_info()
+    assert info.entities == {"sensor.missing"}
+    assert info.partial_entities == {}
+
+
 def test_states_function(hass):
     """Test using states as a function."""
     hass.states.async_set("test.object", "available")
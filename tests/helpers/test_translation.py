@@ -1,5 +1,6 @@
 """Test the translation helper."""
 import asyncio
+from datetime import timedelta
 from os import path
 import pathlib
 from unittest.mock import Mock, patch
@@ -10,6 +11,9 @@ from homeassistant.generated import config_flows
 from homeassistant.helpers import translation
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture
@@ -367,3 +371,93 @@ async def test_custom_component_translations(hass, enable_custom_integrations):
     hass.config.components.add("test_embedded")
     hass.config.components.add("test_package")
     assert await translation.async_get_translations(hass, "en", "state") == {}
+
+
+async def test_compiled_translations(hass, hass_storage):
+    """Test translations are loaded from the compiled file after a restart."""
+    hass.config.components.add("sensor")
+    hass.config.components.add("light")
+
+    with patch.object(translation, "__version__", "2022.2.0"):
+        nl_translations = await translation.async_get_translations(hass, "nl", "title")
+        await translation.async_get_translations(hass, "../nl", "title")
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=translation.SAVE_DELAY)
+        )
+        await hass.async_block_till_done()
+
+        assert set(hass_storage["core.translations.nl"]["data"]["components"]) == {
+            "sensor",
+            "light",
+        }
+        assert set(hass_storage["core.translations.en"]["data"]["components"]) == {
+            "sensor",
+            "light",
+        }
+        assert not any(".." in key for key in hass_storage)
+
+        hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+        with patch(
+            "homeassistant.helpers.translation.load_translations_files"
+        ) as mock_load:
+            assert (
+                await translation.async_get_translations(hass, "nl", "title")
+                == nl_translations
+            )
+        assert len(mock_load.mock_calls) == 0
+
+    # Compiled strings of another version are not used
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+    with patch.object(translation, "__version__", "2022.3.0"), patch(
+        "homeassistant.helpers.translation.load_translations_files",
+        side_effect=translation.load_translations_files,
+    ) as mock_load:
+        assert (
+            await translation.async_get_translations(hass, "nl", "title")
+            == nl_translations
+        )
+    assert len(mock_load.mock_calls) == 2
+
+
+async def test_custom_translations_not_compiled(
+    hass, hass_storage, enable_custom_integrations
+):
+    """Test translations of custom integrations are not compiled."""
+    hass.config.components.add("switch")
+    hass.config.components.add("switch.test")
+
+    with patch.object(translation, "__version__", "2022.2.0"):
+        translations = await translation.async_get_translations(hass, "en", "state")
+        assert translations["component.switch.state.string1"] == "Value 1"
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=translation.SAVE_DELAY)
+        )
+        await hass.async_block_till_done()
+
+    assert set(hass_storage["core.translations.en"]["data"]["components"]) == {"switch"}
+
+
+async def test_english_strings_are_shared(hass):
+    """Test the English fallback strings are loaded once for all languages."""
+    hass.config.components.add("sensor")
+
+    with patch(
+        "homeassistant.helpers.translation.load_translations_files",
+        side_effect=translation.load_translations_files,
+    ) as mock_load:
+        await asyncio.gather(
+            translation.async_get_translations(hass, "en", "title"),
+            translation.async_get_translations(hass, "de", "title"),
+            translation.async_get_translations(hass, "nl", "title"),
+        )
+
+    loaded = [call[1][0] for call in mock_load.mock_calls]
+    assert len(loaded) == 3
+    assert (
+        sum(
+            "/en.json" in translation_file
+            for files in loaded
+            for translation_file in files.values()
+        )
+        == 1
+    )
@@ -0,0 +1,162 @@
+"""Test the config validation cache."""
+from datetime import timedelta
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+import voluptuous as vol
+
+from homeassistant import config as config_util
+from homeassistant.helpers import validation_cache
+import homeassistant.helpers.config_validation as cv
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed, patch_yaml_files
+
+SCHEMA = vol.Schema({vol.Required("name"): cv.string, vol.Optional("count"): int})
+
+
+def _integration(built_in=True, version=None):
+    """Return a mock integration."""
+    return MagicMock(domain="test", is_built_in=built_in, version=version)
+
+
+async def test_validation_is_cached(hass, hass_storage):
+    """Test validation results are reused and stored."""
+    validator = MagicMock(side_effect=SCHEMA)
+    with patch.object(validation_cache, "__version__", "2022.2.0"):
+        key = validation_cache.schema_key(_integration(), "CONFIG_SCHEMA")
+        cache = await validation_cache.async_get_validation_cache(hass)
+
+        assert cache.async_validate(key, validator, {"name": "a"}) == {"name": "a"}
+        result = cache.async_validate(key, validator, {"name": "a"})
+        assert result == {"name": "a"}
+        assert validator.call_count == 1
+
+        # The cached result is a copy
+        result["name"] = "b"
+        assert cache.async_validate(key, validator, {"name": "a"}) == {"name": "a"}
+
+        assert cache.async_validate(key, validator, {"name": "a", "count": 1}) == {
+            "name": "a",
+            "count": 1,
+        }
+        assert validator.call_count == 2
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=validation_cache.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert len(hass_storage[validation_cache.STORAGE_KEY]["data"]) == 2
+
+    # Results are reused after a restart
+    hass.data.pop(validation_cache.DATA_VALIDATION_CACHE)
+    cache = await validation_cache.async_get_validation_cache(hass)
+    assert cache.async_validate(key, validator, {"name": "a"}) == {"name": "a"}
+    assert validator.call_count == 2
+
+
+async def test_validation_not_cached(hass, caplog):
+    """Test invalid, non-plain and warning results are not cached."""
+    cache = await validation_cache.async_get_validation_cache(hass)
+    key = "test@1.0:CONFIG_SCHEMA"
+
+    validator = MagicMock(side_effect=vol.Invalid("bad"))
+    for _ in range(2):
+        with pytest.raises(vol.Invalid):
+            cache.async_validate(key, validator, {"name": "a"})
+    assert validator.call_count == 2
+
+    validator = MagicMock(return_value={"delay": timedelta(seconds=1)})
+    cache.async_validate(key, validator, {"delay": 1})
+    cache.async_validate(key, validator, {"delay": 1})
+    assert validator.call_count == 2
+
+    def _deprecated(config):
+        logging.getLogger("test").warning("The option is deprecated")
+        return config
+
+    validator = MagicMock(side_effect=_deprecated)
+    cache.async_validate(key, validator, {"old": True})
+    cache.async_validate(key, validator, {"old": True})
+    assert validator.call_count == 2
+    assert caplog.text.count("The option is deprecated") == 2
+
+    validator = MagicMock(side_effect=SCHEMA)
+    cache.async_validate(None, validator, {"name": "a"})
+    cache.async_validate(None, validator, {"name": "a"})
+    assert validator.call_count == 2
+
+
+async def test_environment_validation_not_cached(hass, tmp_path):
+    """Test validation depending on the file system is not cached."""
+    cache = await validation_cache.async_get_validation_cache(hass)
+    key = "test@1.0:CONFIG_SCHEMA"
+    config_file = tmp_path / "test.conf"
+    config_file.write_text("")
+
+    validator = MagicMock(side_effect=vol.Schema({"file": cv.isfile}))
+    config = {"file": str(config_file)}
+    assert cache.async_validate(key, validator, config) == config
+    config_file.unlink()
+    with pytest.raises(vol.Invalid):
+        cache.async_validate(key, validator, config)
+    assert validator.call_count == 2
+
+    # Other validation is still cached
+    validator = MagicMock(side_effect=SCHEMA)
+    cache.async_validate(key, validator, {"name": "a"})
+    cache.async_validate(key, validator, {"name": "a"})
+    assert validator.call_count == 1
+
+
+async def test_config_with_secrets_not_cached(hass, hass_storage):
+    """Test config containing secrets is not cached."""
+    files = {
+        hass.config.path(config_util.YAML_CONFIG_FILE): (
+            "test:\n  name: !secret name\n  count: 1\n"
+        ),
+        hass.config.path("secrets.yaml"): "name: secret_name\n",
+    }
+    with patch_yaml_files(files):
+        config = await config_util.async_hass_config_yaml(hass)
+    cache = await validation_cache.async_get_validation_cache(hass)
+    key = "test@1.0:CONFIG_SCHEMA"
+
+    validator = MagicMock(side_effect=SCHEMA)
+    assert cache.async_validate(key, validator, config["test"]) == {
+        "name": "secret_name",
+        "count": 1,
+    }
+    cache.async_validate(key, validator, config["test"])
+    assert validator.call_count == 2
+
+    cache.async_validate(key, validator, {"name": "other_name"})
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=validation_cache.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[validation_cache.STORAGE_KEY]["data"]
+    assert len(stored) == 1
+    assert "secret_name" not in str(stored)
+
+
+def test_schema_key():
+    """Test the schema key depends on the integration version."""
+    with patch.object(validation_cache, "__version__", "2022.2.0"):
+        assert (
+            validation_cache.schema_key(_integration(), "CONFIG_SCHEMA")
+            == "test@2022.2.0:CONFIG_SCHEMA"
+        )
+    with patch.object(validation_cache, "__version__", "2022.2.0.dev0"):
+        assert validation_cache.schema_key(_integration(), "CONFIG_SCHEMA") is None
+        assert (
+            validation_cache.schema_key(
+                _integration(built_in=False, version="1.0"), "PLATFORM_SCHEMA"
+            )
+            == "test@1.0:PLATFORM_SCHEMA"
+        )
+    assert (
+        validation_cache.schema_key(_integration(built_in=False), "CONFIG_SCHEMA")
+        is None
+    )
@@ -431,6 +431,59 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_event_data_filtered_listener(hass):
+    """Test we can prefilter events on a key of the event data."""
+    calls = []
+    other_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock other listener."""
+        other_calls.append(event)
+
+    unsub = hass.bus.async_listen(
+        "test",
+        listener,
+        event_filter=ha.EventDataFilter("device", ("a", "b")),
+    )
+    unsub_other = hass.bus.async_listen(
+        "test",
+        other_listener,
+        event_filter=ha.EventDataFilter("device", ("c",)),
+    )
+    assert hass.bus.async_listeners()["test"] == 2
+
+    hass.bus.async_fire("test", {"device": "a"})
+    hass.bus.async_fire("test", {"device": "b"})
+    hass.bus.async_fire("test", {"device": "c"})
+    hass.bus.async_fire("test", {"device": ["a"]})
+    hass.bus.async_fire("test", {"other": "a"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.data["device"] for event in calls] == ["a", "b"]
+    assert [event.data["device"] for event in other_calls] == ["c"]
+
+    unsub()
+    assert hass.bus.async_listeners()["test"] == 1
+    unsub_other()
+    assert "test" not in hass.bus.async_listeners()
+
+    hass.bus.async_fire("test", {"device": "a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    with pytest.raises(ha.HomeAssistantError):
+        hass.bus.async_listen(
+            MATCH_ALL, listener, event_filter=ha.EventDataFilter("device", ("a",))
+        )
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -728,6 +781,118 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass):
+    """Test setting many states at once."""
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batches = []
+    seen_states = []
+
+    @ha.callback
+    def batch_listener(batch):
+        batches.append(batch)
+
+    @ha.callback
+    def listener(event):
+        seen_states.append(hass.states.get("light.porch"))
+
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, batch_listener)
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", None),
+            ("light.kitchen", "off", {"brightness": 20}),
+            ("light.porch", "on", {}),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.kitchen",
+        "light.porch",
+    ]
+    assert len(batches) == 1
+    assert batches[0] == events
+    assert events[0].context is events[1].context
+    assert events[0].time_fired == events[1].time_fired
+    assert events[1].data["new_state"].last_updated == events[0].time_fired
+    # Every state is written before any listener runs
+    assert seen_states == [hass.states.get("light.porch")] * 2
+
+    hass.states.async_set_many([("light.bowl", "on", None)])
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert batches[1] == [events[2]]
+
+
+async def test_statemachine_set_many_invalid(hass):
+    """Test an invalid state leaves the state machine unchanged."""
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    version = hass.states.version
+
+    with pytest.raises(ha.InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [
+                ("light.bowl", "off", None),
+                ("light.porch", "on", None),
+                ("invalid_entity_id", "on", None),
+            ]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("light.porch") is None
+    assert hass.states.version == version
+    assert events == []
+
+
+async def test_statemachine_set_many_same_entity(hass):
+    """Test setting the same entity twice in one call."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [("light.bowl", "on", None), ("light.bowl", "off", None)]
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "off"
+    assert [event.data["new_state"].state for event in events] == ["on", "off"]
+    assert events[1].data["old_state"] is events[0].data["new_state"]
+
+
+async def test_listen_batch_remove(hass):
+    """Test removing a batch listener."""
+    batches = []
+
+    @ha.callback
+    def batch_listener(batch):
+        batches.append(batch)
+
+    with pytest.raises(ha.HomeAssistantError):
+        hass.bus.async_listen_batch(MATCH_ALL, batch_listener)
+
+    listeners_before = hass.bus.async_listeners().get("test_event", 0)
+    remove = hass.bus.async_listen_batch("test_event", batch_listener)
+    assert hass.bus.async_listeners()["test_event"] == listeners_before + 1
+
+    assert hass.bus.async_fire_many("test_event", []) == []
+    hass.bus.async_fire_many("test_event", [{"a": 1}, {"a": 2}])
+    await hass.async_block_till_done()
+    assert [[event.data["a"] for event in batch] for batch in batches] == [[1, 2]]
+
+    remove()
+    assert hass.bus.async_listeners().get("test_event", 0) == listeners_before
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1585,6 +1750,57 @@ async def test_reserving_states(hass):
     assert hass.states.async_available("light.bedroom") is True
 
 
+async def test_state_machine_changed_since(hass):
+    """Test the state machine tracks the changes since a version."""
+    start = hass.states.version
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("light.kitchen", "on")
+    version = hass.states.version
+    assert version == start + 2
+
+    # Unchanged states don't change the version
+    hass.states.async_set("light.kitchen", "on")
+    assert hass.states.version == version
+
+    hass.states.async_set("light.bedroom", "off")
+    hass.states.async_remove("light.kitchen")
+    hass.states.async_set("light.hallway", "on")
+
+    changed, removed = hass.states.async_changed_since(version)
+    assert [state.entity_id for state in changed] == ["light.hallway", "light.bedroom"]
+    assert removed == ["light.kitchen"]
+
+    changed, removed = hass.states.async_changed_since(start)
+    assert {state.entity_id for state in changed} == {"light.bedroom", "light.hallway"}
+    assert removed == ["light.kitchen"]
+
+    assert hass.states.async_changed_since(hass.states.version) == ([], [])
+    assert hass.states.async_changed_since(start - 1) is None
+    assert hass.states.async_changed_since(hass.states.version + 1) is None
+
+    # Re-adding a removed entity is a change
+    version = hass.states.version
+    hass.states.async_set("light.kitchen", "off")
+    assert hass.states.async_changed_since(version) == (
+        [hass.states.get("light.kitchen")],
+        [],
+    )
+
+
+async def test_state_machine_forgets_old_removals(hass):
+    """Test changes are unknown before the oldest remembered removal."""
+    version = hass.states.version
+    with patch.object(ha, "MAX_REMOVED_STATES", 2):
+        for idx in range(3):
+            hass.states.async_set(f"light.bulb_{idx}", "on")
+            hass.states.async_remove(f"light.bulb_{idx}")
+
+    assert hass.states.async_changed_since(version) is None
+    changed, removed = hass.states.async_changed_since(hass.states.version - 3)
+    assert changed == []
+    assert removed == ["light.bulb_2", "light.bulb_1"]
+
+
 async def test_state_change_events_match_state_time(hass):
     """Test last_updated and timed_fired only call utcnow once."""
 
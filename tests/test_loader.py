@@ -1,13 +1,16 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import json
 from unittest.mock import patch
 
 import pytest
 
-from homeassistant import core, loader
+from homeassistant import components, core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.util import dt as dt_util
 
-from tests.common import MockModule, mock_integration
+from tests.common import MockModule, async_fire_time_changed, mock_integration
 
 
 async def test_component_dependencies(hass):
@@ -428,6 +431,78 @@ async def test_get_custom_components(hass, enable_custom_integrations):
         mock_get.assert_called_once_with(hass)
 
 
+async def _async_save_manifest_index(hass, hass_storage):
+    """Save the manifest index and return the stored data."""
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+    return hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+
+
+async def test_manifest_index_custom(hass, hass_storage, enable_custom_integrations):
+    """Test custom manifests are indexed until they are modified."""
+    await loader.async_get_integration(hass, "test_package")
+    data = await _async_save_manifest_index(hass, hass_storage)
+
+    (manifest_path,) = [
+        path for path in data["custom"] if path.endswith("test_package/manifest.json")
+    ]
+    import custom_components
+
+    index = loader.ManifestIndex(None, data)
+    with patch("homeassistant.loader.json.loads") as mock_loads:
+        integration = loader.Integration.resolve_from_root(
+            hass, custom_components, "test_package", index
+        )
+    assert not mock_loads.called
+    assert integration.name == "Test Package"
+    assert not index.changed
+
+    data["custom"][manifest_path]["mtime"] = 0
+    index = loader.ManifestIndex(None, data)
+    with patch("homeassistant.loader.json.loads", wraps=json.loads) as mock_loads:
+        integration = loader.Integration.resolve_from_root(
+            hass, custom_components, "test_package", index
+        )
+    assert mock_loads.called
+    assert integration.name == "Test Package"
+    assert index.changed
+
+
+async def test_manifest_index_builtin(hass, hass_storage):
+    """Test built-in manifests are indexed per version."""
+    with patch("homeassistant.loader._builtin_index_key", return_value=["2022.2.0", 1]):
+        await loader.async_get_integration(hass, "hue")
+    data = await _async_save_manifest_index(hass, hass_storage)
+    assert data["builtin_key"] == ["2022.2.0", 1]
+    assert data["builtin"]["hue"]["name"] == "Philips Hue"
+
+    index = loader.ManifestIndex(["2022.2.0", 1], data)
+    with patch("homeassistant.loader.json.loads") as mock_loads:
+        integration = loader.Integration.resolve_from_root(
+            hass, components, "hue", index
+        )
+    assert not mock_loads.called
+    assert integration.name == "Philips Hue"
+
+    index = loader.ManifestIndex(["2022.3.0", 1], data)
+    with patch("homeassistant.loader.json.loads", wraps=json.loads) as mock_loads:
+        loader.Integration.resolve_from_root(hass, components, "hue", index)
+    assert mock_loads.called
+
+
+async def test_manifest_index_dev_version(hass, hass_storage):
+    """Test built-in manifests of development versions are not indexed."""
+    with patch("homeassistant.loader.__version__", "2022.2.0.dev0"):
+        assert loader._builtin_index_key(components.__path__) is None
+
+    index = loader.ManifestIndex(None, None)
+    loader.Integration.resolve_from_root(hass, components, "hue", index)
+    assert not index.changed
+
+
 async def test_get_config_flows(hass):
     """Verify that custom components with config_flow are available."""
     test_1_integration = _get_test_integration(hass, "test_1", False)
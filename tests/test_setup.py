@@ -691,3 +691,41 @@ async def test_async_start_setup_platforms(hass):
     assert "august" not in hass.data[setup.DATA_SETUP_STARTED]
     assert isinstance(hass.data[setup.DATA_SETUP_TIME]["august"], datetime.timedelta)
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
+
+
+async def test_setup_timeline(hass):
+    """Test the setup timeline records the phases of setting up integrations."""
+    setup.async_enable_setup_timeline(hass)
+    mock_integration(hass, MockModule("dep"))
+    mock_integration(
+        hass, MockModule("comp", partial_manifest={"dependencies": ["dep"]})
+    )
+
+    assert await setup.async_setup_component(hass, "comp", {})
+    with setup.async_start_setup(hass, ["sensor.comp"]):
+        pass
+
+    phases = [(domain, phase) for domain, phase, *_ in hass.data["setup_timeline"]]
+    assert phases.index(("comp", "dependencies")) < phases.index(("comp", "setup"))
+    assert ("dep", "setup") in phases
+    assert ("comp", "import") in phases
+    assert ("comp", "config") in phases
+    assert ("comp", "config_entries") in phases
+    assert ("comp", "platform") in phases
+
+    trace = setup.async_setup_timeline_trace(hass)
+    events = trace["traceEvents"]
+    threads = {
+        event["args"]["name"]: event["tid"] for event in events if event["ph"] == "M"
+    }
+    assert set(threads) == {"comp", "dep"}
+    dependencies = next(
+        event
+        for event in events
+        if event["ph"] == "X" and event["name"] == "dependencies"
+    )
+    assert dependencies["tid"] == threads["comp"]
+    assert dependencies["args"] == {"waiting_on": ["dep"]}
+    assert all(
+        event["ts"] >= 0 and event["dur"] >= 0 for event in events if event["ph"] == "X"
+    )